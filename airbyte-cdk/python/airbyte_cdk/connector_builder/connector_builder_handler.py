@@ -4,10 +4,11 @@
 
 import dataclasses
 from datetime import datetime
-from typing import Any, Dict, List, Mapping
+from typing import Any, Dict, Iterator, List, Mapping
 from urllib.parse import urljoin
 
 from airbyte_cdk.connector_builder.message_grouper import MessageGrouper
+from airbyte_cdk.connector_builder.models import LogMessage, StreamRead, StreamReadPages, StreamReadSlices
 from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, ConfiguredAirbyteCatalog
 from airbyte_cdk.models import Type
 from airbyte_cdk.models import Type as MessageType
@@ -25,6 +26,10 @@ DEFAULT_MAXIMUM_RECORDS = 100
 MAX_PAGES_PER_SLICE_KEY = "max_pages_per_slice"
 MAX_SLICES_KEY = "max_slices"
 MAX_RECORDS_KEY = "max_records"
+STREAM_MESSAGE_GROUPS_KEY = "stream_message_groups"
+
+# Value of the message_group_type field of the records emitted by read_stream_message_groups
+_MESSAGE_GROUP_TYPES = {StreamReadPages: "page", StreamReadSlices: "slice", LogMessage: "log", StreamRead: "stream_read"}
 
 
 @dataclasses.dataclass
@@ -42,6 +47,14 @@ def get_limits(config: Mapping[str, Any]) -> TestReadLimits:
     return TestReadLimits(max_records, max_pages_per_slice, max_slices)
 
 
+def should_stream_message_groups(config: Mapping[str, Any]) -> bool:
+    """
+    Test reads emit a single message with the whole StreamRead unless the caller opts in to streamed message groups by setting
+    `stream_message_groups` to true in `__test_read_config`
+    """
+    return bool(config.get("__test_read_config", {}).get(STREAM_MESSAGE_GROUPS_KEY))
+
+
 def create_source(config: Mapping[str, Any], limits: TestReadLimits) -> ManifestDeclarativeSource:
     manifest = config["__injected_declarative_manifest"]
     return ManifestDeclarativeSource(
@@ -72,6 +85,30 @@ def read_stream(source: DeclarativeSource, config: Mapping[str, Any], configured
         return error.as_airbyte_message()
 
 
+def read_stream_message_groups(
+    source: DeclarativeSource, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog, limits: TestReadLimits
+) -> Iterator[AirbyteMessage]:
+    """
+    Same as read_stream but emits each page, slice and log as a record as soon as it is read, see MessageGrouper.stream_message_groups.
+    The data of each record is the message group with a `message_group_type` field set to page, slice, log or stream_read, the last
+    record being the stream_read summarizing the read.
+    """
+    try:
+        handler = MessageGrouper(limits.max_pages_per_slice, limits.max_slices)
+        stream_name = configured_catalog.streams[0].stream.name  # The connector builder only supports a single stream
+        for message_group in handler.stream_message_groups(source, config, configured_catalog, limits.max_records):
+            data = {"message_group_type": _MESSAGE_GROUP_TYPES[type(message_group)], **dataclasses.asdict(message_group)}
+            yield AirbyteMessage(
+                type=MessageType.RECORD,
+                record=AirbyteRecordMessage(data=data, stream=stream_name, emitted_at=_emitted_at()),
+            )
+    except Exception as exc:
+        error = AirbyteTracedException.from_exception(
+            exc, message=f"Error reading stream with config={config} and catalog={configured_catalog}: {str(exc)}"
+        )
+        yield error.as_airbyte_message()
+
+
 def resolve_manifest(source: ManifestDeclarativeSource) -> AirbyteMessage:
     try:
         return AirbyteMessage(
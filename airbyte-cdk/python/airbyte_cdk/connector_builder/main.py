@@ -4,7 +4,7 @@
 
 
 import sys
-from typing import Any, List, Mapping, Optional, Tuple
+from typing import Any, Iterator, List, Mapping, Optional, Tuple
 
 from airbyte_cdk.connector import BaseConnector
 from airbyte_cdk.connector_builder.connector_builder_handler import (
@@ -13,7 +13,9 @@ from airbyte_cdk.connector_builder.connector_builder_handler import (
     get_limits,
     list_streams,
     read_stream,
+    read_stream_message_groups,
     resolve_manifest,
+    should_stream_message_groups,
 )
 from airbyte_cdk.entrypoint import AirbyteEntrypoint
 from airbyte_cdk.models import ConfiguredAirbyteCatalog
@@ -69,9 +71,25 @@ def handle_request(args: List[str]):
     return handle_connector_builder_request(source, command, config, catalog, limits).json(exclude_unset=True)
 
 
+def handle_streamed_request(args: List[str]) -> Iterator[str]:
+    """
+    Same as handle_request, except that a test_read opting in to streamed message groups emits one message per message group
+    """
+    command, config, catalog = get_config_and_catalog_from_args(args)
+    limits = get_limits(config)
+    source = create_source(config, limits)
+    if command == "test_read" and should_stream_message_groups(config):
+        assert catalog is not None, "`test_read` requires a valid `ConfiguredAirbyteCatalog`, got None."
+        for message in read_stream_message_groups(source, config, catalog, limits):
+            yield message.json(exclude_unset=True)
+    else:
+        yield handle_connector_builder_request(source, command, config, catalog, limits).json(exclude_unset=True)
+
+
 if __name__ == "__main__":
     try:
-        print(handle_request(sys.argv[1:]))
+        for message in handle_streamed_request(sys.argv[1:]):
+            print(message, flush=True)
     except Exception as exc:
         error = AirbyteTracedException.from_exception(exc, message=f"Error handling request: {str(exc)}")
         m = error.as_airbyte_message()
@@ -6,7 +6,7 @@ import json
 import logging
 from copy import deepcopy
 from json import JSONDecodeError
-from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Union
 from urllib.parse import parse_qs, urlparse
 
 from airbyte_cdk.connector_builder.models import HttpRequest, HttpResponse, LogMessage, StreamRead, StreamReadPages, StreamReadSlices
@@ -28,6 +28,10 @@ from airbyte_protocol.models.airbyte_protocol import (
 )
 from airbyte_protocol.models.airbyte_protocol import Type as MessageType
 
+# Bounds of the schema inferred from the records read, so that wide or deeply nested records do not slow down the test read
+MAX_INFERRED_PROPERTIES = 1000
+MAX_INFERRED_DEPTH = 32
+
 
 class MessageGrouper:
     logger = logging.getLogger("airbyte.connector-builder")
@@ -44,9 +48,40 @@ class MessageGrouper:
         configured_catalog: ConfiguredAirbyteCatalog,
         record_limit: Optional[int] = None,
     ) -> StreamRead:
+        slices = []
+        log_messages = []
+        stream_read = None
+        for message_group in self.stream_message_groups(source, config, configured_catalog, record_limit):
+            if isinstance(message_group, LogMessage):
+                log_messages.append(message_group)
+            elif isinstance(message_group, StreamReadSlices):
+                slices.append(message_group)
+            elif isinstance(message_group, StreamRead):
+                stream_read = message_group
+        stream_read.logs = log_messages
+        stream_read.slices = slices
+        return stream_read
+
+    def stream_message_groups(
+        self,
+        source: DeclarativeSource,
+        config: Mapping[str, Any],
+        configured_catalog: ConfiguredAirbyteCatalog,
+        record_limit: Optional[int] = None,
+    ) -> Iterator[Union[StreamReadPages, StreamReadSlices, LogMessage, StreamRead]]:
+        """
+        Incremental version of get_message_groups: each page and each slice is yielded as soon as it is complete, the slice holding
+        the pages already yielded, and each log as soon as it is read. The last message group is the StreamRead summarizing the read,
+        without the slices and logs already yielded.
+
+        Reading stops as soon as the next slice would go past the max_slices budget, or once the record limit is reached, without reading
+        the rest of the messages of the source. The pages of a slice are already capped by the paginator of the test read, so going
+        past max_pages_per_slice only marks the test read limit as reached: the pages requested past it, e.g. the next page of a parent
+        stream requested within the slice of a child stream, do not end the read.
+        """
         if record_limit is not None and not (1 <= record_limit <= 1000):
             raise ValueError(f"Record limit must be between 1 and 1000. Got {record_limit}")
-        schema_inferrer = SchemaInferrer()
+        schema_inferrer = SchemaInferrer(max_properties=MAX_INFERRED_PROPERTIES, max_depth=MAX_INFERRED_DEPTH)
         datetime_format_inferrer = DatetimeFormatInferrer()
 
         if record_limit is None:
@@ -54,31 +89,34 @@ class MessageGrouper:
         else:
             record_limit = min(record_limit, self._max_record_limit)
 
-        slices = []
-        log_messages = []
+        slices_count = 0
+        max_pages_count = 0
         latest_config_update: AirbyteControlMessage = None
-        for message_group in self._get_message_groups(
-                self._read_stream(source, config, configured_catalog),
-                schema_inferrer,
-                datetime_format_inferrer,
-                record_limit,
-        ):
-            if isinstance(message_group, AirbyteLogMessage):
-                log_messages.append(LogMessage(**{"message": message_group.message, "level": message_group.level.value}))
-            elif isinstance(message_group, AirbyteTraceMessage):
-                if message_group.type == TraceType.ERROR:
-                    error_message = f"{message_group.error.message} - {message_group.error.stack_trace}"
-                    log_messages.append(LogMessage(**{"message": error_message, "level": "ERROR"}))
-            elif isinstance(message_group, AirbyteControlMessage):
-                if not latest_config_update or latest_config_update.emitted_at <= message_group.emitted_at:
-                    latest_config_update = message_group
-            else:
-                slices.append(message_group)
+        messages = self._read_stream(source, config, configured_catalog)
+        try:
+            for message_group in self._get_message_groups(messages, schema_inferrer, datetime_format_inferrer, record_limit):
+                if isinstance(message_group, AirbyteLogMessage):
+                    yield LogMessage(**{"message": message_group.message, "level": message_group.level.value})
+                elif isinstance(message_group, AirbyteTraceMessage):
+                    if message_group.type == TraceType.ERROR:
+                        error_message = f"{message_group.error.message} - {message_group.error.stack_trace}"
+                        yield LogMessage(**{"message": error_message, "level": "ERROR"})
+                elif isinstance(message_group, AirbyteControlMessage):
+                    if not latest_config_update or latest_config_update.emitted_at <= message_group.emitted_at:
+                        latest_config_update = message_group
+                else:
+                    if isinstance(message_group, StreamReadSlices):
+                        slices_count += 1
+                        max_pages_count = max(max_pages_count, len(message_group.pages))
+                    yield message_group
+        finally:
+            # Stops the read of the source instead of leaving it suspended until the generator is garbage collected
+            messages.close()
 
-        return StreamRead(
-            logs=log_messages,
-            slices=slices,
-            test_read_limit_reached=self._has_reached_limit(slices),
+        yield StreamRead(
+            logs=[],
+            slices=[],
+            test_read_limit_reached=slices_count >= self._max_slices or max_pages_count >= self._max_pages_per_slice,
             inferred_schema=schema_inferrer.get_stream_schema(
                 configured_catalog.streams[0].stream.name
             ),  # The connector builder currently only supports reading from a single stream at a time
@@ -88,11 +126,11 @@ class MessageGrouper:
 
     def _get_message_groups(
             self, messages: Iterator[AirbyteMessage], schema_inferrer: SchemaInferrer, datetime_format_inferrer: DatetimeFormatInferrer, limit: int
-    ) -> Iterable[Union[StreamReadPages, AirbyteControlMessage, AirbyteLogMessage, AirbyteTraceMessage]]:
+    ) -> Iterable[Union[StreamReadPages, StreamReadSlices, AirbyteControlMessage, AirbyteLogMessage, AirbyteTraceMessage]]:
         """
         Message groups are partitioned according to when request log messages are received. Subsequent response log messages
         and record messages belong to the prior request log message and when we encounter another request, append the latest
-        message group, until <limit> records have been read.
+        message group, until <limit> records have been read or the next slice would go past the budget of slices.
 
         Messages received from the CDK read operation will always arrive in the following order:
         {type: LOG, log: {message: "request: ..."}}
@@ -105,6 +143,7 @@ class MessageGrouper:
         Note: The exception is that normal log messages can be received at any time which are not incorporated into grouping
         """
         records_count = 0
+        slices_count = 0
         at_least_one_page_in_group = False
         current_page_records = []
         current_slice_descriptor: Dict[str, Any] = None
@@ -115,12 +154,16 @@ class MessageGrouper:
 
         while records_count < limit and (message := next(messages, None)):
             if self._need_to_close_page(at_least_one_page_in_group, message):
-                self._close_page(current_page_request, current_page_response, current_slice_pages, current_page_records, True)
+                yield self._close_page(current_page_request, current_page_response, current_slice_pages, current_page_records, True)
                 current_page_request = None
                 current_page_response = None
 
             if at_least_one_page_in_group and message.type == MessageType.LOG and message.log.message.startswith(AbstractSource.SLICE_LOG_PREFIX):
                 yield StreamReadSlices(pages=current_slice_pages, slice_descriptor=current_slice_descriptor)
+                slices_count += 1
+                if slices_count >= self._max_slices:
+                    # The next slice would go past the budget of slices
+                    return
                 current_slice_descriptor = self._parse_slice_description(message.log.message)
                 current_slice_pages = []
                 at_least_one_page_in_group = False
@@ -149,8 +192,10 @@ class MessageGrouper:
             elif message.type == MessageType.CONTROL and message.control.type == OrchestratorType.CONNECTOR_CONFIG:
                 yield message.control
         else:
-            self._close_page(current_page_request, current_page_response, current_slice_pages, current_page_records, validate_page_complete=not had_error)
-            yield StreamReadSlices(pages=current_slice_pages, slice_descriptor=current_slice_descriptor)
+            yield self._close_page(
+                current_page_request, current_page_response, current_slice_pages, current_page_records, validate_page_complete=not had_error
+            )
+        yield StreamReadSlices(pages=current_slice_pages, slice_descriptor=current_slice_descriptor)
 
     @staticmethod
     def _need_to_close_page(at_least_one_page_in_group: bool, message: AirbyteMessage) -> bool:
@@ -161,7 +206,9 @@ class MessageGrouper:
         )
 
     @staticmethod
-    def _close_page(current_page_request, current_page_response, current_slice_pages, current_page_records, validate_page_complete: bool):
+    def _close_page(
+        current_page_request, current_page_response, current_slice_pages, current_page_records, validate_page_complete: bool
+    ) -> StreamReadPages:
         """
         Close a page when parsing message groups
         @param validate_page_complete: in some cases, we expect the CDK to not return a response. As of today, this will only happen before
@@ -170,10 +217,10 @@ class MessageGrouper:
         if validate_page_complete and (not current_page_request or not current_page_response):
             raise ValueError("Every message grouping should have at least one request and response")
 
-        current_slice_pages.append(
-            StreamReadPages(request=current_page_request, response=current_page_response, records=deepcopy(current_page_records))
-        )
+        page = StreamReadPages(request=current_page_request, response=current_page_response, records=deepcopy(current_page_records))
+        current_slice_pages.append(page)
         current_page_records.clear()
+        return page
 
     def _read_stream(self, source: DeclarativeSource, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog) -> Iterator[AirbyteMessage]:
         # the generator can raise an exception
@@ -218,15 +265,6 @@ class MessageGrouper:
             self.logger.warning(f"Failed to parse log message into response object with error: {error}")
             return None
 
-    def _has_reached_limit(self, slices: List[StreamReadPages]):
-        if len(slices) >= self._max_slices:
-            return True
-
-        for slice in slices:
-            if len(slice.pages) >= self._max_pages_per_slice:
-                return True
-        return False
-
     def _parse_slice_description(self, log_message):
         return json.loads(log_message.replace(AbstractSource.SLICE_LOG_PREFIX, "", 1))
 
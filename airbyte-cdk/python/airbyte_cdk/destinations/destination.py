@@ -4,6 +4,7 @@
 
 import argparse
 import io
+import json
 import logging
 import sys
 from abc import ABC, abstractmethod
@@ -11,13 +12,32 @@ from typing import Any, Iterable, List, Mapping
 
 from airbyte_cdk.connector import Connector
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
-from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, ConfiguredAirbyteCatalog, Type
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from pydantic import ValidationError
 
 logger = logging.getLogger("airbyte")
 
+_RECORD_REQUIRED_FIELDS = {"stream", "data", "emitted_at"}
+_RECORD_FIELDS = {"namespace", *_RECORD_REQUIRED_FIELDS}
+
+
+def _is_valid_record(record: Any) -> bool:
+    """
+    Checks what pydantic would validate for a deserialized AirbyteRecordMessage without coercing anything: records that pass this check
+    are exactly the ones pydantic would leave untouched.
+    """
+    return (
+        isinstance(record, dict)
+        and _RECORD_REQUIRED_FIELDS.issubset(record)
+        and _RECORD_FIELDS.issuperset(record)
+        and type(record["stream"]) is str
+        and type(record["data"]) is dict
+        and type(record["emitted_at"]) is int
+        and (record.get("namespace") is None or type(record["namespace"]) is str)
+    )
+
 
 class Destination(Connector, ABC):
     VALID_CMDS = {"spec", "check", "write"}
@@ -36,10 +56,26 @@ class Destination(Connector, ABC):
         """Reads from stdin, converting to Airbyte messages"""
         for line in input_stream:
             try:
-                yield AirbyteMessage.parse_raw(line)
-            except ValidationError:
+                yield self._parse_message(line)
+            except (json.JSONDecodeError, ValidationError):
                 logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line}")
 
+    @staticmethod
+    def _parse_message(line: str) -> AirbyteMessage:
+        """
+        Records make up almost all of the input so well-formed records are built without pydantic validation. Any other message, or a
+        record that pydantic would need to coerce or reject, goes through the full pydantic parsing.
+        """
+        message = json.loads(line)
+        if (
+            isinstance(message, dict)
+            and message.get("type") == Type.RECORD.value
+            and message.keys() == {"type", "record"}
+            and _is_valid_record(message["record"])
+        ):
+            return AirbyteMessage.construct(type=Type.RECORD, record=AirbyteRecordMessage.construct(**message["record"]))
+        return AirbyteMessage.parse_obj(message)
+
     def _run_write(
         self, config: Mapping[str, Any], configured_catalog_path: str, input_stream: io.TextIOWrapper
     ) -> Iterable[AirbyteMessage]:
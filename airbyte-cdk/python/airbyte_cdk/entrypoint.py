@@ -5,6 +5,7 @@
 
 import argparse
 import importlib
+import json
 import logging
 import os.path
 import sys
@@ -14,12 +15,14 @@ from typing import Any, Iterable, List, Mapping
 from airbyte_cdk.connector import TConfig
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
 from airbyte_cdk.logger import init_logger
-from airbyte_cdk.models import AirbyteMessage, Status, Type
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, Status, Type
 from airbyte_cdk.models.airbyte_protocol import ConnectorSpecification
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.source import TCatalog, TState
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit, split_config
-from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets, update_secrets
+from airbyte_cdk.utils.airbyte_secrets_utils import get_filtering_overhead, get_secrets, update_secrets
+from airbyte_cdk.utils.message_writer import DEFAULT_MAX_BUFFER_SIZE, BufferedMessageWriter, redirect_stdout_log_handlers
+from airbyte_cdk.utils.stream_profiler import SERIALIZATION, stream_profiler
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 logger = init_logger("airbyte")
@@ -58,6 +61,11 @@ class AirbyteEntrypoint(object):
         read_parser = subparsers.add_parser("read", help="reads the source and outputs messages to STDOUT", parents=[parent_parser])
 
         read_parser.add_argument("--state", type=str, required=False, help="path to the json-encoded state file")
+        read_parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="measures where the time of each stream is spent and outputs the report as a log message at the end of the sync",
+        )
         required_read_parser = read_parser.add_argument_group("required named arguments")
         required_read_parser.add_argument("--config", type=str, required=True, help="path to the json configuration file")
         required_read_parser.add_argument(
@@ -98,7 +106,16 @@ class AirbyteEntrypoint(object):
                         config_catalog = self.source.read_catalog(parsed_args.catalog)
                         state = self.source.read_state(parsed_args.state)
 
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.read(source_spec, config, config_catalog, state))
+                        if getattr(parsed_args, "profile", False):
+                            stream_profiler.enable()
+                        try:
+                            yield from map(
+                                AirbyteEntrypoint.airbyte_message_to_string, self.read(source_spec, config, config_catalog, state)
+                            )
+                            if stream_profiler.enabled:
+                                yield self.airbyte_message_to_string(self._profile_report_message())
+                        finally:
+                            stream_profiler.disable()
                     else:
                         raise Exception("Unexpected command " + cmd)
         finally:
@@ -157,19 +174,64 @@ class AirbyteEntrypoint(object):
 
     @staticmethod
     def airbyte_message_to_string(airbyte_message: AirbyteMessage) -> str:
+        if _is_plain_record_message(airbyte_message):
+            with stream_profiler.stage(SERIALIZATION, airbyte_message.record.stream):
+                return _record_message_to_string(airbyte_message)
         return airbyte_message.json(exclude_unset=True)
 
+    @staticmethod
+    def _profile_report_message() -> AirbyteMessage:
+        # The protocol has no message for profiling reports: the report is a JSON document in a log message
+        report = json.dumps(stream_profiler.report())
+        return AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message=f"Profiling report: {report}"))
+
     def _emit_queued_messages(self, source) -> Iterable[AirbyteMessage]:
         if hasattr(source, "message_repository") and source.message_repository:
             yield from source.message_repository.consume_queue()
         return
 
 
+_RECORD_MESSAGE_FIELDS = {"type", "record"}
+_RECORD_FIELDS = ("namespace", "stream", "data", "emitted_at")
+
+
+def _is_plain_record_message(airbyte_message: AirbyteMessage) -> bool:
+    """
+    Records are by far the most common messages. The ones that only have the fields set by the CDK can be serialized without going
+    through pydantic.
+    """
+    return (
+        airbyte_message.type == Type.RECORD
+        and airbyte_message.__fields_set__ == _RECORD_MESSAGE_FIELDS
+        and airbyte_message.record is not None
+        and airbyte_message.record.__fields_set__.issubset(_RECORD_FIELDS)
+    )
+
+
+def _record_message_to_string(airbyte_message: AirbyteMessage) -> str:
+    """
+    Serializes a record message to the exact same string as airbyte_message.json(exclude_unset=True) but without converting the whole
+    message and its data to dicts first.
+    """
+    record = airbyte_message.record
+    fields_set = record.__fields_set__
+    # Fields are serialized in the order of the model definition, as pydantic does
+    serialized_record = {field: getattr(record, field) for field in _RECORD_FIELDS if field in fields_set}
+    return json.dumps({"type": Type.RECORD.value, "record": serialized_record}, default=AirbyteMessage.__json_encoder__)
+
+
 def launch(source: Source, args: List[str]):
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    for message in source_entrypoint.run(parsed_args):
-        print(message)
+    max_buffer_size = int(os.environ.get("AIRBYTE_OUTPUT_BUFFER_SIZE", DEFAULT_MAX_BUFFER_SIZE))
+    # Exiting the writer flushes it, so messages read before a failure are written before the error is reported. Log lines go through the
+    # writer so that they keep their order with the messages
+    with BufferedMessageWriter(max_buffer_size=max_buffer_size) as writer, redirect_stdout_log_handlers(writer):
+        for message in source_entrypoint.run(parsed_args):
+            writer.write(message)
+    logger.debug(f"Wrote {writer.messages_written} messages ({writer.bytes_written} bytes) to stdout")
+    strings_filtered, filtering_seconds = get_filtering_overhead()
+    logger.debug(f"Filtered secrets from {strings_filtered} strings in {filtering_seconds:.3f} seconds")
 
 
 def main():
@@ -2,10 +2,16 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import json
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from queue import Queue
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import (
     AirbyteCatalog,
@@ -19,21 +25,34 @@ from airbyte_cdk.models import (
     Level,
     Status,
     SyncMode,
+    TraceType,
 )
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.checkpoint_policy import CheckpointPolicy
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.streams.http.http import HttpStream
+from airbyte_cdk.sources.utils.parent_record_cache import parent_record_cache
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.sources.utils.schema_cache import SchemaCache
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, split_config
-from airbyte_cdk.utils.event_timing import create_timer
+from airbyte_cdk.sources.utils.slice_prefetcher import SlicePrefetcher, read_until_stopped
+from airbyte_cdk.utils.event_timing import EventTimer, create_timer
+from airbyte_cdk.utils.stream_profiler import stream_profiler
 from airbyte_cdk.utils.stream_status_utils import as_airbyte_message as stream_status_as_airbyte_message
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 
+@dataclass
+class _StreamReadDone:
+    """Marks the end of the messages of a stream read concurrently"""
+
+    exception: Optional[BaseException] = None
+
+
 class AbstractSource(Source, ABC):
     """
     Abstract base class for an Airbyte Source. Consumers should implement any abstract methods
@@ -41,6 +60,8 @@ class AbstractSource(Source, ABC):
     """
 
     SLICE_LOG_PREFIX = "slice:"
+    # Bounds the number of messages read ahead by the stream workers when streams are read concurrently
+    _CONCURRENT_READ_QUEUE_SIZE = 1000
 
     @abstractmethod
     def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
@@ -64,7 +85,9 @@ class AbstractSource(Source, ABC):
         """
 
     # Stream name to instance map for applying output object transformation
-    _stream_to_instance_map: Dict[str, Stream] = {}
+    _stream_to_instance_map: Mapping[str, Stream] = {}
+    # Schemas of the streams being read, created for each read
+    _schema_cache: Optional[SchemaCache] = None
 
     @property
     def name(self) -> str:
@@ -99,57 +122,201 @@ class AbstractSource(Source, ABC):
         config, internal_config = split_config(config)
         # TODO assert all streams exist in the connector
         # get the streams once in case the connector needs to make any queries to generate them
-        stream_instances = {s.name: s for s in self.streams(config)}
-        state_manager = ConnectorStateManager(stream_instance_map=stream_instances, state=state)
+        stream_instances = self._get_stream_instances(config)
+        state_manager = ConnectorStateManager(stream_instance_map=stream_instances, state=state, checkpoint_policy=self.checkpoint_policy)
         self._stream_to_instance_map = stream_instances
         with create_timer(self.name) as timer:
-            for configured_stream in catalog.streams:
-                stream_instance = stream_instances.get(configured_stream.stream.name)
-                if not stream_instance:
-                    raise KeyError(
-                        f"The requested stream {configured_stream.stream.name} was not found in the source."
-                        f" Available streams: {stream_instances.keys()}"
-                    )
-                stream_is_available, error = stream_instance.check_availability(logger, self)
-                if not stream_is_available:
-                    logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. Error: {error}")
-                    continue
-                try:
-                    timer.start_event(f"Syncing stream {configured_stream.stream.name}")
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STARTED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.STARTED)
-                    yield from self._read_stream(
-                        logger=logger,
-                        stream_instance=stream_instance,
-                        configured_stream=configured_stream,
-                        state_manager=state_manager,
-                        internal_config=internal_config,
-                    )
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.COMPLETE)
-                except AirbyteTracedException as e:
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
-                    raise e
-                except Exception as e:
-                    yield from self._emit_queued_messages()
-                    logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
-                    display_message = stream_instance.get_error_display_message(e)
-                    if display_message:
-                        raise AirbyteTracedException.from_exception(e, message=display_message) from e
-                    raise e
-                finally:
-                    timer.finish_event()
-                    logger.info(f"Finished syncing {configured_stream.stream.name}")
-                    logger.info(timer.report())
-
+            self._schema_cache = SchemaCache(timer)
+            try:
+                if self.max_concurrent_streams > 1:
+                    yield from self._read_streams_concurrently(logger, catalog, stream_instances, state_manager, internal_config, timer)
+                else:
+                    for configured_stream in catalog.streams:
+                        yield from self._read_configured_stream(
+                            logger, configured_stream, stream_instances, state_manager, internal_config, timer
+                        )
+            finally:
+                # Parent records are only shared by the substreams read during the same sync
+                parent_record_cache.clear()
+
+        connection_pool_registries = {
+            stream.connection_pool_registry
+            for configured_stream in catalog.streams
+            if getattr(stream := stream_instances.get(configured_stream.stream.name), "connection_pool_registry", None)
+        }
+        for connection_pool_registry in connection_pool_registries:
+            for host, connection_stats in connection_pool_registry.stats().items():
+                logger.debug(
+                    f"Sent {connection_stats.requests} requests to {host} reusing open connections for {connection_stats.reused_connections} of them"
+                )
         logger.info(f"Finished syncing {self.name}")
 
+    def _get_stream_instances(self, config: Mapping[str, Any]) -> Mapping[str, Stream]:
+        """
+        :return: the streams of the source by name. Sources able to create a stream without creating the others can return a mapping
+        creating the streams as they are requested so that only the streams of the configured catalog are created.
+        """
+        return {s.name: s for s in self.streams(config)}
+
     @property
     def per_stream_state_enabled(self) -> bool:
         return True
 
+    @property
+    def checkpoint_policy(self) -> CheckpointPolicy:
+        """
+        Decides when the state of the streams read incrementally is checkpointed. The default checkpoints the state after every slice and
+        every `state_checkpoint_interval` records. Sources with many small slices can coalesce their checkpoints to emit fewer states.
+        """
+        return CheckpointPolicy()
+
+    @property
+    def max_concurrent_streams(self) -> int:
+        """
+        Maximum number of configured streams read at the same time. The default of 1 reads the streams sequentially in catalog order.
+        When greater than 1, streams are read on a pool of worker threads: the messages of a given stream keep their relative order but
+        messages of different streams are interleaved in the output.
+        """
+        return 1
+
+    def _read_configured_stream(
+        self,
+        logger: logging.Logger,
+        configured_stream: ConfiguredAirbyteStream,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> Iterator[AirbyteMessage]:
+        stream_instance = stream_instances.get(configured_stream.stream.name)
+        if not stream_instance:
+            raise KeyError(
+                f"The requested stream {configured_stream.stream.name} was not found in the source."
+                f" Available streams: {stream_instances.keys()}"
+            )
+        stream_is_available, error = stream_instance.check_availability(logger, self)
+        if not stream_is_available:
+            logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. Error: {error}")
+            return
+        event_name = f"Syncing stream {configured_stream.stream.name}"
+        try:
+            timer.start_event(event_name)
+            logger.info(f"Marking stream {configured_stream.stream.name} as STARTED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.STARTED)
+            with stream_profiler.profile_stream(configured_stream.stream.name):
+                yield from self._read_stream(
+                    logger=logger,
+                    stream_instance=stream_instance,
+                    configured_stream=configured_stream,
+                    state_manager=state_manager,
+                    internal_config=internal_config,
+                )
+            logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.COMPLETE)
+        except AirbyteTracedException as e:
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
+            raise e
+        except Exception as e:
+            yield from self._emit_queued_messages()
+            logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
+            logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
+            display_message = stream_instance.get_error_display_message(e)
+            if display_message:
+                raise AirbyteTracedException.from_exception(e, message=display_message) from e
+            raise e
+        finally:
+            timer.finish_event(event_name)
+            if self._schema_cache:
+                self._schema_cache.invalidate(stream_instance)
+            logger.info(f"Finished syncing {configured_stream.stream.name}")
+            logger.info(timer.report())
+
+    def _read_streams_concurrently(
+        self,
+        logger: logging.Logger,
+        catalog: ConfiguredAirbyteCatalog,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Reads the configured streams on a pool of `max_concurrent_streams` workers. Every worker pushes the messages of its stream to a
+        shared queue that is consumed here so that all the messages still go through a single output.
+
+        On the first failure, streams that did not start yet are skipped, running streams are stopped and marked as INCOMPLETE and the
+        error is raised once every worker is done.
+        """
+        message_queue: Queue = Queue(maxsize=self._CONCURRENT_READ_QUEUE_SIZE)
+        stop_reading = threading.Event()
+        first_exception: Optional[BaseException] = None
+        pending_streams = len(catalog.streams)
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_streams, thread_name_prefix=f"{self.name}_stream") as executor:
+            for configured_stream in catalog.streams:
+                executor.submit(
+                    self._read_configured_stream_to_queue,
+                    message_queue,
+                    stop_reading,
+                    logger,
+                    configured_stream,
+                    stream_instances,
+                    state_manager,
+                    internal_config,
+                    timer,
+                )
+            try:
+                while pending_streams:
+                    item = message_queue.get()
+                    if isinstance(item, _StreamReadDone):
+                        pending_streams -= 1
+                        if item.exception and not first_exception:
+                            first_exception = item.exception
+                    else:
+                        yield item
+            finally:
+                # Only pending when the consumer stopped iterating early: stop the workers and discard their remaining messages so that
+                # none of them is blocked on a full queue when the executor shuts down
+                stop_reading.set()
+                while pending_streams:
+                    if isinstance(message_queue.get(), _StreamReadDone):
+                        pending_streams -= 1
+
+        if first_exception:
+            raise first_exception
+
+    def _read_configured_stream_to_queue(
+        self,
+        message_queue: Queue,
+        stop_reading: threading.Event,
+        logger: logging.Logger,
+        configured_stream: ConfiguredAirbyteStream,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> None:
+        exception: Optional[BaseException] = None
+        if not stop_reading.is_set():
+            messages = self._read_configured_stream(logger, configured_stream, stream_instances, state_manager, internal_config, timer)
+            last_status: Optional[AirbyteStreamStatus] = None
+            try:
+                for message in messages:
+                    if message.type == MessageType.TRACE and message.trace.type == TraceType.STREAM_STATUS:
+                        last_status = message.trace.stream_status.status
+                    message_queue.put(message)
+                    if stop_reading.is_set():
+                        break
+                messages.close()
+            except Exception as e:
+                exception = e
+                stop_reading.set()
+            if last_status in (AirbyteStreamStatus.STARTED, AirbyteStreamStatus.RUNNING):
+                # The stream was interrupted because another stream failed
+                logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+                message_queue.put(stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE))
+        message_queue.put(_StreamReadDone(exception))
+
     def _read_stream(
         self,
         logger: logging.Logger,
@@ -203,6 +370,7 @@ class AbstractSource(Source, ABC):
             yield from self._emit_queued_messages()
             yield record
 
+        stream_profiler.count_records(record_counter, stream_name)
         logger.info(f"Read {record_counter} records from {stream_name} stream")
 
     @staticmethod
@@ -251,48 +419,159 @@ class AbstractSource(Source, ABC):
 
         total_records_counter = 0
         has_slices = False
-        for _slice in slices:
-            has_slices = True
-            if self.should_log_slice_message(logger):
-                yield AirbyteMessage(
-                    type=MessageType.LOG,
-                    log=AirbyteLogMessage(level=Level.INFO, message=f"{self.SLICE_LOG_PREFIX}{json.dumps(_slice, default=str)}"),
-                )
-            records = stream_instance.read_records(
+        # Records of concurrently read slices are emitted once their whole batch is read: checkpointing in the middle of a batch could
+        # save a state that covers records which were not emitted yet
+        checkpoint_interval = stream_instance.state_checkpoint_interval if stream_instance.max_concurrent_slices <= 1 else None
+        checkpointer = state_manager.create_checkpointer(stream_name, stream_instance.namespace, self.per_stream_state_enabled)
+
+        def read_slice(stream_slice: Optional[Mapping[str, Any]]) -> Iterable[StreamData]:
+            return stream_instance.read_records(
                 sync_mode=SyncMode.incremental,
-                stream_slice=_slice,
+                stream_slice=stream_slice,
                 stream_state=stream_state,
                 cursor_field=configured_stream.cursor_field or None,
             )
-            record_counter = 0
-            for message_counter, record_data_or_message in enumerate(records, start=1):
-                message = self._get_message(record_data_or_message, stream_instance)
-                yield from self._emit_queued_messages()
-                yield message
-                if message.type == MessageType.RECORD:
-                    record = message.record
-                    stream_state = stream_instance.get_updated_state(stream_state, record.data)
-                    checkpoint_interval = stream_instance.state_checkpoint_interval
-                    record_counter += 1
-                    if checkpoint_interval and record_counter % checkpoint_interval == 0:
-                        yield self._checkpoint_state(stream_instance, stream_state, state_manager)
 
-                    total_records_counter += 1
-                    # This functionality should ideally live outside of this method
-                    # but since state is managed inside this method, we keep track
-                    # of it here.
-                    if self._limit_reached(internal_config, total_records_counter):
-                        # Break from slice loop to save state and exit from _read_incremental function.
-                        break
-
-            yield self._checkpoint_state(stream_instance, stream_state, state_manager)
-            if self._limit_reached(internal_config, total_records_counter):
-                return
+        try:
+            for _slice, records, get_state_to_checkpoint in self._read_slices(stream_instance, slices, read_slice):
+                has_slices = True
+                if self.should_log_slice_message(logger):
+                    yield AirbyteMessage(
+                        type=MessageType.LOG,
+                        log=AirbyteLogMessage(level=Level.INFO, message=f"{self.SLICE_LOG_PREFIX}{json.dumps(_slice, default=str)}"),
+                    )
+                record_counter = 0
+                for message_counter, record_data_or_message in enumerate(records, start=1):
+                    message = self._get_message(record_data_or_message, stream_instance)
+                    yield from self._emit_queued_messages()
+                    yield message
+                    if message.type == MessageType.RECORD:
+                        record = message.record
+                        stream_state = stream_instance.get_updated_state(stream_state, record.data)
+                        record_counter += 1
+                        checkpoint_is_due = checkpointer.record_read(record.data)
+                        if checkpoint_interval and (record_counter % checkpoint_interval == 0 or checkpoint_is_due):
+                            yield from self._emit_state_message(
+                                checkpointer.checkpoint(self._get_state_to_checkpoint(stream_instance, stream_state))
+                            )
+
+                        total_records_counter += 1
+                        # This functionality should ideally live outside of this method
+                        # but since state is managed inside this method, we keep track
+                        # of it here.
+                        if self._limit_reached(internal_config, total_records_counter):
+                            # Break from slice loop to save state and exit from _read_incremental function.
+                            break
+
+                if self._limit_reached(internal_config, total_records_counter):
+                    yield from self._emit_state_message(
+                        checkpointer.checkpoint(self._get_state_to_checkpoint(stream_instance, stream_state))
+                    )
+                    return
+                state_to_checkpoint = get_state_to_checkpoint(stream_state)
+                if state_to_checkpoint is not None:
+                    yield from self._emit_state_message(checkpointer.slice_read(state_to_checkpoint))
+        except Exception:
+            # The state of the slices read before the error is emitted so that they are not read again by the next sync
+            yield from self._emit_state_message(checkpointer.flush())
+            raise
 
         if not has_slices:
             # Safety net to ensure we always emit at least one state message even if there are no slices
-            checkpoint = self._checkpoint_state(stream_instance, stream_state, state_manager)
-            yield checkpoint
+            yield from self._emit_state_message(checkpointer.checkpoint(self._get_state_to_checkpoint(stream_instance, stream_state)))
+        else:
+            yield from self._emit_state_message(checkpointer.flush())
+
+    def _read_slices(
+        self,
+        stream_instance: Stream,
+        slices: Iterable[Optional[Mapping[str, Any]]],
+        read_slice: Callable[[Optional[Mapping[str, Any]]], Iterable[StreamData]],
+    ) -> Iterator[Tuple[Optional[Mapping[str, Any]], Iterable[StreamData], Callable[[Mapping[str, Any]], Optional[Mapping[str, Any]]]]]:
+        """
+        Yields each slice along with its records and a function which, called with the state computed from the records processed so far
+        once the slice is processed, returns the state of the stream to checkpoint, or None if no state can be checkpointed yet.
+
+        If the stream reads several slices concurrently, up to `max_concurrent_slices` slices are read ahead of the slice being processed
+        and slices are yielded in order. A state computed from the records processed so far can be checkpointed after every slice, but a
+        stream implementing the state property can update it while reading any of the slices read ahead. Its state is therefore
+        snapshotted whenever a slice is read, along with the number of slices whose reading had started, and the latest snapshot only
+        covering processed slices is checkpointed.
+        """
+        max_concurrent_slices = stream_instance.max_concurrent_slices
+        if max_concurrent_slices <= 1 or "state" not in dir(stream_instance):
+            slice_iterator = self._prefetch_slices(stream_instance, slices, read_slice)
+            for _slice, records in slice_iterator:
+                yield _slice, records, lambda stream_state: self._get_state_to_checkpoint(stream_instance, stream_state)
+            return
+
+        started_slices = 0
+        # Snapshots of the state of the stream, along with the number of slices started when they were taken, in the order they were taken
+        snapshots: Deque[Tuple[int, Mapping[str, Any]]] = deque()
+        lock = threading.Lock()
+
+        def count_started_slices(stream_slices: Iterable[Optional[Mapping[str, Any]]]) -> Iterator[Optional[Mapping[str, Any]]]:
+            nonlocal started_slices
+            for stream_slice in stream_slices:
+                started_slices += 1
+                yield stream_slice
+
+        def snapshot_state() -> None:
+            with lock:
+                # The slices are counted after the state is copied so that the snapshot never covers a slice which is not counted
+                state = copy.deepcopy(stream_instance.state)
+                snapshots.append((started_slices, state))
+
+        def get_state_to_checkpoint(processed_slices: int) -> Optional[Mapping[str, Any]]:
+            state = None
+            with lock:
+                while snapshots and snapshots[0][0] <= processed_slices:
+                    state = snapshots.popleft()[1]
+            return state
+
+        slice_iterator = self._prefetch_slices(stream_instance, count_started_slices(slices), read_slice, on_slice_read_ahead=snapshot_state)
+        for processed_slices, (_slice, records) in enumerate(slice_iterator, start=1):
+            yield _slice, records, lambda _, processed_slices=processed_slices: get_state_to_checkpoint(processed_slices)
+
+    @staticmethod
+    def _prefetch_slices(
+        stream_instance: Stream,
+        slices: Iterable[Optional[Mapping[str, Any]]],
+        read_slice: Callable[[Optional[Mapping[str, Any]]], Iterable[StreamData]],
+        on_slice_read_ahead: Optional[Callable[[], None]] = None,
+    ) -> Iterator[Tuple[Optional[Mapping[str, Any]], Iterable[StreamData]]]:
+        """
+        Yields each slice along with its records, the next slices being read ahead if the stream reads several slices concurrently
+        :param on_slice_read_ahead: called from the thread which read a slice ahead once all its records are read
+        """
+        max_concurrent_slices = stream_instance.max_concurrent_slices
+        if max_concurrent_slices <= 1:
+            for _slice in slices:
+                yield _slice, read_slice(_slice)
+            return
+
+        def read_slice_ahead(stream_slice: Optional[Mapping[str, Any]], stop: threading.Event) -> List[StreamData]:
+            records = read_until_stopped(read_slice(stream_slice), stop)
+            if on_slice_read_ahead and not stop.is_set():
+                on_slice_read_ahead()
+            return records
+
+        prefetcher: SlicePrefetcher[List[StreamData]] = SlicePrefetcher(
+            read_slice_ahead,
+            max_concurrent_slices,
+            name=stream_instance.name,
+        )
+        prefetched_slices = prefetcher.prefetch(slices)
+        try:
+            for _slice in prefetched_slices:
+                records = prefetcher.pop(_slice)
+                if records is None:
+                    # Slices yielded several times are only read ahead the first time
+                    records = read_slice(_slice)
+                yield _slice, records
+        finally:
+            # Stops reading the slices ahead without waiting for them, e.g. when the record limit is reached
+            prefetched_slices.close()
 
     def should_log_slice_message(self, logger: logging.Logger):
         """
@@ -319,17 +598,20 @@ class AbstractSource(Source, ABC):
             f"Processing stream slices for {configured_stream.stream.name} (sync_mode: full_refresh)", extra={"stream_slices": slices}
         )
         total_records_counter = 0
-        for _slice in slices:
+
+        def read_slice(stream_slice: Optional[Mapping[str, Any]]) -> Iterable[StreamData]:
+            return stream_instance.read_records(
+                stream_slice=stream_slice,
+                sync_mode=SyncMode.full_refresh,
+                cursor_field=configured_stream.cursor_field,
+            )
+
+        for _slice, record_data_or_messages in self._prefetch_slices(stream_instance, slices, read_slice):
             if self.should_log_slice_message(logger):
                 yield AirbyteMessage(
                     type=MessageType.LOG,
                     log=AirbyteLogMessage(level=Level.INFO, message=f"{self.SLICE_LOG_PREFIX}{json.dumps(_slice, default=str)}"),
                 )
-            record_data_or_messages = stream_instance.read_records(
-                stream_slice=_slice,
-                sync_mode=SyncMode.full_refresh,
-                cursor_field=configured_stream.cursor_field,
-            )
             for record_data_or_message in record_data_or_messages:
                 message = self._get_message(record_data_or_message, stream_instance)
                 yield message
@@ -339,15 +621,23 @@ class AbstractSource(Source, ABC):
                         return
 
     def _checkpoint_state(self, stream: Stream, stream_state, state_manager: ConnectorStateManager):
+        state_manager.update_state_for_stream(stream.name, stream.namespace, self._get_state_to_checkpoint(stream, stream_state))
+        return state_manager.create_state_message(stream.name, stream.namespace, send_per_stream_state=self.per_stream_state_enabled)
+
+    @staticmethod
+    def _get_state_to_checkpoint(stream: Stream, stream_state: Mapping[str, Any]) -> Mapping[str, Any]:
         # First attempt to retrieve the current state using the stream's state property. We receive an AttributeError if the state
         # property is not implemented by the stream instance and as a fallback, use the stream_state retrieved from the stream
         # instance's deprecated get_updated_state() method.
         try:
-            state_manager.update_state_for_stream(stream.name, stream.namespace, stream.state)
-
+            return stream.state
         except AttributeError:
-            state_manager.update_state_for_stream(stream.name, stream.namespace, stream_state)
-        return state_manager.create_state_message(stream.name, stream.namespace, send_per_stream_state=self.per_stream_state_enabled)
+            return stream_state
+
+    @staticmethod
+    def _emit_state_message(state_message: Optional[AirbyteMessage]) -> Iterator[AirbyteMessage]:
+        if state_message:
+            yield state_message
 
     @staticmethod
     def _apply_log_level_to_stream_logger(logger: logging.Logger, stream_instance: Stream):
@@ -365,7 +655,8 @@ class AbstractSource(Source, ABC):
         if isinstance(record_data_or_message, AirbyteMessage):
             return record_data_or_message
         else:
-            return stream_data_to_airbyte_message(stream.name, record_data_or_message, stream.transformer, stream.get_json_schema())
+            schema = self._schema_cache.get_json_schema(stream) if self._schema_cache else stream.get_json_schema()
+            return stream_data_to_airbyte_message(stream.name, record_data_or_message, stream.transformer, schema)
 
     @property
     def message_repository(self) -> Union[None, MessageRepository]:
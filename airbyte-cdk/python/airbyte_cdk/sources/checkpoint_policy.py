@@ -0,0 +1,138 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import copy
+import json
+import time
+import typing
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Optional
+
+from airbyte_cdk.models import AirbyteMessage
+
+if typing.TYPE_CHECKING:
+    from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+
+
+@dataclass(frozen=True)
+class CheckpointPolicy:
+    """
+    Decides when the state of a stream read incrementally is checkpointed.
+
+    By default, the state is checkpointed after every slice and every `state_checkpoint_interval` records. Setting interval_seconds,
+    max_records or max_bytes coalesces the checkpoints of consecutive slices: the state at the end of a slice is only emitted once one
+    of the thresholds is reached since the last checkpoint. The state of the last slice read is always emitted at the end of the stream,
+    when the record limit is reached, and before the error of a failing stream is raised, so that no record is skipped by the next sync.
+
+    For streams with a `state_checkpoint_interval`, whose records are read in cursor order, the thresholds also trigger checkpoints
+    between the records of a slice.
+
+    Attributes:
+        interval_seconds (Optional[float]): time since the last checkpoint after which the state is checkpointed
+        max_records (Optional[int]): number of records since the last checkpoint after which the state is checkpointed
+        max_bytes (Optional[int]): size of the records since the last checkpoint after which the state is checkpointed, measured as the
+            length of their JSON serialization
+        skip_unchanged_state (bool): do not emit a state identical to the last state emitted for the stream
+    """
+
+    interval_seconds: Optional[float] = None
+    max_records: Optional[int] = None
+    max_bytes: Optional[int] = None
+    skip_unchanged_state: bool = False
+
+    @property
+    def coalesces_checkpoints(self) -> bool:
+        return self.interval_seconds is not None or self.max_records is not None or self.max_bytes is not None
+
+
+class StreamCheckpointer:
+    """
+    Checkpoints the state of a stream according to a CheckpointPolicy. It is created by the ConnectorStateManager for each stream read.
+    """
+
+    def __init__(
+        self,
+        state_manager: "ConnectorStateManager",
+        stream_name: str,
+        namespace: Optional[str],
+        policy: CheckpointPolicy,
+        send_per_stream_state: bool,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._state_manager = state_manager
+        self._stream_name = stream_name
+        self._namespace = namespace
+        self._policy = policy
+        self._send_per_stream_state = send_per_stream_state
+        self._clock = clock
+        self._records = 0
+        self._bytes = 0
+        self._last_checkpoint_time = clock()
+        self._last_emitted_state: Optional[Mapping[str, Any]] = None
+        self._has_emitted_state = False
+        # Whether the state saved at the end of the last slice was not emitted yet
+        self._pending = False
+
+    def record_read(self, record_data: Mapping[str, Any]) -> bool:
+        """
+        :param record_data: data of a record emitted since the last checkpoint
+        :return: True if the state is due to be checkpointed
+        """
+        self._records += 1
+        if self._policy.max_bytes is not None:
+            self._bytes += len(json.dumps(record_data, default=str))
+        return self.is_due()
+
+    def is_due(self) -> bool:
+        policy = self._policy
+        return (
+            (policy.max_records is not None and self._records >= policy.max_records)
+            or (policy.max_bytes is not None and self._bytes >= policy.max_bytes)
+            or (policy.interval_seconds is not None and self._clock() - self._last_checkpoint_time >= policy.interval_seconds)
+        )
+
+    def checkpoint(self, stream_state: Mapping[str, Any]) -> Optional[AirbyteMessage]:
+        """
+        Saves the state of the stream and creates its state message.
+
+        :param stream_state: state covering all the records emitted so far
+        :return: the state message, or None if the state was already emitted and the policy skips unchanged states
+        """
+        self._state_manager.update_state_for_stream(self._stream_name, self._namespace, stream_state)
+        return self._emit(stream_state)
+
+    def slice_read(self, stream_state: Mapping[str, Any]) -> Optional[AirbyteMessage]:
+        """
+        Saves the state of the stream at the end of a slice and creates its state message unless the checkpoint is coalesced with the
+        ones of the next slices.
+
+        :param stream_state: state covering all the records emitted so far
+        :return: the state message, or None if the state is not emitted yet
+        """
+        self._state_manager.update_state_for_stream(self._stream_name, self._namespace, stream_state)
+        if self._policy.coalesces_checkpoints and not self.is_due():
+            self._pending = True
+            return None
+        return self._emit(stream_state)
+
+    def flush(self) -> Optional[AirbyteMessage]:
+        """
+        :return: the message of the state saved at the end of the last slice if it was not emitted yet
+        """
+        if not self._pending:
+            return None
+        return self._emit(self._state_manager.get_stream_state(self._stream_name, self._namespace))
+
+    def _emit(self, stream_state: Mapping[str, Any]) -> Optional[AirbyteMessage]:
+        self._records = 0
+        self._bytes = 0
+        self._last_checkpoint_time = self._clock()
+        self._pending = False
+        if self._policy.skip_unchanged_state:
+            if self._has_emitted_state and stream_state == self._last_emitted_state:
+                return None
+            # The state of the stream can be updated in place by the next records
+            self._last_emitted_state = copy.deepcopy(stream_state)
+            self._has_emitted_state = True
+        return self._state_manager.create_state_message(self._stream_name, self._namespace, self._send_per_stream_state)
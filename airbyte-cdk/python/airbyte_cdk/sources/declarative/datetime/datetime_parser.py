@@ -3,7 +3,23 @@
 #
 
 import datetime
-from typing import Union
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
+
+# Patterns of the directives parsed without strptime, the same as the ones of strptime so that values are parsed the same way
+_DIRECTIVE_PATTERNS = {
+    "Y": r"(?P<Y>\d\d\d\d)",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "d": r"(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "M": r"(?P<M>[0-5]\d|\d)",
+    "S": r"(?P<S>6[0-1]|[0-5]\d|\d)",
+    "f": r"(?P<f>[0-9]{1,6})",
+    "z": r"(?P<z>[+-]\d\d:?[0-5]\d(:?[0-5]\d(\.\d{1,6})?)?|Z)",
+}
+# Patterns of the values whose lexicographic order is the chronological order, in decreasing order of significance
+_ORDERED_DIRECTIVE_PATTERNS = {"Y": r"\d{4}", "m": r"\d{2}", "d": r"\d{2}", "H": r"\d{2}", "M": r"\d{2}", "S": r"\d{2}", "f": r"\d{6}"}
 
 
 class DatetimeParser:
@@ -14,6 +30,10 @@ class DatetimeParser:
 
     %s is part of the list of format codes required by  the 1989 C standard, but it is unreliable because it always return a datetime in the system's timezone.
     Instead of using the directive directly, we can use datetime.fromtimestamp and dt.timestamp()
+
+    As cursor values are parsed for every record, formats made of numeric directives (%Y, %m, %d, %H, %M, %S, %f and %z)
+    are compiled once into a regular expression which is much faster than strptime. Values which do not match it, and the other formats,
+    go through strptime.
     """
 
     def parse(self, date: Union[str, int], format: str):
@@ -26,7 +46,9 @@ class DatetimeParser:
         if format == "%s":
             return datetime.datetime.fromtimestamp(int(date), tz=datetime.timezone.utc)
 
-        parsed_datetime = datetime.datetime.strptime(str(date), format)
+        parsed_datetime = _compile_format(format).parse(str(date))
+        if parsed_datetime is None:
+            parsed_datetime = datetime.datetime.strptime(str(date), format)
         if self._is_naive(parsed_datetime):
             return parsed_datetime.replace(tzinfo=datetime.timezone.utc)
         return parsed_datetime
@@ -40,5 +62,139 @@ class DatetimeParser:
         else:
             return dt.strftime(format)
 
+    def compare(self, first: Union[str, int], second: Union[str, int], format: str) -> int:
+        """
+        Compares two values of the format without parsing them when their lexicographic order is their chronological order, i.e. when
+        the format only has fixed width numeric directives in decreasing order of significance and the values have the same UTC offset.
+
+        :return: a negative number if the first value is before the second one, 0 if they are the same datetime, a positive number otherwise
+        """
+        if self.are_ordered(first, second, format):
+            return (first > second) - (first < second)
+        first_datetime, second_datetime = self.parse(first, format), self.parse(second, format)
+        return (first_datetime > second_datetime) - (first_datetime < second_datetime)
+
+    def are_ordered(self, first: Union[str, int], second: Union[str, int], format: str) -> bool:
+        """
+        :return: True if the values can be compared as strings, see compare
+        """
+        return isinstance(first, str) and isinstance(second, str) and _compile_format(format).are_ordered(first, second)
+
     def _is_naive(self, dt: datetime.datetime) -> bool:
         return dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None
+
+
+class _CompiledFormat:
+    """
+    Parser and ordering of a format made of numeric directives. Each of them is None if the format has other directives.
+    """
+
+    def __init__(self, format: str):
+        self._pattern: Optional["re.Pattern[str]"] = None
+        self._ordered_pattern: Optional["re.Pattern[str]"] = None
+
+        tokens = _tokenize(format)
+        directives = [token for is_directive, token in tokens if is_directive]
+        if any(directive not in _DIRECTIVE_PATTERNS for directive in directives) or len(set(directives)) != len(directives):
+            return
+        self._has_offset = "z" in directives
+        # As for strptime, literals are case insensitive and whitespaces match any whitespace
+        self._pattern = re.compile(
+            "".join(_DIRECTIVE_PATTERNS[token] if is_directive else _literal_pattern(token) for is_directive, token in tokens),
+            re.IGNORECASE,
+        )
+
+        significances = [list(_ORDERED_DIRECTIVE_PATTERNS).index(directive) for directive in directives if directive != "z"]
+        offset_is_last = not self._has_offset or tokens[-1] == (True, "z")
+        if significances == sorted(significances) and offset_is_last:
+            self._ordered_pattern = re.compile(
+                "".join(
+                    _ORDERED_DIRECTIVE_PATTERNS[token] if is_directive and token != "z" else "" if is_directive else re.escape(token)
+                    for is_directive, token in tokens
+                )
+                + (r"(?P<z>[+-]\d\d:?\d\d|Z)" if self._has_offset else "")
+            )
+
+    def parse(self, date: str) -> Optional[datetime.datetime]:
+        """
+        :return: the datetime, or None if the value does not match the format or is parsed more accurately by strptime
+        """
+        if not self._pattern:
+            return None
+        match = self._pattern.fullmatch(date)
+        if not match:
+            return None
+        values = match.groupdict()
+        try:
+            return datetime.datetime(
+                int(values.get("Y") or 1900),
+                int(values.get("m") or 1),
+                int(values.get("d") or 1),
+                int(values.get("H") or 0),
+                int(values.get("M") or 0),
+                int(values.get("S") or 0),
+                int((values.get("f") or "0").ljust(6, "0")),
+                _parse_offset(values["z"]) if self._has_offset else None,
+            )
+        except ValueError:
+            # strptime raises the error, or handles the value, e.g. an offset with seconds
+            return None
+
+    def are_ordered(self, first: str, second: str) -> bool:
+        """
+        :return: True if the lexicographic order of the values is their chronological order
+        """
+        if not self._ordered_pattern:
+            return False
+        first_match, second_match = self._ordered_pattern.fullmatch(first), self._ordered_pattern.fullmatch(second)
+        if not first_match or not second_match:
+            return False
+        # Values in different time zones are only ordered once converted to the same time zone
+        return not self._has_offset or first_match.group("z") == second_match.group("z")
+
+
+@lru_cache(maxsize=256)
+def _compile_format(format: str) -> _CompiledFormat:
+    return _CompiledFormat(format)
+
+
+def _tokenize(format: str) -> List[Tuple[bool, str]]:
+    """
+    :return: the directives, without their "%", and the literals between them, each with whether it is a directive
+    """
+    tokens: List[Tuple[bool, str]] = []
+    literal = ""
+    index = 0
+    while index < len(format):
+        if format[index] == "%":
+            # A stray "%" at the end of the format is an unsupported directive
+            if format[index + 1 : index + 2] == "%":
+                literal += "%"
+            else:
+                if literal:
+                    tokens.append((False, literal))
+                    literal = ""
+                tokens.append((True, format[index + 1 : index + 2]))
+            index += 2
+        else:
+            literal += format[index]
+            index += 1
+    if literal:
+        tokens.append((False, literal))
+    return tokens
+
+
+def _literal_pattern(literal: str) -> str:
+    return r"\s+".join(re.escape(part) for part in re.split(r"\s+", literal))
+
+
+@lru_cache(maxsize=256)
+def _parse_offset(offset: str) -> datetime.timezone:
+    if offset == "Z":
+        return datetime.timezone.utc
+    offset = offset.replace(":", "")
+    if len(offset) != 5:
+        # Offsets with seconds are left to strptime
+        raise ValueError(offset)
+    minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+    return datetime.timezone(datetime.timedelta(minutes=-minutes if offset[0] == "-" else minutes))
@@ -13,6 +13,7 @@ from airbyte_cdk.sources.declarative.schema.schema_loader import SchemaLoader
 from airbyte_cdk.sources.declarative.transformations import RecordTransformation
 from airbyte_cdk.sources.declarative.types import Config, StreamSlice
 from airbyte_cdk.sources.streams.core import Stream, StreamData
+from airbyte_cdk.utils.stream_profiler import TRANSFORMATION, stream_profiler
 
 
 @dataclass
@@ -121,8 +122,11 @@ class DeclarativeStream(Stream):
             raise ValueError(
                 f"Unexpected record type. Expected {StreamData}. Got {type(message_or_record_data)}. This is probably due to a bug in the CDK."
             )
-        for transformation in self.transformations:
-            transformation.transform(record, config=config, stream_state=self.state, stream_slice=stream_slice)
+        if self.transformations:
+            stream_state = self.state
+            with stream_profiler.stage(TRANSFORMATION):
+                for transformation in self.transformations:
+                    transformation.transform(record, config=config, stream_state=stream_state, stream_slice=stream_slice)
 
         return message_or_record_data
 
@@ -7,6 +7,7 @@ from typing import Any, List, Mapping, Union
 
 import requests
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
+from airbyte_cdk.utils.stream_profiler import RESPONSE_DECODE, stream_profiler
 
 
 @dataclass
@@ -19,6 +20,7 @@ class JsonDecoder(Decoder):
 
     def decode(self, response: requests.Response) -> Union[Mapping[str, Any], List]:
         try:
-            return response.json()
+            with stream_profiler.stage(RESPONSE_DECODE):
+                return response.json()
         except requests.exceptions.JSONDecodeError:
             return {}
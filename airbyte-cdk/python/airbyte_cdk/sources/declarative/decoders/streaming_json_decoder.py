@@ -0,0 +1,300 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import codecs
+import json
+import re
+from dataclasses import InitVar, dataclass
+from typing import Any, Generator, Iterable, Iterator, List, Mapping, NoReturn, Union
+from weakref import WeakKeyDictionary
+
+import requests
+from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+
+WILDCARD = "*"
+# Size of the chunks of the response body read at once
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE_CHARACTERS = " \t\n\r"
+_WHITESPACE = re.compile(f"[{_WHITESPACE_CHARACTERS}]*")
+_NUMBER_CHARACTERS = re.compile(r"[0-9.eE+-]*")
+# What remains of the documents once their records are extracted, by response
+_remainders: "WeakKeyDictionary[requests.Response, Any]" = WeakKeyDictionary()
+
+
+@dataclass
+class StreamingJsonDecoder(JsonDecoder):
+    """
+    Decoder parsing the response incrementally so that the records of very large responses are extracted as the body is read, without
+    loading the whole document in memory. Set it as the decoder of the DpathExtractor and of the paginator:
+
+    ```
+      extractor:
+        type: DpathExtractor
+        field_path: ["data"]
+        decoder:
+          type: StreamingJsonDecoder
+    ```
+
+    The response is read as a stream and the values of the document are decoded one at a time with the json module. The records are
+    the values at the field path of the extractor and are passed on as they are decoded. The rest of the document is kept so that the
+    paginator decoding the response gets it without the records, reading the records from it raises an error: use last_records to define
+    pagination tokens. Only the number of records of the response and its last record are kept for the paginator, so last_records only
+    supports `last_records[-1]` and its length.
+    """
+
+    parameters: InitVar[Mapping[str, Any]]
+
+    def decode(self, response: requests.Response) -> Union[Mapping[str, Any], List]:
+        if response in _remainders:
+            return _remainders[response]
+        return super().decode(response)
+
+    def decode_records(self, response: requests.Response, field_path: List[str]) -> Iterable[Any]:
+        """
+        Yields the records of the response as they are parsed, with the same semantic as the DpathExtractor: the items of the array at the
+        field path, or the value itself if it is not an array. Each value matched by a path containing wildcards is a record.
+
+        :param response: the response to decode
+        :param field_path: the path of the records, made of object keys, array indexes and wildcards
+        :return: the records of the response
+        """
+        reader = _JsonReader(_iterate_text(response))
+        remainder = {}
+        has_records = False
+        try:
+            if reader.peek():
+                records = _extract(reader, field_path, WILDCARD in field_path)
+                while True:
+                    try:
+                        record = next(records)
+                    except StopIteration as extraction:
+                        remainder = extraction.value
+                        break
+                    has_records = True
+                    yield record
+        except json.JSONDecodeError:
+            if has_records:
+                # The records already returned must not be taken for a complete page
+                raise
+            # As for JsonDecoder, a response which is not JSON does not have any record
+        finally:
+            if response.raw is not None:
+                # Releases the connection if the records were not all read
+                response.close()
+        _remainders[response] = remainder
+
+
+class StreamedRecords:
+    """
+    The records of a streamed response as given to the paginator: only their number and the last of them are kept in memory
+    """
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._last_record: Any = None
+
+    def append(self, record: Any) -> None:
+        self._count += 1
+        self._last_record = record
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Any:
+        if not self._count:
+            raise IndexError("The response does not have any record")
+        if isinstance(index, int) and index in (-1, self._count - 1):
+            return self._last_record
+        raise ValueError(f"Only the last record of a response decoded by a StreamingJsonDecoder is kept, got index {index}")
+
+    def __iter__(self) -> NoReturn:
+        raise ValueError("Only the last record of a response decoded by a StreamingJsonDecoder is kept, it can not be iterated over")
+
+
+class _ExtractedRecords:
+    """
+    Takes the place of the records in what remains of the document, so that reading them fails instead of finding a document without them
+    """
+
+    def _fail(self, *args: Any) -> NoReturn:
+        raise ValueError(
+            "The records of a response decoded by a StreamingJsonDecoder are not kept in the decoded document, use last_records instead"
+        )
+
+    __getitem__ = __iter__ = __len__ = __bool__ = __contains__ = __str__ = _fail
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        self._fail()
+
+    def __repr__(self) -> str:
+        return "<extracted records>"
+
+
+# Marks the values which were all extracted as records
+_EXTRACTED = _ExtractedRecords()
+
+
+def _iterate_text(response: requests.Response) -> Iterator[str]:
+    # The body is decoded as it is read to avoid keeping a copy of it as text
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    # A response created without a connection only has its content
+    chunks = response.iter_content(chunk_size=CHUNK_SIZE) if response.raw is not None else [response.content or b""]
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+class _JsonReader:
+    """
+    Reads the JSON values of a text arriving in chunks, keeping in memory the part of the text which is not read yet
+    """
+
+    def __init__(self, chunks: Iterator[str]):
+        self._chunks = chunks
+        self._buffer = ""
+        self._position = 0
+        self._complete = False
+        self._scan_once = json.JSONDecoder().scan_once
+
+    def peek(self) -> str:
+        """
+        :return: the next character which is not a whitespace, or an empty string at the end of the text
+        """
+        while True:
+            if self._position < len(self._buffer):
+                char = self._buffer[self._position]
+                if char not in _WHITESPACE_CHARACTERS:
+                    return char
+                self._position = _WHITESPACE.match(self._buffer, self._position).end()
+                if self._position < len(self._buffer):
+                    return self._buffer[self._position]
+            if not self._read_chunk():
+                return ""
+
+    def read_char(self, *expected: str) -> str:
+        """
+        :param expected: the characters the next character can be
+        :return: the next character which is not a whitespace
+        """
+        char = self.peek()
+        if char not in expected:
+            raise json.JSONDecodeError(f"Expecting one of {expected}", self._buffer, self._position)
+        self._position += 1
+        return char
+
+    def read_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._scan_once(self._buffer, self._position)
+                # A number can continue in the next chunk until a character which is not part of a number follows it
+                if self._complete or not _is_number(value) or not _NUMBER_CHARACTERS.fullmatch(self._buffer, end):
+                    self._position = end
+                    return value
+            except StopIteration as error:
+                # The scanner raises StopIteration when there is no value at all at the position
+                if self._complete:
+                    raise json.JSONDecodeError("Expecting value", self._buffer, error.value) from None
+            except json.JSONDecodeError:
+                if self._complete:
+                    raise
+            # Reading at least as much as what is buffered keeps the number of decoding attempts of a large value logarithmic
+            unread = len(self._buffer) - self._position
+            while len(self._buffer) - self._position < 2 * unread and self._read_chunk():
+                pass
+
+    def read_items(self) -> Iterator[Any]:
+        """
+        Yields the items of the array starting at the position of the reader
+        """
+        self.read_char("[")
+        if self.peek() == "]":
+            self.read_char("]")
+            return
+        while True:
+            # Items which are followed by a separator in the buffer are complete, they are decoded without the checks of read_value
+            buffer, position = self._buffer, self._position
+            try:
+                value, end = self._scan_once(buffer, position)
+                end = _WHITESPACE.match(buffer, end).end()
+                separator = buffer[end : end + 1]
+            except (StopIteration, json.JSONDecodeError):
+                separator = ""
+            if separator in (",", "]") and separator:
+                self._position = end + 1
+            else:
+                value = self.read_value()
+                separator = self.read_char(",", "]")
+            yield value
+            if separator == "]":
+                return
+            self.peek()
+
+    def _read_chunk(self) -> bool:
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._complete = True
+            return False
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _extract(reader: _JsonReader, path: List[str], matches_values: bool) -> Generator[Any, None, Any]:
+    """
+    Yields the records of the next value of the reader.
+
+    :return: the value without its records, or _EXTRACTED if the whole value was extracted
+    """
+    if not path:
+        if matches_values:
+            yield reader.read_value()
+        elif reader.peek() == "[":
+            yield from reader.read_items()
+        else:
+            value = reader.read_value()
+            if value:
+                yield value
+        return _EXTRACTED
+
+    key, remaining_path = path[0], path[1:]
+    char = reader.peek()
+    if char == "{":
+        reader.read_char("{")
+        remainder = {}
+        if reader.peek() == "}":
+            reader.read_char("}")
+            return remainder
+        while True:
+            member_key = reader.read_value()
+            reader.read_char(":")
+            if key == WILDCARD or member_key == key:
+                remainder[member_key] = yield from _extract(reader, remaining_path, matches_values)
+            else:
+                remainder[member_key] = reader.read_value()
+            if reader.read_char(",", "}") == "}":
+                return remainder
+    elif char == "[":
+        reader.read_char("[")
+        remainder = []
+        if reader.peek() == "]":
+            reader.read_char("]")
+            return remainder
+        index = 0
+        while True:
+            if key == WILDCARD or key == str(index):
+                remainder.append((yield from _extract(reader, remaining_path, matches_values)))
+            else:
+                remainder.append(reader.read_value())
+            index += 1
+            if reader.read_char(",", "]") == "]":
+                return remainder
+    return reader.read_value()
@@ -3,16 +3,22 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Union
+from typing import Any, Iterable, List, Mapping, Union
 
 import dpath.util
 import requests
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.types import Config, Record
 
+# Path keys which dpath interprets as glob patterns, except for the wildcard key
+_GLOB_CHARACTERS = frozenset("*?[")
+_WILDCARD = "*"
+_MISSING = object()
+
 
 @dataclass
 class DpathExtractor(RecordExtractor):
@@ -62,20 +68,74 @@ class DpathExtractor(RecordExtractor):
         for path_index in range(len(self.field_path)):
             if isinstance(self.field_path[path_index], str):
                 self.field_path[path_index] = InterpolatedString.create(self.field_path[path_index], parameters=parameters)
+        # Keys without any template always evaluate to the same value so they are only evaluated once
+        self._path = [path if "{" in path.string else path.eval(self.config) for path in self.field_path]
+
+    def extract_records(self, response: requests.Response) -> Iterable[Record]:
+        path = [path.eval(self.config) if isinstance(path, InterpolatedString) else path for path in self._path]
+        path = [str(key) if isinstance(key, int) else key for key in path]
+        is_glob = not all(isinstance(key, str) and (key == _WILDCARD or not _GLOB_CHARACTERS.intersection(key)) for key in path)
+        if isinstance(self.decoder, StreamingJsonDecoder) and not is_glob:
+            # The records are decoded as they are read
+            return self.decoder.decode_records(response, path)
 
-    def extract_records(self, response: requests.Response) -> List[Record]:
         response_body = self.decoder.decode(response)
-        if len(self.field_path) == 0:
+        if len(path) == 0:
             extracted = response_body
+        elif is_glob:
+            # Glob patterns are matched by dpath
+            extracted = dpath.util.values(response_body, path) if _WILDCARD in path else dpath.util.get(response_body, path, default=[])
+        elif _WILDCARD in path:
+            # Each matched value is a record, so the values are yielded as the body is walked without being wrapped
+            return _iterate_matching_values(response_body, path)
         else:
-            path = [path.eval(self.config) for path in self.field_path]
-            if "*" in path:
-                extracted = dpath.util.values(response_body, path)
-            else:
-                extracted = dpath.util.get(response_body, path, default=[])
+            extracted = _get_value(response_body, path, default=[])
         if isinstance(extracted, list):
             return extracted
         elif extracted:
             return [extracted]
         else:
             return []
+
+
+def _get_child(node: Any, key: str, default: Any) -> Any:
+    if isinstance(node, dict):
+        return node.get(key, default)
+    if isinstance(node, list) and key.isdecimal() and str(int(key)) == key and int(key) < len(node):
+        # dpath matches list indexes as strings
+        return node[int(key)]
+    return default
+
+
+def _get_value(body: Any, path: List[str], default: Any) -> Any:
+    """
+    Same as dpath.util.get for a path without wildcard, by indexing the body instead of matching the path against every node of the body
+    """
+    node = body
+    for key in path:
+        node = _get_child(node, key, _MISSING)
+        if node is _MISSING:
+            return default
+    return node
+
+
+def _iterate_matching_values(node: Any, path: List[str]) -> Iterable[Any]:
+    """
+    Same as dpath.util.values for a path containing wildcards, yielding the values as the body is walked
+    """
+    key, remaining_path = path[0], path[1:]
+    if key != _WILDCARD:
+        child = _get_child(node, key, _MISSING)
+        children = [] if child is _MISSING else [child]
+    elif isinstance(node, dict):
+        children = node.values()
+    elif isinstance(node, list):
+        children = node
+    else:
+        children = []
+
+    if not remaining_path:
+        yield from children
+    else:
+        for child in children:
+            yield from _iterate_matching_values(child, remaining_path)
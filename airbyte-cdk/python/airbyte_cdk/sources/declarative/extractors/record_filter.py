@@ -3,7 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Optional
+from typing import Any, Iterable, Mapping, Optional
 
 from airbyte_cdk.sources.declarative.interpolation.interpolated_boolean import InterpolatedBoolean
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
@@ -27,12 +27,16 @@ class RecordFilter:
 
     def filter_records(
         self,
-        records: List[Record],
+        records: Iterable[Record],
         stream_state: StreamState,
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
-    ) -> List[Record]:
-        kwargs = {"stream_state": stream_state, "stream_slice": stream_slice, "next_page_token": next_page_token}
-        for record in records:
-            if self._filter_interpolator.eval(self.config, record=record, **kwargs):
-                yield record
+    ) -> Iterable[Record]:
+        # The context of the condition is the same for all the records of the page so it is only built once
+        is_selected = self._filter_interpolator.evaluator(
+            self.config, stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token
+        )
+        if not isinstance(records, list):
+            # Records streamed from the response are filtered as they are read
+            return (record for record in records if is_selected(record=record))
+        return [record for record in records if is_selected(record=record)]
@@ -2,6 +2,7 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+from airbyte_cdk.sources.declarative.incremental.adaptive_step import AdaptiveStep
 from airbyte_cdk.sources.declarative.incremental.datetime_based_cursor import DatetimeBasedCursor
 
-__all__ = ["DatetimeBasedCursor"]
+__all__ = ["AdaptiveStep", "DatetimeBasedCursor"]
@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+from dataclasses import InitVar, dataclass
+from typing import Any, Mapping, Optional, Union
+
+from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.types import Config
+from isodate import Duration, parse_duration
+
+
+@dataclass
+class AdaptiveStep:
+    """
+    Adapts the size of the time windows of a DatetimeBasedCursor to the density of the data: the window doubles after a slice with fewer
+    than min_records_per_slice records and shrinks after a slice with more than max_records_per_slice records or taking longer than
+    max_slice_duration to be read, proportionally to how far the slice went past the limit.
+
+    Attributes:
+        min_step (Union[InterpolatedString, str]): smallest size of the time window (ISO8601 duration)
+        max_step (Union[InterpolatedString, str]): largest size of the time window (ISO8601 duration)
+        config (Config): connection config
+        min_records_per_slice (int): number of records under which the window grows
+        max_records_per_slice (Optional[int]): number of records above which the window shrinks
+        max_slice_duration (Optional[Union[InterpolatedString, str]]): time to read a slice above which the window shrinks (ISO8601 duration)
+    """
+
+    min_step: Union[InterpolatedString, str]
+    max_step: Union[InterpolatedString, str]
+    config: Config
+    parameters: InitVar[Mapping[str, Any]]
+    min_records_per_slice: int = 1
+    max_records_per_slice: Optional[int] = None
+    max_slice_duration: Optional[Union[InterpolatedString, str]] = None
+
+    def __post_init__(self, parameters: Mapping[str, Any]):
+        self._min_step = self._parse_timedelta(self.min_step, parameters)
+        self._max_step = self._parse_timedelta(self.max_step, parameters)
+        if self._min_step <= datetime.timedelta(0) or self._min_step > self._max_step:
+            raise ValueError(
+                f"The min_step of the adaptive step should be positive and at most its max_step. "
+                f"Right now, min_step is `{self.min_step}` and max_step is `{self.max_step}`"
+            )
+        self._max_slice_duration = self._parse_timedelta(self.max_slice_duration, parameters) if self.max_slice_duration else None
+
+    def next_step(self, step: datetime.timedelta, records: int, slice_duration: datetime.timedelta) -> datetime.timedelta:
+        """
+        :param step: size of the time window of the slice which was read
+        :param records: number of records of the slice
+        :param slice_duration: time it took to read the slice
+        :return: size of the time window of the next slice
+        """
+        overload = 1.0
+        if self.max_records_per_slice and records > self.max_records_per_slice:
+            overload = records / self.max_records_per_slice
+        if self._max_slice_duration and slice_duration > self._max_slice_duration:
+            overload = max(overload, slice_duration / self._max_slice_duration)
+
+        if overload > 1:
+            next_step = step / max(overload, 2)
+        elif records < self.min_records_per_slice:
+            next_step = step * 2
+        else:
+            next_step = step
+        return min(max(next_step, self._min_step), self._max_step)
+
+    def _parse_timedelta(self, duration: Union[InterpolatedString, str], parameters: Mapping[str, Any]) -> datetime.timedelta:
+        duration = parse_duration(InterpolatedString.create(duration, parameters=parameters).eval(self.config))
+        if isinstance(duration, Duration):
+            # Months and years do not have a fixed length, so they cannot be scaled
+            raise ValueError(f"The durations of the adaptive step should be expressed in weeks or smaller units. Got {duration}")
+        return duration
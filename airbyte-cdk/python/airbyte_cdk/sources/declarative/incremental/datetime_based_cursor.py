@@ -3,12 +3,14 @@
 #
 
 import datetime
+import time
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Iterable, Mapping, Optional, Union
+from typing import Any, Iterable, Mapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.declarative.datetime.datetime_parser import DatetimeParser
 from airbyte_cdk.sources.declarative.datetime.min_max_datetime import MinMaxDatetime
+from airbyte_cdk.sources.declarative.incremental.adaptive_step import AdaptiveStep
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
@@ -25,7 +27,10 @@ class DatetimeBasedCursor(StreamSlicer):
     Given a start time, end time, a step function, and an optional lookback window,
     the stream slicer will partition the date range from start time - lookback window to end time.
 
-    The step function is defined as a string of the form ISO8601 duration
+    The step function is defined as a string of the form ISO8601 duration. With an adaptive step, the size of each window depends on the
+    number of records and on the time it took to read the previous slice. The next slice is only created once the previous one is read,
+    which is the case when the slices of the cursor are read one after the other: when the slices are created ahead of time, e.g. by a
+    CartesianProductStreamSlicer, windows keep the size of the step.
 
     The timestamp format accepts the same format codes as datetime.strfptime, which are
     all the format codes required by the 1989 C standard.
@@ -44,6 +49,7 @@ class DatetimeBasedCursor(StreamSlicer):
         partition_field_start (Optional[str]): partition start time field
         partition_field_end (Optional[str]): stream slice end time field
         lookback_window (Optional[InterpolatedString]): how many days before start_datetime to read data for (ISO8601 duration)
+        adaptive_step (Optional[AdaptiveStep]): adapts the size of the time windows to the density of the data, starting from step
     """
 
     start_datetime: Union[MinMaxDatetime, str]
@@ -61,6 +67,7 @@ class DatetimeBasedCursor(StreamSlicer):
     partition_field_start: Optional[str] = None
     partition_field_end: Optional[str] = None
     lookback_window: Optional[Union[InterpolatedString, str]] = None
+    adaptive_step: Optional[AdaptiveStep] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]):
         if (self.step and not self.cursor_granularity) or (not self.step and self.cursor_granularity):
@@ -82,11 +89,24 @@ class DatetimeBasedCursor(StreamSlicer):
             else datetime.timedelta.max
         )
         self._cursor_granularity = self._parse_timedelta(self.cursor_granularity)
+        if self.adaptive_step and not (
+            self.step and isinstance(self._step, datetime.timedelta) and isinstance(self._cursor_granularity, datetime.timedelta)
+        ):
+            raise ValueError(
+                f"An adaptive step needs a step and a cursor_granularity expressed in weeks or smaller units. "
+                f"Right now, step is `{self.step}` and cursor_granularity is `{self.cursor_granularity}`"
+            )
+        # Window of the last slice created with an adaptive step, with its number of requests and records
+        self._adaptive_slice = None
+        self._adaptive_slice_requests = 0
+        self._adaptive_slice_records = 0
         self.cursor_field = InterpolatedString.create(self.cursor_field, parameters=parameters)
         self.lookback_window = InterpolatedString.create(self.lookback_window, parameters=parameters)
         self.partition_field_start = InterpolatedString.create(self.partition_field_start or "start_time", parameters=parameters)
         self.partition_field_end = InterpolatedString.create(self.partition_field_end or "end_time", parameters=parameters)
         self._parser = DatetimeParser()
+        # Value of the cursor along with its parsed datetime, so that the cursor is not parsed again for every record
+        self._parsed_cursor: Optional[Tuple[Any, datetime.datetime]] = None
 
         # If datetime format is not specified then start/end datetime should inherit it from the stream slicer
         if not self.start_datetime.datetime_format:
@@ -109,17 +129,15 @@ class DatetimeBasedCursor(StreamSlicer):
         stream_slice_value = stream_slice.get(self.cursor_field.eval(self.config))
         stream_slice_value_end = stream_slice.get(self.partition_field_end.eval(self.config))
         last_record_value = last_record.get(self.cursor_field.eval(self.config)) if last_record else None
-        cursor = None
-        if stream_slice_value and last_record_value:
-            cursor = max(stream_slice_value, last_record_value)
-        elif stream_slice_value:
-            cursor = stream_slice_value
-        else:
-            cursor = last_record_value
-        if self._cursor and cursor:
-            self._cursor = max(cursor, self._cursor)
-        elif cursor:
-            self._cursor = cursor
+        if last_record and self._is_adaptive_slice(stream_slice):
+            self._adaptive_slice_records += 1
+        # The cursor is the max of its value, the start of the slice and the last record. Each value is compared with the current value
+        # of the cursor, whose parsed datetime is kept, so that only the new value is parsed
+        for value in (stream_slice_value, last_record_value):
+            if self._cursor and value:
+                self._cursor = self._max_cursor_value(value, self._cursor)
+            elif value:
+                self._cursor = value
         if self.partition_field_end:
             self._cursor_end = stream_slice_value_end
 
@@ -143,6 +161,8 @@ class DatetimeBasedCursor(StreamSlicer):
         cursor_datetime = self._calculate_cursor_datetime_from_state(stream_state)
         start_datetime = max(earliest_possible_start_datetime, cursor_datetime) - lookback_delta
 
+        if self.adaptive_step:
+            return self._partition_daterange_adaptively(start_datetime, end_datetime)
         return self._partition_daterange(start_datetime, end_datetime, self._step)
 
     def _select_best_end_datetime(self, kwargs):
@@ -156,6 +176,26 @@ class DatetimeBasedCursor(StreamSlicer):
             return self.parse_date(stream_state[self.cursor_field.eval(self.config)])
         return datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
 
+    def _max_cursor_value(self, value: Any, cursor: Any) -> Any:
+        """
+        :param value: a value of the cursor field
+        :param cursor: the current value of the cursor
+        :return: the latest of the value and the cursor, the value if they are the same datetime
+        """
+        try:
+            if self._parser.are_ordered(value, cursor, self.datetime_format):
+                return value if value >= cursor else cursor
+            value_datetime = self.parse_date(value)
+            if self._parsed_cursor is None or self._parsed_cursor[0] != cursor:
+                self._parsed_cursor = (cursor, self.parse_date(cursor))
+            if value_datetime >= self._parsed_cursor[1]:
+                self._parsed_cursor = (value, value_datetime)
+                return value
+            return cursor
+        except ValueError:
+            # Values which are not in the datetime format are compared as they are
+            return max(value, cursor)
+
     def _format_datetime(self, dt: datetime.datetime):
         return self._parser.format(dt, self.datetime_format)
 
@@ -170,6 +210,39 @@ class DatetimeBasedCursor(StreamSlicer):
             start = next_start
         return dates
 
+    def _partition_daterange_adaptively(self, start: datetime.datetime, end: datetime.datetime) -> Iterable[StreamSlice]:
+        start_field = self.partition_field_start.eval(self.config)
+        end_field = self.partition_field_end.eval(self.config)
+        step = self._step
+        while start <= end:
+            next_start = self._evaluate_next_start_date_safely(start, step)
+            end_date = self._get_date(next_start - self._cursor_granularity, end, min)
+            stream_slice = {start_field: self._format_datetime(start), end_field: self._format_datetime(end_date)}
+            self._adaptive_slice = (stream_slice[start_field], stream_slice[end_field])
+            self._adaptive_slice_requests = 0
+            self._adaptive_slice_records = 0
+            slice_started_at = time.monotonic()
+            yield stream_slice
+
+            # The slice is read once the next one is requested, unless no request was sent for it
+            if self._adaptive_slice_requests or self._adaptive_slice_records:
+                slice_duration = datetime.timedelta(seconds=time.monotonic() - slice_started_at)
+                step = self.adaptive_step.next_step(step, self._adaptive_slice_records, slice_duration)
+                # Windows stay a multiple of the granularity of the cursor for the slices to neither overlap nor leave gaps
+                step = max(step - step % self._cursor_granularity, self._cursor_granularity)
+            start = next_start
+
+    def _is_adaptive_slice(self, stream_slice: Optional[StreamSlice]) -> bool:
+        return (
+            self._adaptive_slice is not None
+            and stream_slice is not None
+            and (
+                stream_slice.get(self.partition_field_start.eval(self.config)),
+                stream_slice.get(self.partition_field_end.eval(self.config)),
+            )
+            == self._adaptive_slice
+        )
+
     def _evaluate_next_start_date_safely(self, start, step):
         """
         Given that we set the default step at datetime.timedelta.max, we will generate an OverflowError when evaluating the next start_date
@@ -204,6 +277,9 @@ class DatetimeBasedCursor(StreamSlicer):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, Any]:
+        # Request parameters are requested once per request sent for the slice
+        if self._is_adaptive_slice(stream_slice):
+            self._adaptive_slice_requests += 1
         return self._get_request_options(RequestOptionType.request_parameter, stream_slice)
 
     def get_request_headers(
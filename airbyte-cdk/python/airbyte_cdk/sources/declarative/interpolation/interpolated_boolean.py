@@ -3,7 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, Final, List, Mapping
+from typing import Any, Callable, Final, List, Mapping
 
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from airbyte_cdk.sources.declarative.types import Config
@@ -42,7 +42,26 @@ class InterpolatedBoolean:
             evaluated = self._interpolation.eval(
                 self.condition, config, self._default, parameters=self._parameters, **additional_parameters
             )
-            if evaluated in FALSE_VALUES:
-                return False
-            # The presence of a value is generally regarded as truthy, so we treat it as such
-            return True
+            return _is_true(evaluated)
+
+    def evaluator(self, config: Config, **additional_parameters) -> Callable[..., bool]:
+        """
+        Prepares the evaluation of the predicate for many evaluations sharing the same config and arguments, e.g. the records of a page.
+
+        :param config: The user-provided configuration as specified by the source's spec
+        :param additional_parameters: Optional parameters used for all the evaluations
+        :return: A function evaluating the predicate with the parameters it is called with, e.g. `evaluate(record=record)`
+        """
+        if isinstance(self.condition, bool):
+            return lambda **parameters: self.condition
+        evaluate = self._interpolation.evaluator(
+            self.condition, config, self._default, parameters=self._parameters, **additional_parameters
+        )
+        return lambda **parameters: _is_true(evaluate(**parameters))
+
+
+def _is_true(evaluated: Any) -> bool:
+    if evaluated in FALSE_VALUES:
+        return False
+    # The presence of a value is generally regarded as truthy, so we treat it as such
+    return True
@@ -3,7 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, Mapping, Optional, Union
+from typing import Any, Callable, Mapping, Optional, Union
 
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from airbyte_cdk.sources.declarative.types import Config
@@ -39,6 +39,16 @@ class InterpolatedString:
         """
         return self._interpolation.eval(self.string, config, self.default, parameters=self._parameters, **kwargs)
 
+    def evaluator(self, config: Config, **kwargs) -> Callable[..., Any]:
+        """
+        Prepares the interpolation of the string for many evaluations sharing the same config and arguments, e.g. the records of a page.
+
+        :param config: The user-provided configuration as specified by the source's spec
+        :param kwargs: Optional parameters used for all the interpolations
+        :return: A function interpolating the string with the parameters it is called with, e.g. `evaluate(record=record)`
+        """
+        return self._interpolation.evaluator(self.string, config, self.default, parameters=self._parameters, **kwargs)
+
     def __eq__(self, other):
         if not isinstance(other, InterpolatedString):
             return False
@@ -3,16 +3,23 @@
 #
 
 import ast
-from typing import Optional
+import copy
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple
 
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
 from airbyte_cdk.sources.declarative.types import Config
-from jinja2 import meta
+from jinja2 import Template, meta
 from jinja2.exceptions import UndefinedError
 from jinja2.sandbox import Environment
 
+# Jinja only interprets strings containing one of these
+_JINJA_BLOCK_STARTS = ("{{", "{%", "{#")
+# Literal values which can be returned from the cache without being copied
+_IMMUTABLE_LITERAL_TYPES = (str, int, float, bool, complex, bytes, type(None))
+
 
 class JinjaInterpolation(Interpolation):
     """
@@ -49,27 +56,44 @@ class JinjaInterpolation(Interpolation):
     RESTRICTED_BUILTIN_FUNCTIONS = ["range"]  # The range function can cause very expensive computations
 
     def __init__(self):
-        self._environment = Environment()
-        self._environment.filters.update(**filters)
-        self._environment.globals.update(**macros)
-
-        for extension in self.RESTRICTED_EXTENSIONS:
-            self._environment.extensions.pop(extension, None)
-        for builtin in self.RESTRICTED_BUILTIN_FUNCTIONS:
-            self._environment.globals.pop(builtin, None)
+        # The environment is identical for every interpolation, sharing it lets the compiled templates be cached once for all of them
+        self._environment = _ENVIRONMENT
 
     def eval(self, input_str: str, config: Config, default: Optional[str] = None, **additional_parameters):
-        context = {"config": config, **additional_parameters}
+        return self._interpolate(input_str, self._create_context(config, additional_parameters), default)
+
+    def evaluator(self, input_str: str, config: Config, default: Optional[str] = None, **additional_parameters) -> Callable[..., Any]:
+        """
+        Prepares the interpolation of a string evaluated many times with the same config and parameters, e.g. once per record of a page.
+
+        :param input_str: The string to interpolate
+        :param config: The user-provided configuration as specified by the source's spec
+        :param default: Default value to return if the evaluation returns an empty string
+        :param additional_parameters: Parameters shared by all the evaluations
+        :return: A function interpolating the string like eval, with the parameters it is called with added to the shared ones
+        """
+        context = self._create_context(config, additional_parameters)
+
+        def evaluate(**parameters):
+            return self._interpolate(input_str, self._add_aliases({**context, **parameters}, parameters), default)
+
+        return evaluate
 
+    def _create_context(self, config: Config, parameters: Mapping[str, Any]) -> Dict[str, Any]:
+        return self._add_aliases({"config": config, **parameters}, parameters)
+
+    def _add_aliases(self, context: Dict[str, Any], parameters: Mapping[str, Any]) -> Dict[str, Any]:
         for alias, equivalent in self.ALIASES.items():
-            if alias in context:
+            if alias in parameters:
                 # This is unexpected. We could ignore or log a warning, but failing loudly should result in fewer surprises
                 raise ValueError(
                     f"Found reserved keyword {alias} in interpolation context. This is unexpected and indicative of a bug in the CDK."
                 )
-            elif equivalent in context:
-                context[alias] = context[equivalent]
+            elif equivalent in parameters:
+                context[alias] = parameters[equivalent]
+        return context
 
+    def _interpolate(self, input_str: str, context: Mapping[str, Any], default: Optional[str]):
         try:
             if isinstance(input_str, str):
                 result = self._eval(input_str, context)
@@ -84,20 +108,69 @@ class JinjaInterpolation(Interpolation):
         return self._literal_eval(self._eval(default, context))
 
     def _literal_eval(self, result):
-        try:
-            return ast.literal_eval(result)
-        except (ValueError, SyntaxError):
+        if not isinstance(result, str):
+            try:
+                return ast.literal_eval(result)
+            except (ValueError, SyntaxError):
+                return result
+        is_literal, value = _parse_literal(result)
+        if not is_literal:
             return result
+        # Containers are copied so that callers modifying them do not alter the cached value
+        return value if isinstance(value, _IMMUTABLE_LITERAL_TYPES) else copy.deepcopy(value)
 
     def _eval(self, s: str, context):
+        if isinstance(s, str) and _is_static(s):
+            # Rendering a string without any template block returns the string itself
+            return s
         try:
-            ast = self._environment.parse(s)
-            undeclared = meta.find_undeclared_variables(ast)
+            template, undeclared = _compile(s)
             undeclared_not_in_context = {var for var in undeclared if var not in context}
             if undeclared_not_in_context:
                 raise ValueError(f"Jinja macro has undeclared variables: {undeclared_not_in_context}. Context: {context}")
-            return self._environment.from_string(s).render(context)
+            return template.render(context)
         except TypeError:
             # The string is a static value, not a jinja template
             # It can be returned as is
             return s
+
+
+def _create_environment() -> Environment:
+    environment = Environment()
+    environment.filters.update(**filters)
+    environment.globals.update(**macros)
+
+    for extension in JinjaInterpolation.RESTRICTED_EXTENSIONS:
+        environment.extensions.pop(extension, None)
+    for builtin in JinjaInterpolation.RESTRICTED_BUILTIN_FUNCTIONS:
+        environment.globals.pop(builtin, None)
+    return environment
+
+
+_ENVIRONMENT = _create_environment()
+
+
+@lru_cache(maxsize=4096)
+def _compile(s: str) -> Tuple[Template, FrozenSet[str]]:
+    """
+    :return: the compiled template and the variables it uses, which are cached as templates are evaluated for every record or request
+    """
+    ast = _ENVIRONMENT.parse(s)
+    undeclared = frozenset(meta.find_undeclared_variables(ast))
+    return _ENVIRONMENT.from_string(s), undeclared
+
+
+def _is_static(s: str) -> bool:
+    # Jinja also normalizes line endings and drops a trailing newline
+    return not any(block_start in s for block_start in _JINJA_BLOCK_STARTS) and "\r" not in s and not s.endswith("\n")
+
+
+@lru_cache(maxsize=4096)
+def _parse_literal(s: str) -> Tuple[bool, Any]:
+    """
+    :return: whether the string is a Python literal and its value
+    """
+    try:
+        return True, ast.literal_eval(s)
+    except (ValueError, SyntaxError):
+        return False, None
@@ -6,8 +6,10 @@ import json
 import logging
 import pkgutil
 import re
+import threading
+from functools import lru_cache, partial
 from importlib import metadata
-from typing import Any, Iterator, List, Mapping, MutableMapping, Union
+from typing import Any, Callable, Dict, Iterator, List, Mapping, MutableMapping, Optional, Union
 
 import yaml
 from airbyte_cdk.models import (
@@ -22,6 +24,7 @@ from airbyte_cdk.sources.declarative.declarative_source import DeclarativeSource
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CheckStream as CheckStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import DeclarativeStream as DeclarativeStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
+from airbyte_cdk.sources.declarative.parsers.manifest_cache import ManifestCache
 from airbyte_cdk.sources.declarative.parsers.manifest_component_transformer import ManifestComponentTransformer
 from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import ManifestReferenceResolver
 from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import ModelToComponentFactory
@@ -43,11 +46,13 @@ class ManifestDeclarativeSource(DeclarativeSource):
         debug: bool = False,
         emit_connector_builder_messages: bool = False,
         component_factory: ModelToComponentFactory = None,
+        manifest_cache: Optional[ManifestCache] = None,
     ):
         """
         :param source_config(Mapping[str, Any]): The manifest of low-code components that describe the source connector
         :param debug(bool): True if debug mode is enabled
         :param component_factory(ModelToComponentFactory): optional factory if ModelToComponentFactory's default behaviour needs to be tweaked
+        :param manifest_cache(ManifestCache): optional cache of the compiled manifests, configured from the environment by default
         """
         self.logger = logging.getLogger(f"airbyte.{self.name}")
 
@@ -56,15 +61,23 @@ class ManifestDeclarativeSource(DeclarativeSource):
         if "type" not in manifest:
             manifest["type"] = "DeclarativeSource"
 
-        resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
-        propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
-        self._source_config = propagated_source_config
+        manifest_cache = manifest_cache or ManifestCache.from_environment()
+        compiled_source_config = manifest_cache.get(manifest)
+        if compiled_source_config is None:
+            resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
+            propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
+            self._source_config = propagated_source_config
+        else:
+            self._source_config = compiled_source_config
         self._debug = debug
         self._emit_connector_builder_messages = emit_connector_builder_messages
         self._constructor = component_factory if component_factory else ModelToComponentFactory(emit_connector_builder_messages)
         self._message_repository = self._constructor.get_message_repository()
 
-        self._validate_source()
+        # A cached manifest was validated before being cached
+        if compiled_source_config is None:
+            self._validate_source()
+            manifest_cache.put(manifest, self._source_config)
 
     @property
     def resolved_manifest(self) -> Mapping[str, Any]:
@@ -90,17 +103,30 @@ class ManifestDeclarativeSource(DeclarativeSource):
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
         self._emit_manifest_debug_message(extra_args={"source_name": self.name, "parsed_config": json.dumps(self._source_config)})
 
-        source_streams = [
-            self._constructor.create_component(
-                DeclarativeStreamModel, stream_config, config, emit_connector_builder_messages=self._emit_connector_builder_messages
-            )
-            for stream_config in self._stream_configs(self._source_config)
-        ]
+        return [self._create_stream(stream_config, config) for stream_config in self._stream_configs(self._source_config)]
+
+    def _get_stream_instances(self, config: Mapping[str, Any]) -> Mapping[str, Stream]:
+        stream_configs = self._stream_configs(self._source_config)
+        stream_names = [stream_config.get("name") for stream_config in stream_configs]
+        if not all(stream_names) or len(set(stream_names)) != len(stream_names):
+            # Streams can only be found by name before being created when their names are set in the manifest
+            return super()._get_stream_instances(config)
 
-        for stream in source_streams:
-            # make sure the log level is always applied to the stream's logger
-            self._apply_log_level_to_stream_logger(self.logger, stream)
-        return source_streams
+        self._emit_manifest_debug_message(extra_args={"source_name": self.name, "parsed_config": json.dumps(self._source_config)})
+        return _LazyStreamInstances(
+            {
+                stream_name: partial(self._create_stream, stream_config, config)
+                for stream_name, stream_config in zip(stream_names, stream_configs)
+            }
+        )
+
+    def _create_stream(self, stream_config: Mapping[str, Any], config: Mapping[str, Any]) -> Stream:
+        stream = self._constructor.create_component(
+            DeclarativeStreamModel, stream_config, config, emit_connector_builder_messages=self._emit_connector_builder_messages
+        )
+        # make sure the log level is always applied to the stream's logger
+        self._apply_log_level_to_stream_logger(self.logger, stream)
+        return stream
 
     def spec(self, logger: logging.Logger) -> ConnectorSpecification:
         """
@@ -149,11 +175,7 @@ class ManifestDeclarativeSource(DeclarativeSource):
         """
         Validates the connector manifest against the declarative component schema
         """
-        try:
-            raw_component_schema = pkgutil.get_data("airbyte_cdk", "sources/declarative/declarative_component_schema.yaml")
-            declarative_component_schema = yaml.load(raw_component_schema, Loader=yaml.SafeLoader)
-        except FileNotFoundError as e:
-            raise FileNotFoundError(f"Failed to read manifest component json schema required for validation: {e}")
+        declarative_component_schema = _load_declarative_component_schema()
 
         streams = self._source_config.get("streams")
         if not streams:
@@ -201,3 +223,45 @@ class ManifestDeclarativeSource(DeclarativeSource):
 
     def _emit_manifest_debug_message(self, extra_args: dict):
         self.logger.debug("declarative source created from manifest", extra=extra_args)
+
+
+class _LazyStreamInstances(Mapping[str, Stream]):
+    """
+    Streams by name, each stream being created the first time it is requested. Reading a few streams of a manifest defining many of
+    them does not create the components of the streams which are not read.
+    """
+
+    def __init__(self, stream_factories: Mapping[str, Callable[[], Stream]]):
+        self._stream_factories = stream_factories
+        self._streams: Dict[str, Stream] = {}
+        # Streams can be read concurrently
+        self._lock = threading.Lock()
+
+    def __getitem__(self, stream_name: str) -> Stream:
+        stream_factory = self._stream_factories[stream_name]
+        with self._lock:
+            if stream_name not in self._streams:
+                self._streams[stream_name] = stream_factory()
+            return self._streams[stream_name]
+
+    def __contains__(self, stream_name: object) -> bool:
+        return stream_name in self._stream_factories
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._stream_factories)
+
+    def __len__(self) -> int:
+        return len(self._stream_factories)
+
+    def __repr__(self) -> str:
+        return repr(list(self._stream_factories))
+
+
+@lru_cache(maxsize=None)
+def _load_declarative_component_schema() -> Mapping[str, Any]:
+    # Parsing the schema takes longer than validating most manifests against it, it is parsed once per process
+    try:
+        raw_component_schema = pkgutil.get_data("airbyte_cdk", "sources/declarative/declarative_component_schema.yaml")
+        return yaml.load(raw_component_schema, Loader=yaml.SafeLoader)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Failed to read manifest component json schema required for validation: {e}")
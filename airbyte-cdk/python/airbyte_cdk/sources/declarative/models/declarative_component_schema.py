@@ -14,6 +14,41 @@ from pydantic import BaseModel, Extra, Field
 from typing_extensions import Literal
 
 
+class AdaptiveStep(BaseModel):
+    type: Literal["AdaptiveStep"]
+    min_step: str = Field(
+        ...,
+        description="The smallest size of the time window (ISO8601 duration in weeks or smaller units).",
+        examples=["PT1H", "P1D"],
+        title="Minimum Step",
+    )
+    max_step: str = Field(
+        ...,
+        description="The largest size of the time window (ISO8601 duration in weeks or smaller units).",
+        examples=["P30D"],
+        title="Maximum Step",
+    )
+    min_records_per_slice: Optional[int] = Field(
+        1,
+        description="The time window grows after a slice with fewer records.",
+        examples=[100],
+        title="Minimum Records Per Slice",
+    )
+    max_records_per_slice: Optional[int] = Field(
+        None,
+        description="The time window shrinks after a slice with more records, proportionally to the number of records in excess.",
+        examples=[10000],
+        title="Maximum Records Per Slice",
+    )
+    max_slice_duration: Optional[str] = Field(
+        None,
+        description="The time window shrinks after a slice taking longer to read (ISO8601 duration), proportionally to the time in excess.",
+        examples=["PT5M"],
+        title="Maximum Slice Duration",
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
+
+
 class AddedFieldDefinition(BaseModel):
     type: Literal["AddedFieldDefinition"]
     path: List[str] = Field(
@@ -443,6 +478,10 @@ class JsonDecoder(BaseModel):
     type: Literal["JsonDecoder"]
 
 
+class StreamingJsonDecoder(BaseModel):
+    type: Literal["StreamingJsonDecoder"]
+
+
 class MinMaxDatetime(BaseModel):
     type: Literal["MinMaxDatetime"]
     datetime: str = Field(
@@ -788,7 +827,7 @@ class CursorPagination(BaseModel):
         ],
         title="Stop Condition",
     )
-    decoder: Optional[JsonDecoder] = Field(
+    decoder: Optional[Union[JsonDecoder, StreamingJsonDecoder]] = Field(
         None,
         description="Component decoding the response so records can be extracted.",
         title="Decoder",
@@ -862,6 +901,11 @@ class DatetimeBasedCursor(BaseModel):
         description="Optionally configures how the start datetime will be sent in requests to the source API.",
         title="Inject Start Time Into Outgoing HTTP Request",
     )
+    adaptive_step: Optional[AdaptiveStep] = Field(
+        None,
+        description="Optionally adapts the size of the time windows to the density of the data, starting from `step`.",
+        title="Adaptive Step",
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
@@ -903,7 +947,7 @@ class DefaultPaginator(BaseModel):
         description="Strategy defining how records are paginated.",
         title="Pagination Strategy",
     )
-    decoder: Optional[JsonDecoder] = Field(
+    decoder: Optional[Union[JsonDecoder, StreamingJsonDecoder]] = Field(
         None,
         description="Component decoding the response so records can be extracted.",
         title="Decoder",
@@ -926,7 +970,7 @@ class DpathExtractor(BaseModel):
         ],
         title="Field Path",
     )
-    decoder: Optional[JsonDecoder] = Field(
+    decoder: Optional[Union[JsonDecoder, StreamingJsonDecoder]] = Field(
         None,
         description="Component decoding the response so records can be extracted.",
         title="Decoder",
@@ -1151,6 +1195,11 @@ class ParentStreamConfig(BaseModel):
         description="A request option describing where the parent key value should be injected into and under what field name if applicable.",
         title="Request Option",
     )
+    cache_parent_records: Optional[bool] = Field(
+        False,
+        description="Whether the parent key values are kept during the sync so that the other substreams of a parent stream with the same definition do not read it again. The values are written to disk when the cache grows large.",
+        title="Cache Parent Records",
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
@@ -1190,6 +1239,13 @@ class SubstreamPartitionRouter(BaseModel):
         description="Specifies which parent streams are being iterated over and how parent records should be used to partition the child stream data set.",
         title="Parent Stream Configs",
     )
+    max_prefetched_partitions: Optional[int] = Field(
+        0,
+        description="Maximum number of partitions whose records are requested concurrently, ahead of the partition being read. Records are still emitted partition after partition and the state advances in the same order. 0 to request the partitions one after the other.",
+        examples=[4],
+        ge=0,
+        title="Maximum Prefetched Partitions",
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
@@ -0,0 +1,97 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from importlib import metadata
+from typing import Any, Mapping, Optional
+
+# Directory where the compiled manifests are persisted. Caching is disabled when it is not set.
+MANIFEST_CACHE_DIR_ENV_VAR = "AIRBYTE_MANIFEST_CACHE_DIR"
+
+logger = logging.getLogger("airbyte")
+
+
+class ManifestCache:
+    """
+    Persists manifests once their references are resolved, their types and parameters propagated and they are validated, so that the
+    next processes running the same connector skip this work. Compiled manifests are keyed by a hash of the manifest and by the version
+    of the CDK which compiled them.
+
+    The cache is an optimization only: a compiled manifest which cannot be read or written is compiled again.
+    """
+
+    def __init__(self, directory: Optional[str]):
+        """
+        :param directory: directory where the compiled manifests are stored, None to disable caching
+        """
+        self._directory = directory
+
+    @classmethod
+    def from_environment(cls) -> "ManifestCache":
+        return cls(os.environ.get(MANIFEST_CACHE_DIR_ENV_VAR) or None)
+
+    def get(self, manifest: Mapping[str, Any]) -> Optional[Mapping[str, Any]]:
+        """
+        :param manifest: the manifest as written by the connector developer
+        :return: the compiled manifest, or None if it was not compiled yet by this version of the CDK
+        """
+        path = self._get_path(manifest)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError) as exception:
+            logger.debug(f"Could not read the compiled manifest {path}: {exception}")
+            return None
+
+    def put(self, manifest: Mapping[str, Any], compiled_manifest: Mapping[str, Any]) -> None:
+        """
+        :param manifest: the manifest as written by the connector developer
+        :param compiled_manifest: the manifest once resolved, propagated and validated
+        """
+        path = self._get_path(manifest)
+        if not path:
+            return
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            # Concurrent processes never see a partially written manifest as it is renamed once complete
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            try:
+                with os.fdopen(file_descriptor, "w") as cache_file:
+                    json.dump(compiled_manifest, cache_file)
+                os.replace(temporary_path, path)
+            finally:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+        except (OSError, TypeError, ValueError) as exception:
+            logger.debug(f"Could not write the compiled manifest {path}: {exception}")
+
+    def _get_path(self, manifest: Mapping[str, Any]) -> Optional[str]:
+        cdk_version = _get_cdk_version()
+        if not self._directory or not cdk_version:
+            return None
+        try:
+            serialized_manifest = json.dumps(manifest, sort_keys=True)
+        except (TypeError, ValueError):
+            # Manifests parsed from YAML can hold values like dates which do not have a stable key
+            return None
+        manifest_hash = hashlib.sha256(serialized_manifest.encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, f"manifest-{cdk_version}-{manifest_hash}.json")
+
+
+def _get_cdk_version() -> Optional[str]:
+    """
+    :return: the version of the installed CDK, or None if the CDK is not installed as a package, e.g. when it is imported from a source
+        checkout, in which case the manifests it compiled could be stale and caching is disabled
+    """
+    try:
+        return metadata.version("airbyte_cdk")
+    except metadata.PackageNotFoundError:
+        logger.debug("Compiled manifests are not cached as the version of the CDK is unknown")
+        return None
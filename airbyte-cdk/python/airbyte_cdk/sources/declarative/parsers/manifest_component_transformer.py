@@ -15,6 +15,7 @@ DEFAULT_MODEL_TYPES: Mapping[str, str] = {
     # CursorPagination
     "CursorPagination.decoder": "JsonDecoder",
     # DatetimeBasedCursor
+    "DatetimeBasedCursor.adaptive_step": "AdaptiveStep",
     "DatetimeBasedCursor.end_datetime": "MinMaxDatetime",
     "DatetimeBasedCursor.end_time_option": "RequestOption",
     "DatetimeBasedCursor.start_datetime": "MinMaxDatetime",
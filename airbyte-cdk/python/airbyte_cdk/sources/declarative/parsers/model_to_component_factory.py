@@ -4,10 +4,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib
 import inspect
+import json
 import re
-from typing import Any, Callable, List, Literal, Mapping, Optional, Type, Union, get_args, get_origin, get_type_hints
+from typing import Any, Callable, Dict, List, Literal, Mapping, Optional, Tuple, Type, Union, get_args, get_origin, get_type_hints
 
 from airbyte_cdk.sources.declarative.auth import DeclarativeOauth2Authenticator
 from airbyte_cdk.sources.declarative.auth.declarative_authenticator import NoAuth
@@ -21,11 +23,12 @@ from airbyte_cdk.sources.declarative.auth.token import (
 from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
-from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor
+from airbyte_cdk.sources.declarative.incremental import AdaptiveStep, DatetimeBasedCursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.interpolation.interpolated_mapping import InterpolatedMapping
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import AdaptiveStep as AdaptiveStepModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import AddedFieldDefinition as AddedFieldDefinitionModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import AddFields as AddFieldsModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import ApiKeyAuthenticator as ApiKeyAuthenticatorModel
@@ -74,6 +77,7 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SessionTokenAuthenticator as SessionTokenAuthenticatorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SimpleRetriever as SimpleRetrieverModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import StreamingJsonDecoder as StreamingJsonDecoderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SubstreamPartitionRouter as SubstreamPartitionRouterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitTimeFromHeader as WaitTimeFromHeaderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitUntilTimeFromHeader as WaitUntilTimeFromHeaderModel
@@ -123,9 +127,12 @@ class ModelToComponentFactory:
         self._emit_connector_builder_messages = emit_connector_builder_messages
         self._disable_retries = disable_retries
         self._message_repository = InMemoryMessageRepository()
+        # Authenticators shared by the components having the same definition, by definition, with the config they were created for
+        self._shared_authenticators: Dict[str, Tuple[Config, Any]] = {}
 
     def _init_mappings(self):
         self.PYDANTIC_MODEL_TO_CONSTRUCTOR: [Type[BaseModel], Callable] = {
+            AdaptiveStepModel: self.create_adaptive_step,
             AddedFieldDefinitionModel: self.create_added_field_definition,
             AddFieldsModel: self.create_add_fields,
             ApiKeyAuthenticatorModel: self.create_api_key_authenticator,
@@ -172,6 +179,7 @@ class ModelToComponentFactory:
             SessionTokenAuthenticatorModel: self.create_session_token_authenticator,
             SimpleRetrieverModel: self.create_simple_retriever,
             SpecModel: self.create_spec,
+            StreamingJsonDecoderModel: self.create_streaming_json_decoder,
             SubstreamPartitionRouterModel: self.create_substream_partition_router,
             WaitTimeFromHeaderModel: self.create_wait_time_from_header,
             WaitUntilTimeFromHeaderModel: self.create_wait_until_time_from_header,
@@ -209,6 +217,57 @@ class ModelToComponentFactory:
         component_constructor = self.PYDANTIC_MODEL_TO_CONSTRUCTOR.get(model.__class__)
         return component_constructor(model=model, config=config, **kwargs)
 
+    def _create_shared_authenticator(self, model: BaseModel, config: Config, **kwargs) -> Any:
+        """
+        Authenticators are usually defined once and referenced by every stream. The streams get the same authenticator instance when
+        their authenticators have the same definition so that it is built once and that credentials like access tokens are requested
+        once for all of them.
+
+        Authenticators interpolating the parameters of their stream are only shared by streams having the same parameters, custom
+        authenticators are built for every stream.
+        """
+        key = self._get_shared_authenticator_key(model, kwargs)
+        if key is None:
+            return self._create_component_from_model(model=model, config=config, **kwargs)
+        if key in self._shared_authenticators:
+            shared_config, authenticator = self._shared_authenticators[key]
+            if shared_config is config:
+                return authenticator
+        authenticator = self._create_component_from_model(model=model, config=config, **kwargs)
+        self._shared_authenticators[key] = (config, authenticator)
+        return authenticator
+
+    @staticmethod
+    def _get_shared_authenticator_key(model: BaseModel, kwargs: Mapping[str, Any]) -> Optional[str]:
+        if isinstance(model, CustomAuthenticatorModel):
+            return None
+        return ModelToComponentFactory._get_definition_key(model, **kwargs)
+
+    @staticmethod
+    def _get_definition_key(model: BaseModel, **kwargs: Any) -> str:
+        """
+        :return: a key which is the same for the models whose components behave the same when created with the same config and kwargs
+        """
+        definition = model.dict(exclude_unset=True)
+        # Parameters are propagated from the enclosing components so they differ between streams, they only matter when interpolated
+        definition_without_parameters = _without_parameters(definition)
+        if not _interpolates_parameters(definition_without_parameters):
+            definition = definition_without_parameters
+        key = json.dumps([model.__class__.__name__, definition, kwargs], sort_keys=True, default=str)
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def create_adaptive_step(model: AdaptiveStepModel, config: Config, **kwargs) -> AdaptiveStep:
+        return AdaptiveStep(
+            min_step=model.min_step,
+            max_step=model.max_step,
+            min_records_per_slice=model.min_records_per_slice,
+            max_records_per_slice=model.max_records_per_slice,
+            max_slice_duration=model.max_slice_duration,
+            config=config,
+            parameters=model.parameters,
+        )
+
     @staticmethod
     def create_added_field_definition(model: AddedFieldDefinitionModel, config: Config, **kwargs) -> AddedFieldDefinition:
         interpolated_value = InterpolatedString.create(model.value, parameters=model.parameters)
@@ -453,6 +512,7 @@ class ModelToComponentFactory:
             start_time_option=start_time_option,
             partition_field_end=model.partition_field_end,
             partition_field_start=model.partition_field_start,
+            adaptive_step=self._create_component_from_model(model=model.adaptive_step, config=config) if model.adaptive_step else None,
             config=config,
             parameters=model.parameters,
         )
@@ -580,7 +640,7 @@ class ModelToComponentFactory:
 
     def create_http_requester(self, model: HttpRequesterModel, config: Config, *, name: str) -> HttpRequester:
         authenticator = (
-            self._create_component_from_model(model=model.authenticator, config=config, url_base=model.url_base)
+            self._create_shared_authenticator(model=model.authenticator, config=config, url_base=model.url_base)
             if model.authenticator
             else None
         )
@@ -730,6 +790,8 @@ class ModelToComponentFactory:
             partition_field=model.partition_field,
             config=config,
             parameters=model.parameters,
+            # Parent streams with the same definition and config read the same records during a sync
+            record_cache_key=self._get_definition_key(model.stream, config=config) if model.cache_parent_records else None,
         )
 
     @staticmethod
@@ -813,6 +875,19 @@ class ModelToComponentFactory:
             config=config,
             parameters=model.parameters,
             disable_retries=self._disable_retries,
+            max_prefetched_slices=self._get_max_prefetched_partitions(model.partition_router),
+        )
+
+    @staticmethod
+    def _get_max_prefetched_partitions(partition_router_model: Any) -> int:
+        partition_router_models = partition_router_model if isinstance(partition_router_model, list) else [partition_router_model]
+        return max(
+            [
+                router_model.max_prefetched_partitions or 0
+                for router_model in partition_router_models
+                if isinstance(router_model, SubstreamPartitionRouterModel)
+            ],
+            default=0,
         )
 
     @staticmethod
@@ -824,6 +899,10 @@ class ModelToComponentFactory:
             parameters={},
         )
 
+    @staticmethod
+    def create_streaming_json_decoder(model: StreamingJsonDecoderModel, config: Config, **kwargs) -> StreamingJsonDecoder:
+        return StreamingJsonDecoder(parameters={})
+
     def create_substream_partition_router(self, model: SubstreamPartitionRouterModel, config: Config, **kwargs) -> SubstreamPartitionRouter:
         parent_stream_configs = []
         if model.parent_stream_configs:
@@ -850,3 +929,22 @@ class ModelToComponentFactory:
 
     def get_message_repository(self):
         return self._message_repository
+
+
+def _interpolates_parameters(definition: Any) -> bool:
+    """
+    :return: True if a template of the definition may reference the parameters
+    """
+    if isinstance(definition, Mapping):
+        return any(_interpolates_parameters(value) for value in definition.values())
+    if isinstance(definition, list):
+        return any(_interpolates_parameters(value) for value in definition)
+    return isinstance(definition, str) and ("{{" in definition or "{%" in definition) and "parameters" in definition
+
+
+def _without_parameters(definition: Any) -> Any:
+    if isinstance(definition, Mapping):
+        return {key: _without_parameters(value) for key, value in definition.items() if key != "parameters"}
+    if isinstance(definition, list):
+        return [_without_parameters(value) for value in definition]
+    return definition
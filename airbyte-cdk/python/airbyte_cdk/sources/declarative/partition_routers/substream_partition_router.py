@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
 from dataclasses import InitVar, dataclass
 from typing import Any, Iterable, List, Mapping, Optional, Union
 
@@ -12,6 +13,7 @@ from airbyte_cdk.sources.declarative.requesters.request_option import RequestOpt
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
 from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.sources.utils.parent_record_cache import parent_record_cache
 
 
 @dataclass
@@ -23,6 +25,9 @@ class ParentStreamConfig:
     parent_key: The key of the parent stream's records that will be the stream slice key
     partition_field: The partition key
     request_option: How to inject the slice value on an outgoing HTTP request
+    record_cache_key: Identifies the parent stream among the parent streams of the source. The parent stream configs having the same key
+      read the parent stream once per sync, the values of their parent key being kept in the parent record cache. None to read the parent
+      stream for every substream
     """
 
     stream: Stream
@@ -31,6 +36,7 @@ class ParentStreamConfig:
     config: Config
     parameters: InitVar[Mapping[str, Any]]
     request_option: Optional[RequestOption] = None
+    record_cache_key: Optional[str] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]):
         self.parent_key = InterpolatedString.create(self.parent_key, parameters=parameters)
@@ -140,25 +146,30 @@ class SubstreamPartitionRouter(StreamSlicer):
                 parent_field = parent_stream_config.parent_key.eval(self.config)
                 stream_state_field = parent_stream_config.partition_field.eval(self.config)
                 for parent_stream_slice in parent_stream.stream_slices(sync_mode=sync_mode, cursor_field=None, stream_state=stream_state):
-                    empty_parent_slice = True
-                    parent_slice = parent_stream_slice
-
-                    for parent_record in parent_stream.read_records(
-                        sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
-                    ):
-                        # Skip non-records (eg AirbyteLogMessage)
-                        if isinstance(parent_record, AirbyteMessage):
-                            if parent_record.type == Type.RECORD:
-                                parent_record = parent_record.record.data
-                            else:
-                                continue
-                        try:
-                            stream_state_value = dpath.util.get(parent_record, parent_field)
-                        except KeyError:
-                            pass
-                        else:
-                            empty_parent_slice = False
-                            yield {stream_state_field: stream_state_value, "parent_slice": parent_slice}
-                    # If the parent slice contains no records,
-                    if empty_parent_slice:
-                        yield from []
+                    if parent_stream_config.record_cache_key:
+                        slice_key = json.dumps(
+                            [parent_stream_config.record_cache_key, parent_field, parent_stream_slice], sort_keys=True, default=str
+                        )
+                        parent_key_values = parent_record_cache.read_records(
+                            slice_key, lambda: self._read_parent_key_values(parent_stream, parent_stream_slice, parent_field)
+                        )
+                    else:
+                        parent_key_values = self._read_parent_key_values(parent_stream, parent_stream_slice, parent_field)
+                    for parent_key_value in parent_key_values:
+                        yield {stream_state_field: parent_key_value, "parent_slice": parent_stream_slice}
+
+    @staticmethod
+    def _read_parent_key_values(parent_stream: Stream, parent_stream_slice: StreamSlice, parent_field: str) -> Iterable[Any]:
+        for parent_record in parent_stream.read_records(
+            sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
+        ):
+            # Skip non-records (eg AirbyteLogMessage)
+            if isinstance(parent_record, AirbyteMessage):
+                if parent_record.type == Type.RECORD:
+                    parent_record = parent_record.record.data
+                else:
+                    continue
+            try:
+                yield dpath.util.get(parent_record, parent_field)
+            except KeyError:
+                pass
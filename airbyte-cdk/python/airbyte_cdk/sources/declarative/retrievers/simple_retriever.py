@@ -2,15 +2,19 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import json
+import queue
+import threading
 from dataclasses import InitVar, dataclass, field
 from itertools import islice
 from json import JSONDecodeError
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import requests
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, SyncMode
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamedRecords, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.exceptions import ReadException
 from airbyte_cdk.sources.declarative.extractors.http_selector import HttpSelector
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
@@ -24,7 +28,9 @@ from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamS
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
 from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.utils.slice_prefetcher import SlicePrefetcher, read_until_stopped
 from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets
+from airbyte_cdk.utils.stream_profiler import RECORD_EXTRACTION, stream_profiler
 
 
 @dataclass
@@ -47,6 +53,10 @@ class SimpleRetriever(Retriever, HttpStream):
         record_selector (HttpSelector): The record selector
         paginator (Optional[Paginator]): The paginator
         stream_slicer (Optional[StreamSlicer]): The stream slicer
+        max_prefetched_slices (int): Maximum number of slices whose records are fetched on a pool of threads while the records of the
+          current slice are read. The stream slicer is updated with the records as the slices are read, in the order of the slices.
+          Prefetched slices are requested with the state of the stream at the time they are fetched. 0 to fetch the slices one after the
+          other
         parameters (Mapping[str, Any]): Additional runtime parameters to be used for string interpolation
     """
 
@@ -64,6 +74,7 @@ class SimpleRetriever(Retriever, HttpStream):
     stream_slicer: Optional[StreamSlicer] = SinglePartitionRouter(parameters={})
     emit_connector_builder_messages: bool = False
     disable_retries: bool = False
+    max_prefetched_slices: int = 0
 
     def __post_init__(self, parameters: Mapping[str, Any]):
         self.paginator = self.paginator or NoPagination(parameters=parameters)
@@ -71,7 +82,10 @@ class SimpleRetriever(Retriever, HttpStream):
         self._last_response = None
         self._last_records = None
         self._parameters = parameters
+        self._slice_prefetcher: Optional[SlicePrefetcher[Tuple[List[StreamData], Optional[List[Record]]]]] = None
         self.name = InterpolatedString(self._name, parameters=parameters)
+        extractor = getattr(self.record_selector, "extractor", None)
+        self._streams_responses = isinstance(getattr(extractor, "decoder", None), StreamingJsonDecoder)
 
     @property
     def name(self) -> str:
@@ -291,7 +305,11 @@ class SimpleRetriever(Retriever, HttpStream):
         this method. Note that these options do not conflict with request-level options such as headers, request params, etc..
         """
         # Warning: use self.state instead of the stream_state passed as argument!
-        return self.requester.request_kwargs(stream_state=self.state, stream_slice=stream_slice, next_page_token=next_page_token)
+        request_kwargs = self.requester.request_kwargs(stream_state=self.state, stream_slice=stream_slice, next_page_token=next_page_token)
+        if self._streams_responses:
+            # The records are decoded as the body of the response is read
+            return {**request_kwargs, "stream": True}
+        return request_kwargs
 
     def path(
         self,
@@ -353,12 +371,31 @@ class SimpleRetriever(Retriever, HttpStream):
 
         # Warning: use self.state instead of the stream_state passed as argument!
         self._last_response = response
-        records = self.record_selector.select_records(
-            response=response, stream_state=self.state, stream_slice=stream_slice, next_page_token=next_page_token
-        )
+        with stream_profiler.stage(RECORD_EXTRACTION):
+            records = self.record_selector.select_records(
+                response=response, stream_state=self.state, stream_slice=stream_slice, next_page_token=next_page_token
+            )
+        if self._streams_responses:
+            self._last_records = StreamedRecords()
+            return self._read_streamed_records(iter(records), self._last_records)
+        if not isinstance(records, list):
+            # Records extracted lazily are kept for the paginator as they are read
+            self._last_records = []
+            return self._read_streamed_records(iter(records), self._last_records)
         self._last_records = records
         return records
 
+    @staticmethod
+    def _read_streamed_records(records: Iterator[Record], last_records: Union[StreamedRecords, List[Record]]) -> Iterable[Record]:
+        while True:
+            with stream_profiler.stage(RECORD_EXTRACTION):
+                try:
+                    record = next(records)
+                except StopIteration:
+                    return
+            last_records.append(record)
+            yield record
+
     @property
     def primary_key(self) -> Optional[Union[str, List[str], List[List[str]]]]:
         """The stream's primary key"""
@@ -387,13 +424,18 @@ class SimpleRetriever(Retriever, HttpStream):
         stream_state: Optional[StreamState] = None,
     ) -> Iterable[StreamData]:
         # Warning: use self.state instead of the stream_state passed as argument!
+        prefetched_slice = self._slice_prefetcher.pop(stream_slice) if self._slice_prefetcher else None
         stream_slice = stream_slice or {}  # None-check
-        self.paginator.reset()
-        records_generator = self._read_pages(
-            self.parse_records,
-            stream_slice,
-            stream_state,
-        )
+        if prefetched_slice is None:
+            self.paginator.reset()
+            records_generator = self._read_pages(
+                self.parse_records,
+                stream_slice,
+                stream_state,
+            )
+        else:
+            # The stream slicer is updated below so that the cursor advances in the order of the slices
+            records_generator, self._last_records = prefetched_slice
         cursor_updated = False
         for record in records_generator:
             # Only record messages should be parsed to update the cursor which is indicated by the Mapping type
@@ -419,7 +461,55 @@ class SimpleRetriever(Retriever, HttpStream):
         :return:
         """
         # Warning: use self.state instead of the stream_state passed as argument!
-        return self.stream_slicer.stream_slices(sync_mode, self.state)
+        stream_slices = self.stream_slicer.stream_slices(sync_mode, self.state)
+        if self.max_prefetched_slices <= 0:
+            return stream_slices
+
+        # Fetching a slice changes the paginator and the last response and records of the retriever, so every thread uses its own copy
+        retrievers: "queue.SimpleQueue[SimpleRetriever]" = queue.SimpleQueue()
+
+        def fetch_slice(stream_slice: Optional[StreamSlice], stop: threading.Event) -> Tuple[List[StreamData], Optional[List[Record]]]:
+            try:
+                retriever = retrievers.get_nowait()
+            except queue.Empty:
+                retriever = self._copy_for_prefetch()
+            try:
+                retriever.paginator.reset()
+                retriever._last_records = None
+                records = read_until_stopped(retriever._read_pages(retriever.parse_records, stream_slice or {}, stream_state), stop)
+                return records, retriever._last_records
+            finally:
+                retrievers.put(retriever)
+
+        self._slice_prefetcher = SlicePrefetcher(fetch_slice, self.max_prefetched_slices, name=self.name)
+        return self._slice_prefetcher.prefetch(stream_slices)
+
+    def _copy_for_prefetch(self) -> "SimpleRetriever":
+        """
+        Copies the retriever for a prefetch thread. The copy has its own paginator and requests session, as neither can be used by several
+        threads at once. The requester, the record selector and the authenticator are shared: they do not keep state across requests,
+        and the token refresh of OAuth authenticators is locked.
+        """
+        retriever = copy.copy(self)
+        retriever.paginator = copy.deepcopy(self.paginator)
+        retriever._last_response = None
+        retriever._last_records = None
+        retriever._slice_prefetcher = None
+        retriever._session = self._copy_session()
+        retriever._mounted_connection_pools = set()
+        retriever._default_adapters = list(retriever._session.adapters.values())
+        retriever._connection_pools_lock = threading.Lock()
+        return retriever
+
+    def _copy_session(self) -> requests.Session:
+        session = self._create_session()
+        session.auth = self._session.auth
+        session.headers.update(self._session.headers)
+        # Adapters mounted by the connector, e.g. with their own retries, are shared as their connection pools are thread-safe
+        for prefix, adapter in self._session.adapters.items():
+            if not any(adapter is default_adapter for default_adapter in self._default_adapters):
+                session.mount(prefix, adapter)
+        return session
 
     @property
     def state(self) -> MutableMapping[str, Any]:
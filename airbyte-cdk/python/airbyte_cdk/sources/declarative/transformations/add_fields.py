@@ -3,7 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass, field
-from typing import Any, List, Mapping, Optional, Union
+from typing import Any, Callable, List, Mapping, Optional, Tuple, Union
 
 import dpath.util
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
@@ -84,6 +84,9 @@ class AddFields(RecordTransformation):
     fields: List[AddedFieldDefinition]
     parameters: InitVar[Mapping[str, Any]]
     _parsed_fields: List[ParsedAddFieldDefinition] = field(init=False, repr=False, default_factory=list)
+    _evaluators: Optional[Tuple[Optional[Config], Optional[StreamSlice], List[Callable[..., Any]]]] = field(
+        init=False, repr=False, default=None
+    )
 
     def __post_init__(self, parameters: Mapping[str, Any]):
         for add_field in self.fields:
@@ -109,12 +112,46 @@ class AddFields(RecordTransformation):
         stream_state: Optional[StreamState] = None,
         stream_slice: Optional[StreamSlice] = None,
     ) -> Record:
-        kwargs = {"record": record, "stream_state": stream_state, "stream_slice": stream_slice}
-        for parsed_field in self._parsed_fields:
-            value = parsed_field.value.eval(config, **kwargs)
-            dpath.util.new(record, parsed_field.path, value)
+        for parsed_field, evaluate in zip(self._parsed_fields, self._get_evaluators(config, stream_slice)):
+            value = evaluate(record=record, stream_state=stream_state)
+            _set_field(record, parsed_field.path, value)
 
         return record
 
+    def _get_evaluators(self, config: Optional[Config], stream_slice: Optional[StreamSlice]) -> List[Callable[..., Any]]:
+        """
+        The values are evaluated for every record of a slice with the same config and slice, so their evaluation is prepared once per slice
+        """
+        evaluators = self._evaluators
+        if evaluators is None or evaluators[0] is not config or evaluators[1] is not stream_slice:
+            # Keeping the config and the slice referenced guarantees they are not replaced by other objects having the same identity
+            evaluators = (
+                config,
+                stream_slice,
+                [parsed_field.value.evaluator(config, stream_slice=stream_slice) for parsed_field in self._parsed_fields],
+            )
+            self._evaluators = evaluators
+        return evaluators[2]
+
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        # The evaluators only depend on the fields
+        return self.fields == other.fields and self._parsed_fields == other._parsed_fields
+
+
+def _set_field(record: Record, path: FieldPointer, value: Any) -> None:
+    """
+    Same as dpath.util.new for the paths made of object keys, which are set without going through the generic path handling of dpath
+    """
+    if not isinstance(record, dict) or not all(isinstance(key, str) for key in path):
+        # Integer keys index arrays, which dpath extends as needed
+        dpath.util.new(record, path, value)
+        return
+    current = record
+    for key in path[:-1]:
+        if key not in current:
+            current[key] = {}
+        elif not isinstance(current[key], dict):
+            dpath.util.new(record, path, value)
+            return
+        current = current[key]
+    current[path[-1]] = value
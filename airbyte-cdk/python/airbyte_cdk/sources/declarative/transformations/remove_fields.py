@@ -10,6 +10,9 @@ import dpath.util
 from airbyte_cdk.sources.declarative.transformations import RecordTransformation
 from airbyte_cdk.sources.declarative.types import FieldPointer, Record
 
+# Characters of the keys of a pointer which dpath interprets as glob patterns
+_GLOB_CHARACTERS = frozenset("*?[")
+
 
 @dataclass
 class RemoveFields(RecordTransformation):
@@ -41,17 +44,46 @@ class RemoveFields(RecordTransformation):
     field_pointers: List[FieldPointer]
     parameters: InitVar[Mapping[str, Any]]
 
+    def __post_init__(self, parameters: Mapping[str, Any]):
+        self._is_plain_pointer = [
+            bool(pointer) and all(isinstance(key, str) and not _GLOB_CHARACTERS.intersection(key) for key in pointer)
+            for pointer in self.field_pointers
+        ]
+
     def transform(self, record: Record, **kwargs) -> Record:
         """
         :param record: The record to be transformed
         :return: the input record with the requested fields removed
         """
-        for pointer in self.field_pointers:
-            # the dpath library by default doesn't delete fields from arrays
-            try:
-                dpath.util.delete(record, pointer)
-            except dpath.exceptions.PathNotFound:
-                # if the (potentially nested) property does not exist, silently skip
-                pass
+        for pointer, is_plain_pointer in zip(self.field_pointers, self._is_plain_pointer):
+            if is_plain_pointer and isinstance(record, dict):
+                _delete_field(record, pointer)
+            else:
+                _delete_matching_fields(record, pointer)
 
         return record
+
+
+def _delete_field(record: Record, pointer: FieldPointer) -> None:
+    """
+    Deletes the field of a pointer made of plain object keys, without matching every path of the record against the pointer like dpath
+    """
+    current = record
+    for key in pointer[:-1]:
+        current = current.get(key)
+        if isinstance(current, list):
+            # Object keys can match array indexes
+            _delete_matching_fields(record, pointer)
+            return
+        elif not isinstance(current, dict):
+            return
+    current.pop(pointer[-1], None)
+
+
+def _delete_matching_fields(record: Record, pointer: FieldPointer) -> None:
+    # the dpath library by default doesn't delete fields from arrays
+    try:
+        dpath.util.delete(record, pointer)
+    except dpath.exceptions.PathNotFound:
+        # if the (potentially nested) property does not exist, silently skip
+        pass
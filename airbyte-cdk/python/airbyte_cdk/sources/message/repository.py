@@ -3,7 +3,8 @@
 #
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from collections import deque
+from typing import Deque, Iterable
 
 from airbyte_cdk.models import AirbyteMessage, Type
 
@@ -20,7 +21,7 @@ class MessageRepository(ABC):
 
 class InMemoryMessageRepository(MessageRepository):
     def __init__(self):
-        self._message_queue = []
+        self._message_queue: Deque[AirbyteMessage] = deque()
 
     def emit_message(self, message: AirbyteMessage) -> None:
         """
@@ -32,5 +33,10 @@ class InMemoryMessageRepository(MessageRepository):
         self._message_queue.append(message)
 
     def consume_queue(self) -> Iterable[AirbyteMessage]:
-        while self._message_queue:
-            yield self._message_queue.pop(0)
+        # The queue can be consumed from several threads when streams are read concurrently: popping without checking the length first
+        # ensures a message is only consumed once
+        while True:
+            try:
+                yield self._message_queue.popleft()
+            except IndexError:
+                return
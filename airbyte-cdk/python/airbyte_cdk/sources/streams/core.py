@@ -123,6 +123,14 @@ class Stream(ABC):
         # TODO show an example of using pydantic to define the JSON schema, or reading an OpenAPI spec
         return ResourceSchemaLoader(package_name_from_class(self.__class__)).get_schema(self.name)
 
+    @property
+    def json_schema_is_dynamic(self) -> bool:
+        """
+        Override to return True if the schema returned by get_json_schema can change while the stream is read. The schema of other
+        streams is resolved once per read and reused for every record.
+        """
+        return False
+
     def as_airbyte_stream(self) -> AirbyteStream:
         stream = AirbyteStream(name=self.name, json_schema=dict(self.get_json_schema()), supported_sync_modes=[SyncMode.full_refresh])
 
@@ -230,6 +238,18 @@ class Stream(ABC):
         """
         return None
 
+    @property
+    def max_concurrent_slices(self) -> int:
+        """
+        Decides how many slices of this stream are read at the same time. By default slices are read one after the other.
+
+        When greater than 1, read_records is called concurrently from several threads for different slices, so it must not rely on
+        mutable per-slice instance attributes. Up to this number of slices are read ahead of the slice being emitted, and slices are
+        emitted in slice order. If the stream implements the state property, its state is only checkpointed when no later slice is being
+        read.
+        """
+        return 1
+
     @deprecated(version="0.1.49", reason="You should use explicit state property instead, see IncrementalMixin docs.")
     def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]):
         """Override to extract state from the latest record. Needed to implement incremental sync.
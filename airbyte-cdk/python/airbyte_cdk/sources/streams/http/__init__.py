@@ -3,7 +3,9 @@
 #
 
 # Initialize Streams Package
+from .async_http import AsyncHttpStream
 from .exceptions import UserDefinedBackoffException
 from .http import HttpStream, HttpSubStream
+from .rate_limiting import RateLimit, RateLimiter
 
-__all__ = ["HttpStream", "HttpSubStream", "UserDefinedBackoffException"]
+__all__ = ["AsyncHttpStream", "HttpStream", "HttpSubStream", "RateLimit", "RateLimiter", "UserDefinedBackoffException"]
@@ -0,0 +1,289 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import atexit
+import threading
+import time
+from abc import ABC
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, Mapping, Optional, Tuple, TypeVar, Union
+from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
+
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.core import StreamData
+from airbyte_cdk.utils.stream_profiler import HTTP_WAIT, stream_profiler
+from requests.auth import AuthBase
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .auth.core import HttpAuthenticator
+from .http import HttpStream
+from .rate_limiting import async_user_defined_backoff_handler, default_backoff_handler
+from .request_slots import AsyncHostRequestSlots
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:
+    aiohttp = None
+
+T = TypeVar("T")
+
+
+def create_client_session() -> "aiohttp.ClientSession":
+    """
+    Creates the aiohttp session AsyncHttpStreams send their requests with. It must be created and closed on the event loop it is used
+    on. Cookies are not kept so that streams sharing the session do not share them.
+    """
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0), cookie_jar=aiohttp.DummyCookieJar())
+
+
+class EventLoopThread:
+    """
+    Event loop running on a daemon thread. Synchronous code hands coroutines over to it and waits for their result, so that the requests
+    of every thread reading an AsyncHttpStream are multiplexed on a single loop and share its client session.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client_session: Optional["aiohttp.ClientSession"] = None
+        self._lock = threading.Lock()
+
+    def run(self, coroutine: Awaitable[T]) -> T:
+        """
+        Runs the coroutine on the event loop and blocks the calling thread until it is done
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError(f"Cannot wait for a coroutine from the {self._name} event loop itself, await it instead")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop()).result()
+
+    async def get_client_session(self) -> "aiohttp.ClientSession":
+        """
+        :return: the client session of the event loop, to be called from the loop
+        """
+        if self._client_session is None:
+            self._client_session = create_client_session()
+        return self._client_session
+
+    def close(self) -> None:
+        """
+        Closes the client session and stops the event loop, which is started again if needed
+        """
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        if self._client_session is not None:
+            asyncio.run_coroutine_threadsafe(self._client_session.close(), loop).result()
+            self._client_session = None
+        loop.call_soon_threadsafe(loop.stop)
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name=self._name, daemon=True)
+                self._thread.start()
+            return self._loop
+
+
+_event_loop_thread = EventLoopThread("airbyte_http_event_loop")
+atexit.register(_event_loop_thread.close)
+# Conditions are bound to the loop they are used on
+_host_request_slots: "WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHostRequestSlots]" = WeakKeyDictionary()
+
+
+def _get_host_request_slots() -> AsyncHostRequestSlots:
+    loop = asyncio.get_running_loop()
+    if loop not in _host_request_slots:
+        _host_request_slots[loop] = AsyncHostRequestSlots()
+    return _host_request_slots[loop]
+
+
+class AsyncHttpStream(HttpStream, ABC):
+    """
+    HttpStream sending its requests with aiohttp from an asyncio event loop, with a bounded number of requests in flight per host. It has
+    the same hooks as HttpStream so that an existing stream can opt in by changing its base class. It requires the async extra of the CDK.
+
+    Requests are prepared by the requests session of the stream, so that authenticators and request hooks keep working, and the
+    responses are handed to the hooks as requests.Response objects. Authenticators refreshing their token block the event loop while
+    they do. Responses are not cached, see use_cache. Of request_kwargs, only timeout, verify, proxies and allow_redirects are supported.
+
+    The pages of a slice are requested one after the other as each page gives the token of the next one. When the stream is read with
+    read_records, the requests of every thread reading an AsyncHttpStream, e.g. the slices or streams read concurrently, see
+    Stream.max_concurrent_slices and AbstractSource.max_concurrent_streams, are sent from a shared event loop instead of a thread each.
+    Asynchronous code can read many slices concurrently from its own event loop with read_records_async.
+    """
+
+    def __init__(self, authenticator: Union[AuthBase, HttpAuthenticator] = None):
+        if aiohttp is None:
+            raise ImportError("AsyncHttpStream requires aiohttp, install the async extra of the CDK: pip install airbyte-cdk[async]")
+        super().__init__(authenticator=authenticator)
+
+    @property
+    def use_cache(self) -> bool:
+        return False
+
+    @property
+    def max_requests_per_host(self) -> int:
+        """
+        Override if needed. Maximum number of requests in flight to a host. The requests of the other AsyncHttpStreams requesting the
+        host from the same event loop count towards the limit.
+        """
+        return 10
+
+    async def read_records_async(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+        client_session: "aiohttp.ClientSession" = None,
+    ) -> AsyncIterator[StreamData]:
+        """
+        Same as read_records for asynchronous code, which can read many slices concurrently from a single event loop
+        :param client_session: session to send the requests with, see create_client_session. A session is opened for the read if not set
+        """
+        if client_session is None:
+            async with create_client_session() as client_session:
+                async for record in self.read_records_async(sync_mode, cursor_field, stream_slice, stream_state, client_session):
+                    yield record
+            return
+
+        async for record in self._read_pages_async(
+            lambda req, res, state, _slice: self.parse_response(res, stream_slice=_slice, stream_state=state),
+            client_session,
+            stream_slice,
+            stream_state,
+        ):
+            yield record
+
+    async def _read_pages_async(
+        self,
+        records_generator_fn: Callable[
+            [requests.PreparedRequest, requests.Response, Mapping[str, Any], Mapping[str, Any]], Iterable[StreamData]
+        ],
+        client_session: "aiohttp.ClientSession",
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> AsyncIterator[StreamData]:
+        stream_state = stream_state or {}
+        pagination_complete = False
+        next_page_token = None
+        while not pagination_complete:
+            request, response = await self._fetch_next_page_async(client_session, stream_slice, stream_state, next_page_token)
+            for record in records_generator_fn(request, response, stream_state, stream_slice):
+                yield record
+
+            next_page_token = self.next_page_token(response)
+            if not next_page_token:
+                pagination_complete = True
+
+    def _fetch_next_page(
+        self, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        async def fetch_next_page() -> Tuple[requests.PreparedRequest, requests.Response]:
+            client_session = await _event_loop_thread.get_client_session()
+            return await self._fetch_next_page_async(client_session, stream_slice, stream_state, next_page_token)
+
+        return _event_loop_thread.run(fetch_next_page())
+
+    async def _fetch_next_page_async(
+        self,
+        client_session: "aiohttp.ClientSession",
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+        next_page_token: Mapping[str, Any] = None,
+    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        request, request_kwargs = self._create_next_page_request(stream_slice, stream_state, next_page_token)
+        response = await self._send_request_async(client_session, request, request_kwargs)
+        return request, response
+
+    async def _send_request_async(
+        self, client_session: "aiohttp.ClientSession", request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]
+    ) -> requests.Response:
+        """
+        Same retry logic as _send_request. Waiting for a backoff does not hold a slot of the host so other requests can be sent meanwhile.
+        """
+        max_tries = self._get_max_tries()
+        user_backoff_handler = async_user_defined_backoff_handler(max_tries=max_tries)(self._send_async)
+        backoff_handler = default_backoff_handler(max_tries=max_tries, factor=self.retry_factor)
+        return await backoff_handler(user_backoff_handler)(client_session, request, request_kwargs)
+
+    async def _send_async(
+        self, client_session: "aiohttp.ClientSession", request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]
+    ) -> requests.Response:
+        """
+        Same as _send, waiting for a slot of the host of the request before sending it
+        """
+        self.logger.debug(
+            "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
+        )
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async(request.url)
+        async with _get_host_request_slots().acquire(request.url, self.max_requests_per_host):
+            start = time.perf_counter_ns()
+            response = await self._send_with_client_session(client_session, request, request_kwargs)
+        if stream_profiler.enabled:
+            # The event loop interleaves the requests of every stream so they are attributed to the stream explicitly
+            stream_profiler.add_stage_duration(HTTP_WAIT, time.perf_counter_ns() - start, stream=self.name)
+            stream_profiler.count_request(self._get_response_size(response, request_kwargs), stream=self.name)
+        return self._handle_response(request, response)
+
+    @staticmethod
+    async def _send_with_client_session(
+        client_session: "aiohttp.ClientSession", request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]
+    ) -> requests.Response:
+        """
+        Sends the prepared request with aiohttp and converts its response, raising the exceptions of requests on transport errors so
+        that they are retried the same way
+        """
+        try:
+            async with client_session.request(
+                request.method,
+                URL(request.url, encoded=True),
+                headers=dict(request.headers),
+                data=request.body,
+                **_get_client_kwargs(request.url, request_kwargs),
+            ) as client_response:
+                content = await client_response.read()
+        except asyncio.TimeoutError as exception:
+            raise requests.exceptions.ReadTimeout(f"Request to {request.url} timed out", request=request) from exception
+        except aiohttp.ClientPayloadError as exception:
+            raise requests.exceptions.ChunkedEncodingError(exception, request=request) from exception
+        except aiohttp.ClientConnectionError as exception:
+            raise requests.exceptions.ConnectionError(exception, request=request) from exception
+
+        response = requests.Response()
+        response.status_code = client_response.status
+        response.reason = client_response.reason
+        response.headers = CaseInsensitiveDict(client_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = str(client_response.url)
+        response.request = request
+        response._content = content
+        return response
+
+
+def _get_client_kwargs(url: str, request_kwargs: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Converts the keyword arguments of requests.Session.send to the ones of aiohttp.ClientSession.request
+    """
+    client_kwargs = {}
+    timeout = request_kwargs.get("timeout")
+    if timeout is not None:
+        connect_timeout, read_timeout = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        client_kwargs["timeout"] = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+    if request_kwargs.get("verify") is False:
+        client_kwargs["ssl"] = False
+    proxy = (request_kwargs.get("proxies") or {}).get(urlparse(url).scheme)
+    if proxy:
+        client_kwargs["proxy"] = proxy
+    if "allow_redirects" in request_kwargs:
+        client_kwargs["allow_redirects"] = request_kwargs["allow_redirects"]
+    return client_kwargs
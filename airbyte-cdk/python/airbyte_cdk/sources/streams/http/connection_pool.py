@@ -0,0 +1,100 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Tuple, Union
+from urllib.parse import urlparse
+
+from requests import PreparedRequest
+from requests.adapters import DEFAULT_POOLSIZE, DEFAULT_RETRIES, HTTPAdapter
+from urllib3.util import Retry
+
+
+@dataclass
+class ConnectionPoolStats:
+    """Number of requests sent through the connection pools of a host and number of connections opened to send them"""
+
+    requests: int
+    connections: int
+
+    @property
+    def reused_connections(self) -> int:
+        """Number of requests sent on an already open connection"""
+        return max(0, self.requests - self.connections)
+
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    def __init__(self, keep_alive: bool, **kwargs: Any):
+        self._keep_alive = keep_alive
+        super().__init__(**kwargs)
+
+    def add_headers(self, request: PreparedRequest, **kwargs: Any) -> None:
+        if not self._keep_alive:
+            request.headers["Connection"] = "close"
+
+
+class ConnectionPoolRegistry:
+    """
+    Shares the transport adapters, hence the connection pools, of requests sessions sending requests to the same host. Streams of a
+    source keep their own session, with their own authentication and headers, while reusing the connections opened by the others.
+    Set the same registry on the streams of a source to share their connections, see HttpStream.connection_pool_registry.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOLSIZE, max_retries: Union[int, Retry] = DEFAULT_RETRIES, keep_alive: bool = True):
+        """
+        :param pool_size: maximum number of connections kept open to each host
+        :param max_retries: retries of the transport, e.g. on failed connections or DNS lookups, see requests.adapters.HTTPAdapter. They
+          happen before the responses reach the retries of HttpStream.
+        :param keep_alive: False to close the connections after each request, e.g. for APIs dropping idle connections
+        """
+        self._pool_size = pool_size
+        self._max_retries = max_retries
+        self._keep_alive = keep_alive
+        self._adapters: Dict[str, HTTPAdapter] = {}
+        self._lock = threading.Lock()
+
+    def get_adapter(self, url: str) -> Tuple[str, HTTPAdapter]:
+        """
+        :param url: a URL of the host
+        :return: the prefix the adapter has to be mounted on and the adapter of the host
+        """
+        prefix = self.get_prefix(url)
+        with self._lock:
+            if prefix not in self._adapters:
+                self._adapters[prefix] = _PooledHTTPAdapter(
+                    keep_alive=self._keep_alive, pool_connections=1, pool_maxsize=self._pool_size, max_retries=self._max_retries
+                )
+            return prefix, self._adapters[prefix]
+
+    @staticmethod
+    def get_prefix(url: str) -> str:
+        parsed_url = urlparse(url)
+        # The trailing slash prevents the adapter from being used for hosts having this host as prefix
+        return f"{parsed_url.scheme}://{parsed_url.netloc}/".lower()
+
+    def stats(self) -> Mapping[str, ConnectionPoolStats]:
+        """
+        :return: connection statistics of the hosts requested so far, by host prefix
+        """
+        with self._lock:
+            adapters = dict(self._adapters)
+        stats = {}
+        for prefix, adapter in adapters.items():
+            # The pools container of urllib3 only allows a thread safe copy of its keys
+            pools = [pool for pool in map(adapter.poolmanager.pools.get, adapter.poolmanager.pools.keys()) if pool]
+            stats[prefix] = ConnectionPoolStats(
+                requests=sum(pool.num_requests for pool in pools), connections=sum(pool.num_connections for pool in pools)
+            )
+        return stats
+
+    def clear(self) -> None:
+        """
+        Closes the connections of all the hosts. Sessions already using an adapter keep it.
+        """
+        with self._lock:
+            adapters, self._adapters = self._adapters, {}
+        for adapter in adapters.values():
+            adapter.close()
+
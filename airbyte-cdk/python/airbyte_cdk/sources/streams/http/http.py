@@ -3,11 +3,13 @@
 #
 
 
+import json
 import logging
 import os
+import threading
 from abc import ABC, abstractmethod
-from contextlib import suppress
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from contextlib import nullcontext, suppress
+from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
 from urllib.parse import urljoin
 
 import requests
@@ -16,17 +18,21 @@ from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrategy
 from airbyte_cdk.sources.streams.core import Stream, StreamData
 from airbyte_cdk.sources.streams.http.availability_strategy import HttpAvailabilityStrategy
+from airbyte_cdk.sources.utils.parent_record_cache import parent_record_cache
+from airbyte_cdk.sources.utils.slice_prefetcher import SlicePrefetcher, read_until_stopped
+from airbyte_cdk.utils.stream_profiler import HTTP_WAIT, stream_profiler
 from requests.auth import AuthBase
 from requests_cache.session import CachedSession
 
 from .auth.core import HttpAuthenticator, NoAuth
+from .connection_pool import ConnectionPoolRegistry
 from .exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
-from .rate_limiting import default_backoff_handler, user_defined_backoff_handler
+from .rate_limiting import RateLimiter, default_backoff_handler, user_defined_backoff_handler
+from .request_slots import host_request_slots
 
 # list of all possible HTTP methods which can be used for sending of request bodies
 BODY_REQUEST_METHODS = ("GET", "POST", "PUT", "PATCH")
 
-
 class HttpStream(Stream, ABC):
     """
     Base abstract class for an Airbyte Stream using the HTTP protocol. Basic building block for users building an Airbyte source for a HTTP API.
@@ -34,13 +40,14 @@ class HttpStream(Stream, ABC):
 
     source_defined_cursor = True  # Most HTTP streams use a source defined cursor (i.e: the user can't configure it like on a SQL table)
     page_size: Optional[int] = None  # Use this variable to define page size for API http requests with pagination support
+    # Set the same RateLimiter on all the streams of a source, e.g. on their base class, to spread their requests under the API limits
+    rate_limiter: Optional[RateLimiter] = None
+    # Set the same ConnectionPoolRegistry on all the streams of a source, e.g. on their base class, to share their connections to a host
+    connection_pool_registry: Optional[ConnectionPoolRegistry] = None
 
     # TODO: remove legacy HttpAuthenticator authenticator references
     def __init__(self, authenticator: Union[AuthBase, HttpAuthenticator] = None):
-        if self.use_cache:
-            self._session = self.request_cache()
-        else:
-            self._session = requests.Session()
+        self._session = self._create_session()
 
         self._authenticator: HttpAuthenticator = NoAuth()
         if isinstance(authenticator, AuthBase):
@@ -48,6 +55,17 @@ class HttpStream(Stream, ABC):
         elif authenticator:
             self._authenticator = authenticator
 
+        # Prefixes of the hosts the shared connection pool of which is mounted on the session
+        self._mounted_connection_pools: Set[str] = set()
+        # Adapters the connector did not mount itself, which the shared connection pools can replace
+        self._default_adapters = list(self._session.adapters.values())
+        self._connection_pools_lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        if self.use_cache:
+            return self.request_cache()
+        return requests.Session()
+
     @property
     def cache_filename(self):
         """
@@ -76,6 +94,14 @@ class HttpStream(Stream, ABC):
                 os.remove(self.cache_filename)
             STREAM_CACHE_FILES.add(self.cache_filename)
 
+    @property
+    def max_requests_per_host(self) -> Optional[int]:
+        """
+        Override if needed. Maximum number of requests in flight to a host, e.g. when slices or streams are read concurrently. The
+        requests of the other streams requesting the host count towards the limit, see HostRequestSlots. None for no limit.
+        """
+        return None
+
     @property
     @abstractmethod
     def url_base(self) -> str:
@@ -305,8 +331,47 @@ class HttpStream(Stream, ABC):
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
-        response: requests.Response = self._session.send(request, **request_kwargs)
-
+        self._mount_connection_pool(request.url)
+        if self.rate_limiter:
+            self.rate_limiter.acquire(request.url)
+        host_slot = host_request_slots.acquire(request.url, self.max_requests_per_host) if self.max_requests_per_host else nullcontext()
+        with host_slot, stream_profiler.stage(HTTP_WAIT):
+            response: requests.Response = self._session.send(request, **request_kwargs)
+        if stream_profiler.enabled:
+            stream_profiler.count_request(self._get_response_size(response, request_kwargs))
+        return self._handle_response(request, response)
+
+    @staticmethod
+    def _get_response_size(response: requests.Response, request_kwargs: Mapping[str, Any]) -> int:
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit():
+            return int(content_length)
+        # Reading the content of a streamed response would load it at once
+        return 0 if request_kwargs.get("stream") else len(response.content)
+
+    def _mount_connection_pool(self, url: str) -> None:
+        """
+        Mounts the shared connection pool of the host of the url on the session the first time the host is requested, unless the
+        connector mounted its own adapter for the url
+        """
+        if not self.connection_pool_registry or not url:
+            return
+        prefix = ConnectionPoolRegistry.get_prefix(url)
+        if prefix not in self._mounted_connection_pools:
+            # Mounting changes the adapters the session iterates over to send requests so it must be done before any request to the host
+            with self._connection_pools_lock:
+                if prefix not in self._mounted_connection_pools:
+                    adapter = self._session.get_adapter(url)
+                    if any(adapter is default_adapter for default_adapter in self._default_adapters):
+                        self._session.mount(*self.connection_pool_registry.get_adapter(url))
+                    self._mounted_connection_pools.add(prefix)
+
+    def _handle_response(self, request: requests.PreparedRequest, response: requests.Response) -> requests.Response:
+        """
+        Raises the exceptions triggering a backoff or failing the sync for the response of a request. See _send.
+        """
+        if self.rate_limiter:
+            self.rate_limiter.update_from_response(response)
         # Evaluation of response.text can be heavy, for example, if streaming a large response
         # Do it only in debug mode
         if self.logger.isEnabledFor(logging.DEBUG):
@@ -335,7 +400,12 @@ class HttpStream(Stream, ABC):
         """
         Creates backoff wrappers which are responsible for retry logic
         """
+        max_tries = self._get_max_tries()
+        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries)(self._send)
+        backoff_handler = default_backoff_handler(max_tries=max_tries, factor=self.retry_factor)
+        return backoff_handler(user_backoff_handler)(request, request_kwargs)
 
+    def _get_max_tries(self) -> Optional[int]:
         """
         Backoff package has max_tries parameter that means total number of
         tries before giving up, so if this number is 0 no calls expected to be done.
@@ -358,10 +428,7 @@ class HttpStream(Stream, ABC):
         """
         if max_tries is not None:
             max_tries = max(0, max_tries) + 1
-
-        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries)(self._send)
-        backoff_handler = default_backoff_handler(max_tries=max_tries, factor=self.retry_factor)
-        return backoff_handler(user_backoff_handler)(request, request_kwargs)
+        return max_tries
 
     @classmethod
     def parse_response_error_message(cls, response: requests.Response) -> Optional[str]:
@@ -449,6 +516,13 @@ class HttpStream(Stream, ABC):
     def _fetch_next_page(
         self, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
     ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        request, request_kwargs = self._create_next_page_request(stream_slice, stream_state, next_page_token)
+        response = self._send_request(request, request_kwargs)
+        return request, response
+
+    def _create_next_page_request(
+        self, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Tuple[requests.PreparedRequest, Mapping[str, Any]]:
         request_headers = self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
         request = self._create_prepared_request(
             path=self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
@@ -458,9 +532,7 @@ class HttpStream(Stream, ABC):
             data=self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
         )
         request_kwargs = self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
-
-        response = self._send_request(request, request_kwargs)
-        return request, response
+        return request, request_kwargs
 
 
 class HttpSubStream(HttpStream, ABC):
@@ -470,9 +542,66 @@ class HttpSubStream(HttpStream, ABC):
         """
         super().__init__(**kwargs)
         self.parent = parent
+        self._slice_prefetcher: Optional[SlicePrefetcher[List[StreamData]]] = None
+
+    @property
+    def max_prefetched_slices(self) -> int:
+        """
+        Override to fetch the records of the next slices, i.e. of the next parent records, on a pool of threads while the records of the
+        current slice are read. Records are still read slice after slice, only the requests are sent ahead of time: the methods building
+        the requests and parsing the responses must not keep state on the stream, and the records of the prefetched slices are kept in
+        memory until they are read. Prefetched slices are requested with the stream state given when the slices were created, and only
+        the slices yielded as is by stream_slices are prefetched. 0 to fetch the slices one after the other.
+        """
+        return 0
+
+    @property
+    def parent_record_fields(self) -> Optional[List[str]]:
+        """
+        Override to read the parent stream once per sync for all the substreams of the same parent stream class and name, the parent records
+        being kept in the parent record cache. The parent records of the slices only have these top level fields.
+        The parent records are cached by parent slice, not by the state of the substreams: the records read by the parent stream must not
+        depend on the stream state given by the substream, as the substreams reading the parent stream after the first one get the records
+        read with the state of the first one.
+        None to read the parent stream for every substream with complete parent records.
+        """
+        return None
 
     def stream_slices(
         self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
+        stream_slices = self._read_parent_slices(cursor_field, stream_state)
+        if self.max_prefetched_slices <= 0:
+            yield from stream_slices
+            return
+
+        def fetch_slice(stream_slice: Optional[Mapping[str, Any]], stop: threading.Event) -> List[StreamData]:
+            # Records are fetched by HttpStream so that overrides of read_records still process them when the slice is read
+            return read_until_stopped(
+                HttpStream.read_records(
+                    self, sync_mode=sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
+                ),
+                stop,
+            )
+
+        self._slice_prefetcher = SlicePrefetcher(fetch_slice, self.max_prefetched_slices, name=self.name)
+        yield from self._slice_prefetcher.prefetch(stream_slices)
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[StreamData]:
+        records = self._slice_prefetcher.pop(stream_slice) if self._slice_prefetcher else None
+        if records is None:
+            yield from super().read_records(sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state)
+        else:
+            yield from records
+
+    def _read_parent_slices(
+        self, cursor_field: Optional[List[str]], stream_state: Optional[Mapping[str, Any]]
     ) -> Iterable[Optional[Mapping[str, Any]]]:
         parent_stream_slices = self.parent.stream_slices(
             sync_mode=SyncMode.full_refresh, cursor_field=cursor_field, stream_state=stream_state
@@ -480,10 +609,34 @@ class HttpSubStream(HttpStream, ABC):
 
         # iterate over all parent stream_slices
         for stream_slice in parent_stream_slices:
-            parent_records = self.parent.read_records(
-                sync_mode=SyncMode.full_refresh, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
-            )
+            if self.parent_record_fields is None:
+                parent_records = self.parent.read_records(
+                    sync_mode=SyncMode.full_refresh, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
+                )
+            else:
+                parent_records = self._read_cached_parent_records(cursor_field, stream_slice, stream_state)
 
             # iterate over all parent records with current stream_slice
             for record in parent_records:
                 yield {"parent": record}
+
+    def _read_cached_parent_records(
+        self, cursor_field: Optional[List[str]], stream_slice: Optional[Mapping[str, Any]], stream_state: Optional[Mapping[str, Any]]
+    ) -> Iterable[StreamData]:
+        fields = self.parent_record_fields
+
+        def read_parent_records() -> Iterable[StreamData]:
+            for record in self.parent.read_records(
+                sync_mode=SyncMode.full_refresh, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
+            ):
+                yield {field: record[field] for field in fields if field in record} if isinstance(record, Mapping) else record
+
+        parent = type(self.parent)
+        key = json.dumps(
+            [f"{parent.__module__}.{parent.__qualname__}", self.parent.name, fields, cursor_field, stream_slice],
+            sort_keys=True,
+            default=str,
+        )
+        for record in parent_record_cache.read_records(key, read_parent_records):
+            # The cached records are shared with the other substreams
+            yield dict(record) if isinstance(record, Mapping) else record
@@ -2,12 +2,17 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import asyncio
 import logging
 import sys
+import threading
 import time
-from typing import Optional
+from dataclasses import dataclass
+from typing import Callable, List, Mapping, Optional
+from urllib.parse import urlparse
 
 import backoff
+import requests
 from requests import codes, exceptions
 
 from .exceptions import DefaultBackoffException, UserDefinedBackoffException
@@ -22,6 +27,9 @@ TRANSIENT_EXCEPTIONS = (
 
 logger = logging.getLogger("airbyte")
 
+# Rate limit reset headers holding values above this one are UNIX timestamps. It is about 11 days when read as a number of seconds.
+_MIN_RESET_TIMESTAMP = 1_000_000
+
 
 def default_backoff_handler(max_tries: Optional[int], factor: float, **kwargs):
     def log_retry_attempt(details):
@@ -53,14 +61,38 @@ def default_backoff_handler(max_tries: Optional[int], factor: float, **kwargs):
 
 def user_defined_backoff_handler(max_tries: Optional[int], **kwargs):
     def sleep_on_ratelimit(details):
-        _, exc, _ = sys.exc_info()
-        if isinstance(exc, UserDefinedBackoffException):
-            if exc.response:
-                logger.info(f"Status code: {exc.response.status_code}, Response Content: {exc.response.content}")
-            retry_after = exc.backoff
-            logger.info(f"Retrying. Sleeping for {retry_after} seconds")
-            time.sleep(retry_after + 1)  # extra second to cover any fractions of second
+        retry_after = _get_retry_after()
+        if retry_after is not None:
+            time.sleep(retry_after)
+
+    return _user_defined_backoff_handler(max_tries, sleep_on_ratelimit, **kwargs)
+
+
+def async_user_defined_backoff_handler(max_tries: Optional[int], **kwargs):
+    """
+    Same as user_defined_backoff_handler for coroutines: the event loop keeps running other requests while waiting
+    """
 
+    async def sleep_on_ratelimit(details):
+        retry_after = _get_retry_after()
+        if retry_after is not None:
+            await asyncio.sleep(retry_after)
+
+    return _user_defined_backoff_handler(max_tries, sleep_on_ratelimit, **kwargs)
+
+
+def _get_retry_after() -> Optional[float]:
+    _, exc, _ = sys.exc_info()
+    if isinstance(exc, UserDefinedBackoffException):
+        if exc.response:
+            logger.info(f"Status code: {exc.response.status_code}, Response Content: {exc.response.content}")
+        retry_after = exc.backoff
+        logger.info(f"Retrying. Sleeping for {retry_after} seconds")
+        return retry_after + 1  # extra second to cover any fractions of second
+    return None
+
+
+def _user_defined_backoff_handler(max_tries: Optional[int], sleep_on_ratelimit: Callable, **kwargs):
     def log_give_up(details):
         _, exc, _ = sys.exc_info()
         logger.error(f"Max retry limit reached. Request: {exc.request}, Response: {exc.response}")
@@ -75,3 +107,146 @@ def user_defined_backoff_handler(max_tries: Optional[int], **kwargs):
         max_tries=max_tries,
         **kwargs,
     )
+
+
+@dataclass
+class RateLimit:
+    """
+    Number of requests allowed per period, e.g. RateLimit(requests=100, period_seconds=60) for 100 requests per minute.
+
+    :param burst: number of requests that can be sent at once after a quiet period. Defaults to the number of requests of the period
+    """
+
+    requests: float
+    period_seconds: float = 1.0
+    burst: Optional[int] = None
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.period_seconds
+
+    @property
+    def capacity(self) -> float:
+        return self.burst if self.burst is not None else max(1.0, self.requests)
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket: tokens are refilled at the rate of the limit up to its burst capacity and each request takes one.
+    Callers reserve their token before waiting for it so that concurrent callers are served in turn.
+    """
+
+    def __init__(self, limit: RateLimit):
+        self._rate = limit.requests_per_second
+        self._capacity = limit.capacity
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token
+        :return: number of seconds to wait before using it
+        """
+        with self._lock:
+            now = self._refill()
+            self._tokens -= 1
+            wait_time = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            return max(wait_time, self._blocked_until - now)
+
+    def limit(self, remaining: int, reset_at: Optional[float]) -> None:
+        """
+        Aligns the bucket on the quota reported by the server.
+        :param remaining: number of requests the server still accepts
+        :param reset_at: time.monotonic() time at which the quota of the server is reset, if known
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, remaining)
+            if remaining <= 0 and reset_at is not None:
+                self._blocked_until = max(self._blocked_until, reset_at)
+
+    def _refill(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+        return now
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter meant to be shared by all the HttpStreams of a source so that requests are spread to stay under the limits
+    of the API instead of reacting to 429 responses. See HttpStream.rate_limiter.
+
+    Every request takes a token of the default bucket and of the bucket of the most specific endpoint its path starts with, if any.
+    Quotas reported by the server in rate limit headers of responses are applied to the bucket of the request, so that requests made
+    by other clients of the same account are accounted for.
+    """
+
+    def __init__(
+        self,
+        limit: RateLimit,
+        endpoint_limits: Optional[Mapping[str, RateLimit]] = None,
+        remaining_header: str = "X-RateLimit-Remaining",
+        reset_header: str = "X-RateLimit-Reset",
+    ):
+        """
+        :param limit: limit applying to all the requests
+        :param endpoint_limits: additional limits by URL path prefix, e.g. {"/v1/search": RateLimit(requests=10, period_seconds=60)}
+        :param remaining_header: response header giving the number of requests left in the current window of the API
+        :param reset_header: response header giving when the window of the API is reset, as a number of seconds or a UNIX timestamp
+        """
+        self._bucket = TokenBucket(limit)
+        # Longest prefixes first so that the most specific endpoint matches
+        self._endpoint_buckets = [
+            (prefix, TokenBucket(endpoint_limit))
+            for prefix, endpoint_limit in sorted((endpoint_limits or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        ]
+        self._remaining_header = remaining_header
+        self._reset_header = reset_header
+
+    def acquire(self, url: str) -> None:
+        """
+        Blocks until a request to the url can be sent
+        """
+        wait_time = self._reserve(url)
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def acquire_async(self, url: str) -> None:
+        """
+        Same as acquire without blocking the event loop
+        """
+        wait_time = self._reserve(url)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    def update_from_response(self, response: requests.Response) -> None:
+        remaining = self._parse_header(response, self._remaining_header)
+        if remaining is None:
+            return
+        reset = self._parse_header(response, self._reset_header)
+        reset_at = None
+        if reset is not None:
+            # Large values are timestamps rather than a number of seconds
+            reset_in = reset - time.time() if reset > _MIN_RESET_TIMESTAMP else reset
+            reset_at = time.monotonic() + max(0.0, reset_in)
+        self._get_buckets(response.request.url if response.request else "")[-1].limit(int(remaining), reset_at)
+
+    def _reserve(self, url: str) -> float:
+        return max(bucket.reserve() for bucket in self._get_buckets(url))
+
+    def _get_buckets(self, url: str) -> List[TokenBucket]:
+        path = urlparse(url).path
+        for prefix, bucket in self._endpoint_buckets:
+            if path.startswith(prefix):
+                return [self._bucket, bucket]
+        return [self._bucket]
+
+    @staticmethod
+    def _parse_header(response: requests.Response, header: str) -> Optional[float]:
+        try:
+            return float(response.headers[header])
+        except (KeyError, ValueError):
+            return None
@@ -0,0 +1,65 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator
+
+from .connection_pool import ConnectionPoolRegistry
+
+
+class HostRequestSlots:
+    """
+    Bounds the number of requests in flight to each host. A request is sent once fewer requests than the limit of its stream are in
+    flight to its host, whatever stream sent them: the streams requesting a host share a single bound, which is never exceeded by
+    the streams with a lower limit.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, int] = {}
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def acquire(self, url: str, max_requests: int) -> Iterator[None]:
+        """
+        Blocks until a request to the url can be sent and holds its slot meanwhile
+        :param max_requests: maximum number of requests in flight to the host of the url, including this one
+        """
+        host = ConnectionPoolRegistry.get_prefix(url)
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight.get(host, 0) < max_requests)
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight[host] -= 1
+                self._condition.notify_all()
+
+
+class AsyncHostRequestSlots:
+    """
+    Same as HostRequestSlots for the coroutines of an event loop, which wait for a slot without blocking the loop
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, int] = {}
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def acquire(self, url: str, max_requests: int) -> AsyncIterator[None]:
+        host = ConnectionPoolRegistry.get_prefix(url)
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight.get(host, 0) < max_requests)
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight[host] -= 1
+                self._condition.notify_all()
+
+
+host_request_slots = HostRequestSlots()
@@ -3,6 +3,7 @@
 #
 
 import logging
+import threading
 from abc import abstractmethod
 from typing import Any, List, Mapping, MutableMapping, Optional, Tuple, Union
 
@@ -23,6 +24,10 @@ class AbstractOauth2Authenticator(AuthBase):
     delegating that behavior to the classes implementing the interface.
     """
 
+    # Threads sharing an authenticator, e.g. the ones reading slices concurrently, refresh its token once. Refreshes are rare so all the
+    # authenticators share the lock
+    _token_refresh_lock = threading.RLock()
+
     def __call__(self, request: requests.Request) -> requests.Request:
         """Attach the HTTP headers required to authenticate on the HTTP request"""
         request.headers.update(self.get_auth_header())
@@ -35,9 +40,12 @@ class AbstractOauth2Authenticator(AuthBase):
     def get_access_token(self) -> str:
         """Returns the access token"""
         if self.token_has_expired():
-            token, expires_in = self.refresh_access_token()
-            self.access_token = token
-            self.set_token_expiry_date(expires_in)
+            with self._token_refresh_lock:
+                # Another thread may have refreshed the token while this one waited for the lock
+                if self.token_has_expired():
+                    token, expires_in = self.refresh_access_token()
+                    self.access_token = token
+                    self.set_token_expiry_date(expires_in)
 
         return self.access_token
 
@@ -209,16 +209,20 @@ class SingleUseRefreshTokenOauth2Authenticator(Oauth2Authenticator):
             str: The current access_token, updated if it was previously expired.
         """
         if self.token_has_expired():
-            new_access_token, access_token_expires_in, new_refresh_token = self.refresh_access_token()
-            new_token_expiry_date = self.get_new_token_expiry_date(access_token_expires_in, self._token_expiry_date_format)
-            self.access_token = new_access_token
-            self.set_refresh_token(new_refresh_token)
-            self.set_token_expiry_date(new_token_expiry_date)
-            if self._message_repository:
-                self._message_repository.emit_message(create_connector_config_control_message(self._connector_config))
-            else:
-                # FIXME emit_configuration_as_airbyte_control_message as been deprecated in favor of package airbyte_cdk.sources.message
-                emit_configuration_as_airbyte_control_message(self._connector_config)
+            with self._token_refresh_lock:
+                # The refresh token can only be used once so a thread which waited for another one to refresh it uses the new token
+                if self.token_has_expired():
+                    new_access_token, access_token_expires_in, new_refresh_token = self.refresh_access_token()
+                    new_token_expiry_date = self.get_new_token_expiry_date(access_token_expires_in, self._token_expiry_date_format)
+                    self.access_token = new_access_token
+                    self.set_refresh_token(new_refresh_token)
+                    self.set_token_expiry_date(new_token_expiry_date)
+                    if self._message_repository:
+                        self._message_repository.emit_message(create_connector_config_control_message(self._connector_config))
+                    else:
+                        # FIXME emit_configuration_as_airbyte_control_message as been deprecated in favor of package
+                        #  airbyte_cdk.sources.message
+                        emit_configuration_as_airbyte_control_message(self._connector_config)
         return self.access_token
 
     def refresh_access_token(self) -> Tuple[str, str, str]:
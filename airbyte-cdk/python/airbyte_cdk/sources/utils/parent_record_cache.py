@@ -0,0 +1,90 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import tempfile
+import threading
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Number of records kept in memory by the cache of a sync before the records of the next parent slices are written to disk
+DEFAULT_MAX_RECORDS_IN_MEMORY = 100_000
+
+
+class ParentRecordCache:
+    """
+    Keeps the records of the parent streams read during a sync so that the substreams of a parent stream read it once instead of once
+    per substream. Records are cached by parent slice once the slice is completely read, under a key identifying the parent stream, the
+    slice and the part of the records which is kept. Callers keep only the fields of the records they need to limit the size of the cache.
+
+    Once the cache holds max_records_in_memory records, the records of the next slices are written to a temporary file. The cache is
+    cleared at the end of each read of the source.
+    """
+
+    def __init__(self, max_records_in_memory: int = DEFAULT_MAX_RECORDS_IN_MEMORY):
+        self._max_records_in_memory = max_records_in_memory
+        self._records: Dict[str, List[Any]] = {}
+        self._records_in_memory = 0
+        # Offset and size of the records of the slices written to disk
+        self._spilled_records: Dict[str, Tuple[int, int]] = {}
+        self._spill_file: Optional[IO[bytes]] = None
+        self._lock = threading.Lock()
+
+    def read_records(self, key: str, read_records: Callable[[], Iterable[Any]]) -> Iterable[Any]:
+        """
+        :param key: identifies the parent stream, its slice and the fields kept of its records
+        :param read_records: reads the records of the slice when they are not cached yet, reduced to the fields that are kept
+        :return: the records of the slice
+        """
+        records = self._get(key)
+        if records is not None:
+            yield from records
+            return
+
+        records = []
+        for record in read_records():
+            records.append(record)
+            yield record
+        # Only completely read slices are cached, not the slices whose reading was interrupted
+        self._put(key, records)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._records_in_memory = 0
+            self._spilled_records.clear()
+            if self._spill_file:
+                self._spill_file.close()
+                self._spill_file = None
+
+    def _get(self, key: str) -> Optional[List[Any]]:
+        with self._lock:
+            if key in self._records:
+                return self._records[key]
+            if key in self._spilled_records:
+                offset, size = self._spilled_records[key]
+                self._spill_file.seek(offset)
+                return json.loads(self._spill_file.read(size))
+        return None
+
+    def _put(self, key: str, records: List[Any]) -> None:
+        with self._lock:
+            if key in self._records or key in self._spilled_records:
+                return
+            if self._records_in_memory + len(records) <= self._max_records_in_memory:
+                self._records[key] = records
+                self._records_in_memory += len(records)
+                return
+            try:
+                serialized_records = json.dumps(records).encode("utf-8")
+            except (TypeError, ValueError):
+                # Records which cannot be written are read again by the next substreams
+                return
+            if not self._spill_file:
+                self._spill_file = tempfile.TemporaryFile()
+            offset = self._spill_file.seek(0, 2)
+            self._spill_file.write(serialized_records)
+            self._spilled_records[key] = (offset, len(serialized_records))
+
+
+parent_record_cache = ParentRecordCache()
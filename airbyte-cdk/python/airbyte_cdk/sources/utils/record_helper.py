@@ -9,6 +9,7 @@ from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteRecordM
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from airbyte_cdk.utils.stream_profiler import TRANSFORMATION, stream_profiler
 
 
 def stream_data_to_airbyte_message(
@@ -27,9 +28,15 @@ def stream_data_to_airbyte_message(
         # need it to normalize values against json schema. By default no action
         # taken unless configured. See
         # docs/connector-development/cdk-python/schemas.md for details.
-        transformer.transform(data, schema)  # type: ignore
-        message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=now_millis)
-        return AirbyteMessage(type=MessageType.RECORD, record=message)
+        with stream_profiler.stage(TRANSFORMATION):
+            transformer.transform(data, schema)  # type: ignore
+        if all(isinstance(key, str) for key in data):
+            # Records are built for every row of every stream: skip the pydantic validation when the only thing it checks, data keys
+            # being strings, already holds
+            message = AirbyteRecordMessage.construct(stream=stream_name, data=data, emitted_at=now_millis)
+        else:
+            message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=now_millis)
+        return AirbyteMessage.construct(type=MessageType.RECORD, record=message)
     elif isinstance(data_or_message, AirbyteTraceMessage):
         return AirbyteMessage(type=MessageType.TRACE, trace=data_or_message)
     elif isinstance(data_or_message, AirbyteLogMessage):
@@ -0,0 +1,52 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+import typing
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from airbyte_cdk.utils.event_timing import EventTimer
+
+if typing.TYPE_CHECKING:
+    from airbyte_cdk.sources.streams import Stream
+
+
+class SchemaCache:
+    """
+    Memoizes the JSON schema of streams by stream class and name so that it is only loaded and resolved once per read instead of once
+    per record. Streams whose schema can change while they are read are never cached, see Stream.json_schema_is_dynamic.
+
+    The time spent resolving the schema of each stream is added to the given timer.
+    """
+
+    def __init__(self, timer: Optional[EventTimer] = None):
+        self._timer = timer
+        self._schemas: Dict[Tuple[type, str], Mapping[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_json_schema(self, stream: "Stream") -> Mapping[str, Any]:
+        key = (type(stream), stream.name)
+        schema = self._schemas.get(key)
+        if schema is None:
+            start = time.perf_counter_ns()
+            schema = stream.get_json_schema()
+            resolution_time = time.perf_counter_ns() - start
+            with self._lock:
+                if self._timer:
+                    self._timer.add_event_duration(f"Resolving schema of stream {stream.name}", resolution_time)
+                if not stream.json_schema_is_dynamic:
+                    self._schemas[key] = schema
+        return schema
+
+    def invalidate(self, stream: Optional["Stream"] = None) -> None:
+        """
+        Drops the cached schema of the given stream so that it is resolved again on next use.
+        :param stream: the stream to invalidate the schema of. All the cached schemas are dropped if None
+        """
+        with self._lock:
+            if stream:
+                self._schemas.pop((type(stream), stream.name), None)
+            else:
+                self._schemas.clear()
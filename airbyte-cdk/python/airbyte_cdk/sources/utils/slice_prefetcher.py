@@ -0,0 +1,137 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Generic, Iterable, List, Mapping, Optional, Tuple, TypeVar
+
+from airbyte_cdk.utils.stream_profiler import stream_profiler
+
+T = TypeVar("T")
+
+_END = object()
+
+
+class SlicePrefetcher(Generic[T]):
+    """
+    Fetches the records of the next slices of a stream on a pool of threads while the records of the current slice are read, so that the
+    requests of several partitions of a substream are in flight at the same time.
+
+    The slices are still yielded one after the other, in the order of the slices of the stream, and the fetched records of a slice are
+    only handed over when the slice is read: records are emitted in a stable order and the state of the stream is updated by the reader
+    as if the slices were fetched serially. Slices which are not prefetched, e.g. because they are read out of order, are fetched by
+    the reader as usual.
+
+    Only the first slice is fetched until it is read, so that a reader which only needs the first slice, e.g. to check the availability
+    of the stream, does not fetch the next ones. When the reader stops reading the slices, the fetches which did not start are cancelled
+    and the ones in progress are told to stop through the event passed to fetch_slice.
+    """
+
+    def __init__(
+        self,
+        fetch_slice: Callable[[Optional[Mapping[str, Any]], threading.Event], T],
+        max_prefetched_slices: int,
+        name: str = "airbyte",
+    ):
+        """
+        :param fetch_slice: fetches the records of a slice, called from the threads of the prefetcher with an event set once the records
+            are no longer needed, after which it should stop sending requests and return early
+        :param max_prefetched_slices: maximum number of slices fetched ahead of the slice being read, 0 to fetch no slice ahead
+        :param name: name of the stream, to which the measurements of the threads of the prefetcher are attributed, and prefix of their names
+        """
+        self._fetch_slice = fetch_slice
+        self._max_prefetched_slices = max_prefetched_slices
+        self._name = name
+        # Fetches in progress or done by id of their slice, the slice being kept to check the identity of the slice which is read
+        self._fetches: Dict[int, Tuple[Optional[Mapping[str, Any]], "Future[T]"]] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, stream_slices: Iterable[Optional[Mapping[str, Any]]]) -> Iterable[Optional[Mapping[str, Any]]]:
+        """
+        :param stream_slices: the slices of the stream
+        :return: the same slices, the records of the next ones being fetched as they are read
+        """
+        if self._max_prefetched_slices <= 0:
+            yield from stream_slices
+            return
+
+        slice_iterator = iter(stream_slices)
+        pending_slices: Deque[Optional[Mapping[str, Any]]] = deque()
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=self._max_prefetched_slices, thread_name_prefix=f"{self._name}_prefetch")
+        # The next slices are only fetched ahead once the first one is read
+        window = 0
+        try:
+            while True:
+                # The slice about to be read and the slices fetched ahead of it
+                while len(pending_slices) <= window:
+                    stream_slice = next(slice_iterator, _END)
+                    if stream_slice is _END:
+                        break
+                    self._submit(executor, stream_slice, stop)
+                    pending_slices.append(stream_slice)
+                if not pending_slices:
+                    return
+                stream_slice = pending_slices.popleft()
+                yield stream_slice
+                # Records of the slice are released if the slice was not read
+                self._discard(stream_slice)
+                window = self._max_prefetched_slices
+        finally:
+            for stream_slice in pending_slices:
+                self._discard(stream_slice)
+            # Fetches in progress stop before their next request rather than running in the background once the reader is gone
+            stop.set()
+            executor.shutdown(wait=False)
+
+    def pop(self, stream_slice: Optional[Mapping[str, Any]]) -> Optional[T]:
+        """
+        Waits for the records of the slice to be fetched. Exceptions raised when fetching the slice are raised by pop.
+
+        :param stream_slice: a slice yielded by prefetch
+        :return: the records of the slice, or None if they were not fetched ahead, in which case the caller fetches them
+        """
+        with self._lock:
+            fetch = self._fetches.get(id(stream_slice))
+            if fetch is None or fetch[0] is not stream_slice:
+                return None
+            del self._fetches[id(stream_slice)]
+        return fetch[1].result()
+
+    def has_pending_fetches(self) -> bool:
+        """
+        :return: True if slices fetched ahead were not popped yet
+        """
+        with self._lock:
+            return bool(self._fetches)
+
+    def _submit(self, executor: ThreadPoolExecutor, stream_slice: Optional[Mapping[str, Any]], stop: threading.Event) -> None:
+        with self._lock:
+            # A slice yielded several times, e.g. None, is only fetched ahead the first time
+            if id(stream_slice) not in self._fetches:
+                self._fetches[id(stream_slice)] = (stream_slice, executor.submit(self._fetch, stream_slice, stop))
+
+    def _fetch(self, stream_slice: Optional[Mapping[str, Any]], stop: threading.Event) -> T:
+        with stream_profiler.track_stream(self._name):
+            return self._fetch_slice(stream_slice, stop)
+
+    def _discard(self, stream_slice: Optional[Mapping[str, Any]]) -> None:
+        with self._lock:
+            fetch = self._fetches.get(id(stream_slice))
+            if fetch is not None and fetch[0] is stream_slice:
+                del self._fetches[id(stream_slice)]
+                fetch[1].cancel()
+
+
+def read_until_stopped(records: Iterable[T], stop: threading.Event) -> List[T]:
+    """
+    :return: the records, or the ones read until the event was set, in which case the next records and pages are not requested
+    """
+    result = []
+    for record in records:
+        result.append(record)
+        if stop.is_set():
+            break
+    return result
@@ -3,18 +3,34 @@
 #
 
 import logging
+import numbers
 from distutils.util import strtobool
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-from jsonschema import Draft7Validator, ValidationError, validators
+from jsonschema import Draft7Validator, RefResolutionError, RefResolver, ValidationError, validators
+from jsonschema._utils import ensure_list, types_msg
 
 json_to_python_simple = {"string": str, "number": float, "integer": int, "boolean": bool, "null": type(None)}
 json_to_python = {**json_to_python_simple, **{"object": dict, "array": list}}
 python_to_json = {v: k for k, v in json_to_python.items()}
 
+# Same type checks as the ones of the validator class created by TypeTransformer
+type_checks: Dict[str, Callable[[Any], bool]] = {
+    "array": lambda instance: isinstance(instance, list),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "integer": lambda instance: isinstance(instance, int) and not isinstance(instance, bool),
+    "null": lambda instance: instance is None,
+    "number": lambda instance: isinstance(instance, numbers.Number) and not isinstance(instance, bool),
+    "object": lambda instance: isinstance(instance, dict),
+    "string": lambda instance: isinstance(instance, str),
+}
+
 logger = logging.getLogger("airbyte")
 
+# Number of compiled schemas kept by a TypeTransformer. Streams usually have a single schema that is compiled once.
+MAX_COMPILED_SCHEMAS = 64
+
 
 class TransformConfig(Flag):
     """
@@ -35,6 +51,24 @@ class TransformConfig(Flag):
     CustomSchemaNormalization = auto()
 
 
+class UnsupportedSchemaError(Exception):
+    """Raised when a schema uses a construct that is only handled by the generic jsonschema traversal"""
+
+
+class CompiledSchema:
+    """
+    Normalization plan of a (sub)schema. It mirrors how the jsonschema validator created by TypeTransformer traverses a record: the
+    "type", "properties" and "items" keywords are handled in the order they appear in the schema and "$ref"s are resolved once, when the
+    schema is compiled.
+    """
+
+    __slots__ = ("schema", "steps")
+
+    def __init__(self, schema: Mapping[str, Any]):
+        self.schema = schema
+        self.steps: List[Tuple[Any, ...]] = []
+
+
 class TypeTransformer:
     """
     Class for transforming object before output.
@@ -57,6 +91,9 @@ class TypeTransformer:
             if key in ["type", "array", "$ref", "properties", "items"]
         }
         self._normalizer = validators.create(meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators)
+        # Compiled schemas keyed by the id of the schema they were compiled from. The schema is kept along with it so that its id
+        # cannot be reused by another object. None means that the schema can only be handled by the jsonschema validator.
+        self._compiled_schemas: Dict[int, Tuple[Mapping[str, Any], Optional[CompiledSchema]]] = {}
 
     def registerCustomTransform(self, normalization_callback: Callable[[Any, Dict[str, Any]], Any]) -> Callable:
         """
@@ -180,6 +217,13 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
+        compiled_schema = self._get_compiled_schema(schema)
+        if compiled_schema is not None:
+            self._transform_compiled(compiled_schema, record, ())
+        else:
+            self._transform_with_validator(record, schema)
+
+    def _transform_with_validator(self, record: Dict[str, Any], schema: Mapping[str, Any]):
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -188,9 +232,189 @@ class TypeTransformer:
             """
             logger.warning(self.get_error_message(e))
 
+    def _get_compiled_schema(self, schema: Mapping[str, Any]) -> Optional[CompiledSchema]:
+        """
+        Compiles a schema the first time it is seen. Schemas are cached by identity so they must not be mutated once used to transform
+        records.
+        """
+        cached = self._compiled_schemas.get(id(schema))
+        if cached and cached[0] is schema:
+            return cached[1]
+
+        try:
+            compiled_schema: Optional[CompiledSchema] = self._compile(schema, RefResolver.from_schema(schema), {})
+        except (UnsupportedSchemaError, RefResolutionError):
+            compiled_schema = None
+        if len(self._compiled_schemas) >= MAX_COMPILED_SCHEMAS:
+            self._compiled_schemas.clear()
+        self._compiled_schemas[id(schema)] = (schema, compiled_schema)
+        return compiled_schema
+
+    def _compile(self, schema: Any, resolver: RefResolver, compiled: Dict[int, CompiledSchema]) -> CompiledSchema:
+        """
+        :param compiled: already compiled subschemas by id, which allows recursive schemas
+        """
+        schema = self._resolve(schema, resolver)
+        if id(schema) in compiled:
+            return compiled[id(schema)]
+        if "$id" in schema:
+            raise UnsupportedSchemaError("Resolution scopes are not supported")
+
+        compiled_schema = CompiledSchema(schema)
+        compiled[id(schema)] = compiled_schema
+        for key, value in schema.items():
+            if key == "type":
+                types = ensure_list(value)
+                if not all(isinstance(type_, str) and type_ in type_checks for type_ in types):
+                    raise UnsupportedSchemaError(f"Unsupported type {value}")
+                compiled_schema.steps.append(("type", value, tuple(type_checks[type_] for type_ in types)))
+            elif key == "properties":
+                if not isinstance(value, Mapping):
+                    raise UnsupportedSchemaError("properties must be a mapping")
+                compiled_properties = [
+                    (property_name, *self._compile_subschema(subschema, resolver, compiled)) for property_name, subschema in value.items()
+                ]
+                compiled_schema.steps.append(("properties", compiled_properties))
+            elif key == "items":
+                compiled_schema.steps.append(("items", *self._compile_subschema(value, resolver, compiled)))
+        return compiled_schema
+
+    def _compile_subschema(self, subschema: Any, resolver: RefResolver, compiled: Dict[int, CompiledSchema]) -> Tuple[Any, ...]:
+        """
+        :return: the schema used to normalize values, the default converter for it and the compiled subschema used to descend into the
+        values. If a reference cannot be resolved, the schema is None and the error is returned in place of the compiled subschema so
+        that it is only raised once a value needs it, as the jsonschema traversal does.
+        """
+        try:
+            normalization_schema = self._resolve_once(subschema, resolver)
+            return normalization_schema, self._compile_default_converter(normalization_schema), self._compile(subschema, resolver, compiled)
+        except RefResolutionError as e:
+            return None, None, e
+
+    @staticmethod
+    def _resolve_once(schema: Any, resolver: RefResolver) -> Mapping[str, Any]:
+        if not isinstance(schema, Mapping):
+            raise UnsupportedSchemaError("Only object schemas are supported")
+        if "$ref" in schema:
+            ref = schema["$ref"]
+            if not isinstance(ref, str) or not ref.startswith("#"):
+                raise UnsupportedSchemaError("Only local references are supported")
+            _, schema = resolver.resolve(ref)
+            if not isinstance(schema, Mapping):
+                raise UnsupportedSchemaError("Only object schemas are supported")
+        return schema
+
+    def _resolve(self, schema: Any, resolver: RefResolver) -> Mapping[str, Any]:
+        # A schema with a $ref is fully replaced by the referenced schema, which can itself be a reference
+        seen = set()
+        schema = self._resolve_once(schema, resolver)
+        while "$ref" in schema:
+            if id(schema) in seen:
+                raise UnsupportedSchemaError("Circular references are not supported")
+            seen.add(id(schema))
+            schema = self._resolve_once(schema, resolver)
+        return schema
+
+    def _compile_default_converter(self, subschema: Mapping[str, Any]) -> Optional[Callable[[Any], Any]]:
+        """
+        Builds a function converting a value the same way default_convert does for this subschema, with the target type worked out once.
+        :return: None if no default normalization is applied
+        """
+        if TransformConfig.DefaultSchemaNormalization not in self._config:
+            return None
+        if type(self).default_convert is not TypeTransformer.default_convert:
+            # default_convert is overridden and has to be called as is
+            return lambda original_item: self.default_convert(original_item, subschema)
+
+        target_type = subschema.get("type", [])
+        keep_none = "null" in target_type
+        if isinstance(target_type, list):
+            target_type = [t for t in target_type if t != "null"]
+            if len(target_type) != 1:
+                return _identity
+            target_type = target_type[0]
+
+        if target_type == "string":
+            convert = str
+        elif target_type == "number":
+            convert = float
+        elif target_type == "integer":
+            convert = int
+        elif target_type == "boolean":
+
+            def convert(original_item: Any) -> Any:
+                if isinstance(original_item, str):
+                    return strtobool(original_item) == 1
+                return bool(original_item)
+
+        elif target_type == "array":
+            # Evaluated on each call as in default_convert since it fails for some "items" values
+            return lambda original_item: TypeTransformer.default_convert(original_item, subschema)
+        else:
+            return _identity
+
+        def converter(original_item: Any) -> Any:
+            if original_item is None and keep_none:
+                return None
+            try:
+                return convert(original_item)
+            except (ValueError, TypeError):
+                return original_item
+
+        return converter
+
+    def _transform_compiled(self, compiled_schema: CompiledSchema, instance: Any, path: Tuple[Any, ...]):
+        for step in compiled_schema.steps:
+            kind = step[0]
+            if kind == "type":
+                _, types, checks = step
+                if not any(check(instance) for check in checks):
+                    error = ValidationError(
+                        types_msg(instance, ensure_list(types)),
+                        validator="type",
+                        validator_value=types,
+                        instance=instance,
+                        schema=compiled_schema.schema,
+                        path=path,
+                    )
+                    logger.warning(self.get_error_message(error))
+            elif kind == "properties":
+                if not isinstance(instance, dict):
+                    continue
+                # As with the validator, every property is normalized before descending into any of them
+                for property_name, normalization_schema, converter, compiled_property in step[1]:
+                    if property_name in instance:
+                        if normalization_schema is None:
+                            raise RefResolutionError(compiled_property)
+                        instance[property_name] = self._normalize_compiled(instance[property_name], normalization_schema, converter)
+                for property_name, _, _, compiled_property in step[1]:
+                    if property_name in instance:
+                        self._transform_compiled(compiled_property, instance[property_name], path + (property_name,))
+            elif kind == "items":
+                if not isinstance(instance, list):
+                    continue
+                _, normalization_schema, converter, compiled_items = step
+                if normalization_schema is None and instance:
+                    raise RefResolutionError(compiled_items)
+                for index, item in enumerate(instance):
+                    instance[index] = self._normalize_compiled(item, normalization_schema, converter)
+                for index, item in enumerate(instance):
+                    self._transform_compiled(compiled_items, item, path + (index,))
+
+    def _normalize_compiled(self, original_item: Any, subschema: Mapping[str, Any], converter: Optional[Callable[[Any], Any]]) -> Any:
+        if converter:
+            original_item = converter(original_item)
+        if self._custom_normalizer:
+            original_item = self._custom_normalizer(original_item, subschema)
+        return original_item
+
     def get_error_message(self, e: ValidationError) -> str:
         instance_json_type = python_to_json[type(e.instance)]
         key_path = "." + ".".join(map(str, e.path))
         return (
             f"Failed to transform value {repr(e.instance)} of type '{instance_json_type}' to '{e.validator_value}', key path: '{key_path}'"
         )
+
+
+def _identity(value: Any) -> Any:
+    return value
@@ -2,7 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, List, Mapping
+import logging
+import time
+from typing import Any, Iterable, List, Mapping, Tuple
 
 import dpath.util
 
@@ -53,20 +55,80 @@ def get_secrets(connection_specification: Mapping[str, Any], config: Mapping[str
     return result
 
 
+_logger = logging.getLogger("airbyte")
+
 __SECRETS_FROM_CONFIG: List[str] = []
+# The distinct secrets to replace
+__SECRETS_TO_FILTER: List[str] = []
+# Number of strings filtered and time spent filtering them, only measured and reported in debug mode. Concurrent updates from several
+# threads may lose a few increments, which is good enough for an estimate of the overhead
+__FILTERED_STRINGS = 0
+__FILTERING_NS = 0
 
 
 def update_secrets(secrets: List[str]):
     """Update the list of secrets to be replaced"""
-    global __SECRETS_FROM_CONFIG
+    global __SECRETS_FROM_CONFIG, __SECRETS_TO_FILTER, __FILTERED_STRINGS, __FILTERING_NS
     __SECRETS_FROM_CONFIG = secrets
+    __SECRETS_TO_FILTER = list(dict.fromkeys(str(secret) for secret in secrets if secret))
+    __FILTERED_STRINGS = 0
+    __FILTERING_NS = 0
 
 
 def filter_secrets(string: str) -> str:
     """Filter secrets from a string by replacing them with ****"""
-    # TODO this should perform a maximal match for each secret. if "x" and "xk" are both secret values, and this method is called twice on
-    #  the input "xk", then depending on call order it might only obfuscate "*k". This is a bug.
-    for secret in __SECRETS_FROM_CONFIG:
-        if secret:
-            string = string.replace(str(secret), "****")
+    global __FILTERED_STRINGS, __FILTERING_NS
+    if not __SECRETS_TO_FILTER:
+        return string
+    if not _logger.isEnabledFor(logging.DEBUG):
+        return _filter_secrets(string)
+    start = time.perf_counter_ns()
+    string = _filter_secrets(string)
+    __FILTERING_NS += time.perf_counter_ns() - start
+    __FILTERED_STRINGS += 1
+    return string
+
+
+def _filter_secrets(string: str) -> str:
+    # The secrets are searched one after the other with str methods rather than with a single pattern of all of them: the re module
+    # does not build an automaton of the alternatives, so for a 300 characters log line a pattern of 3 to 50 secrets is 4 to 5 times
+    # slower than as many substring searches. Only the secrets found in the string, which are few, are located
+    found_secrets = [secret for secret in __SECRETS_TO_FILTER if secret in string]
+    if found_secrets:
+        string = _mask_secrets(string, found_secrets)
     return string
+
+
+def get_filtering_overhead() -> Tuple[int, float]:
+    """
+    :return: the number of strings filtered since the secrets were updated and the time spent filtering them, in seconds
+    """
+    return __FILTERED_STRINGS, __FILTERING_NS / 1e9
+
+
+def _mask_secrets(string: str, secrets: Iterable[str]) -> str:
+    """
+    Replaces the union of the occurrences of all the secrets, so that no part of a secret is left when secrets contain or overlap each
+    other, e.g. "xabcdx" is filtered as "x****x" if "abc" and "bcd" are secrets
+    """
+    spans = []
+    for secret in secrets:
+        start = string.find(secret)
+        while start != -1:
+            spans.append((start, start + len(secret)))
+            # Occurrences overlapping the previous one are found as well
+            start = string.find(secret, start + 1)
+    spans.sort()
+
+    parts = []
+    position = 0
+    masked_start, masked_end = spans[0]
+    for start, end in spans[1:]:
+        if start < masked_end:
+            masked_end = max(masked_end, end)
+        else:
+            parts.extend((string[position:masked_start], "****"))
+            position = masked_end
+            masked_start, masked_end = start, end
+    parts.extend((string[position:masked_start], "****", string[masked_end:]))
+    return "".join(parts)
@@ -32,17 +32,36 @@ class EventTimer:
         self.count += 1
         self.stack.insert(0, self.events[name])
 
-    def finish_event(self):
+    def finish_event(self, name: Optional[str] = None):
         """
-        Finish the current event and pop it from the stack.
+        Finish the current event and pop it from the stack. If a name is provided, the event with this name is finished instead so that
+        events started by concurrent tasks can overlap.
         """
 
-        if self.stack:
+        if name is not None:
+            event = self.events.get(name)
+            if event in self.stack:
+                self.stack.remove(event)
+                event.finish()
+            else:
+                logger.warning(f"{self.name} finish_event called for {name} without start_event")
+        elif self.stack:
             event = self.stack.pop(0)
             event.finish()
         else:
             logger.warning(f"{self.name} finish_event called without start_event")
 
+    def add_event_duration(self, name: str, duration_ns: int):
+        """
+        Adds a duration to a finished event, creating it if needed. Used to sum up the time spent on a task made of many short calls.
+        """
+        event = self.events.get(name)
+        if event is None or event.end is None:
+            self.events[name] = Event(name=name, start=0, end=duration_ns)
+            self.count += 1
+        else:
+            event.end += duration_ns
+
     def report(self, order_by="name"):
         """
         :param order_by: 'name' or 'duration'
@@ -65,11 +84,14 @@ class Event:
     @property
     def duration(self) -> float:
         """Returns the elapsed time in seconds or positive infinity if event was never finished"""
-        if self.end:
+        if self.end is not None:
             return (self.end - self.start) / 1e9
         return float("+inf")
 
     def __str__(self):
+        if self.end is None:
+            # Events of concurrent tasks can still be running when another one reports
+            return f"{self.name} running"
         return f"{self.name} {datetime.timedelta(seconds=self.duration)}"
 
     def finish(self):
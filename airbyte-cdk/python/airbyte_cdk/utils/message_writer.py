@@ -0,0 +1,169 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, TextIO
+
+from airbyte_cdk.utils.stream_profiler import STDOUT_WRITE, stream_profiler
+
+# Serialized AirbyteMessages always start with their type as it is the first field of the model and it is always set
+STATE_MESSAGE_PREFIX = '{"type": "STATE"'
+DEFAULT_MAX_BUFFER_SIZE = 64 * 1024
+DEFAULT_MAX_BUFFER_AGE_SECONDS = 1.0
+
+
+class BufferedMessageWriter:
+    """
+    Writes serialized AirbyteMessages as lines to an output stream, by default stdout, batching many messages into a single write.
+
+    The buffer is flushed:
+    * after a STATE message so that a state is never held back while the records it covers are already out
+    * once it holds more than `max_buffer_size` characters
+    * once the oldest buffered message is older than `max_buffer_age_seconds`, by the next write or by a background thread if no message
+      is written meanwhile
+    * when the writer is closed or flushed explicitly
+
+    Messages can be written from several threads. As messages are serialized with ASCII characters only, the number of characters
+    written is also the number of bytes written.
+    """
+
+    def __init__(
+        self,
+        output: Optional[TextIO] = None,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        max_buffer_age_seconds: float = DEFAULT_MAX_BUFFER_AGE_SECONDS,
+    ):
+        """
+        :param output: the stream to write to. Defaults to the sys.stdout at the time of each write
+        :param max_buffer_size: number of characters after which the buffer is flushed. 0 disables buffering
+        :param max_buffer_age_seconds: time after which buffered messages are flushed
+        """
+        self._output = output
+        self._max_buffer_size = max_buffer_size
+        self._max_buffer_age_seconds = max_buffer_age_seconds
+        self._buffer: List[str] = []
+        self._buffer_size = 0
+        self._buffer_started_at = 0.0
+        self._bytes_written = 0
+        self._messages_written = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        # Flushes the buffer once it is too old if nothing is written, started by the first buffered message
+        self._flusher: Optional[threading.Thread] = None
+
+    @property
+    def bytes_written(self) -> int:
+        """Number of bytes written to the output so far, buffered messages excluded"""
+        return self._bytes_written
+
+    @property
+    def messages_written(self) -> int:
+        """Number of messages written to the output so far, buffered messages excluded"""
+        return self._messages_written
+
+    def write(self, message: str) -> None:
+        with self._condition:
+            if not self._buffer:
+                self._buffer_started_at = time.monotonic()
+                self._condition.notify_all()
+            self._buffer.append(message)
+            self._buffer.append("\n")
+            self._buffer_size += len(message) + 1
+
+            if (
+                self._buffer_size >= self._max_buffer_size
+                or message.startswith(STATE_MESSAGE_PREFIX)
+                or time.monotonic() - self._buffer_started_at >= self._max_buffer_age_seconds
+            ):
+                self._flush()
+            elif self._flusher is None and not self._closed:
+                self._flusher = threading.Thread(target=self._flush_when_stale, name="airbyte_message_writer", daemon=True)
+                self._flusher.start()
+
+    def flush(self) -> None:
+        with self._condition:
+            self._flush()
+
+    def close(self) -> None:
+        with self._condition:
+            self._flush()
+            self._closed = True
+            self._condition.notify_all()
+        if self._flusher is not None:
+            self._flusher.join()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            output = self._output or sys.stdout
+            with stream_profiler.stage(STDOUT_WRITE):
+                output.write("".join(self._buffer))
+                output.flush()
+            self._bytes_written += self._buffer_size
+            # Every message is followed by a newline in the buffer
+            self._messages_written += len(self._buffer) // 2
+            self._buffer = []
+            self._buffer_size = 0
+
+    def _flush_when_stale(self) -> None:
+        with self._condition:
+            while not self._closed:
+                if not self._buffer:
+                    self._condition.wait()
+                    continue
+                age = time.monotonic() - self._buffer_started_at
+                if age >= self._max_buffer_age_seconds:
+                    self._flush()
+                else:
+                    self._condition.wait(self._max_buffer_age_seconds - age)
+
+    def __enter__(self) -> "BufferedMessageWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class _WriterStream:
+    """
+    File-like object writing each line written to it as a message of the writer
+    """
+
+    def __init__(self, writer: BufferedMessageWriter):
+        self._writer = writer
+        self._partial_line = ""
+
+    def write(self, text: str) -> None:
+        lines = (self._partial_line + text).split("\n")
+        self._partial_line = lines.pop()
+        for line in lines:
+            self._writer.write(line)
+
+    def flush(self) -> None:
+        pass
+
+
+@contextmanager
+def redirect_stdout_log_handlers(writer: BufferedMessageWriter) -> Iterator[None]:
+    """
+    Writes the log lines of the logging handlers writing to stdout through the writer, so that log messages are not written ahead of
+    the messages written before them and still in the buffer of the writer
+    """
+    loggers = [logging.getLogger()]
+    loggers.extend(logger for logger in logging.Logger.manager.loggerDict.values() if isinstance(logger, logging.Logger))
+    redirected_handlers = [
+        handler
+        for logger in loggers
+        for handler in logger.handlers
+        if isinstance(handler, logging.StreamHandler) and handler.stream is sys.stdout
+    ]
+    original_streams = [handler.setStream(_WriterStream(writer)) for handler in redirected_handlers]
+    try:
+        yield
+    finally:
+        for handler, stream in zip(redirected_handlers, original_streams):
+            handler.setStream(stream)
@@ -3,7 +3,7 @@
 #
 
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 from airbyte_cdk.models import AirbyteRecordMessage
 from genson import SchemaBuilder
@@ -49,16 +49,49 @@ class SchemaInferrer:
     Instances of this class are stateful, meaning they build their inferred schemas
     from every record passed into the accumulate method.
 
+    The types of each field are merged as records are accumulated, producing the same schemas as genson's NoRequiredSchemaBuilder
+    cleaned up by _clean, without keeping a genson schema builder per field. To bound the time and memory spent on wide or deeply
+    nested records, inference can be limited to the first records of each stream, to a number of properties per object and to a depth.
+    Inferrers fed by different workers can be merged.
     """
 
-    stream_to_builder: Dict[str, SchemaBuilder]
-
-    def __init__(self):
-        self.stream_to_builder = defaultdict(NoRequiredSchemaBuilder)
+    def __init__(self, max_records_per_stream: Optional[int] = None, max_properties: Optional[int] = None, max_depth: Optional[int] = None):
+        """
+        :param max_records_per_stream: number of records of each stream after which the next records are ignored
+        :param max_properties: number of properties of each object after which the next properties are ignored
+        :param max_depth: depth of the objects and arrays whose properties and items are ignored, the records being at depth 0
+        """
+        self._max_records_per_stream = max_records_per_stream
+        self._max_properties = max_properties
+        self._max_depth = max_depth
+        self._stream_to_node: Dict[str, _SchemaNode] = {}
+        self._stream_to_record_count: Dict[str, int] = defaultdict(int)
 
     def accumulate(self, record: AirbyteRecordMessage):
         """Uses the input record to add to the inferred schemas maintained by this object"""
-        self.stream_to_builder[record.stream].add_object(record.data)
+        self.accumulate_data(record.stream, record.data)
+
+    def accumulate_data(self, stream_name: str, data: Mapping[str, Any]) -> None:
+        """Uses the data of a record of the stream to add to its inferred schema"""
+        if self._max_records_per_stream is not None and self._stream_to_record_count[stream_name] >= self._max_records_per_stream:
+            return
+        self._stream_to_record_count[stream_name] += 1
+        node = self._stream_to_node.get(stream_name)
+        if node is None:
+            node = self._stream_to_node[stream_name] = _SchemaNode()
+        self._add_value(node, data, 0)
+
+    def merge(self, other: "SchemaInferrer") -> None:
+        """
+        Adds the records accumulated by another inferrer, e.g. one inferring the schema of other records in a parallel worker. The
+        limits of this inferrer apply to the merged schemas.
+        """
+        for stream_name, other_node in other._stream_to_node.items():
+            node = self._stream_to_node.get(stream_name)
+            if node is None:
+                node = self._stream_to_node[stream_name] = _SchemaNode()
+            self._merge_node(node, other_node, 0)
+            self._stream_to_record_count[stream_name] += other._stream_to_record_count[stream_name]
 
     def get_inferred_schemas(self) -> Dict[str, InferredSchema]:
         """
@@ -66,8 +99,8 @@ class SchemaInferrer:
         passed via the accumulate method
         """
         schemas = {}
-        for stream_name, builder in self.stream_to_builder.items():
-            schemas[stream_name] = self._clean(builder.to_schema())
+        for stream_name in self._stream_to_node:
+            schemas[stream_name] = self.get_stream_schema(stream_name)
         return schemas
 
     def _clean(self, node: InferredSchema):
@@ -97,4 +130,98 @@ class SchemaInferrer:
         """
         Returns the inferred JSON schema for the specified stream. Might be `None` if there were no records for the given stream name.
         """
-        return self._clean(self.stream_to_builder[stream_name].to_schema()) if stream_name in self.stream_to_builder else None
+        node = self._stream_to_node.get(stream_name)
+        if node is None:
+            return None
+        return self._clean({"$schema": _JSON_SCHEMA_VERSION, **node.to_schema()})
+
+    def _add_value(self, node: "_SchemaNode", value: Any, depth: int) -> None:
+        value_type = _get_json_type(value)
+        node.types[value_type] = None
+        if value_type == "object":
+            if self._max_depth is not None and depth >= self._max_depth:
+                return
+            if node.properties is None:
+                node.properties = {}
+            for key, property_value in value.items():
+                property_node = node.properties.get(key)
+                if property_node is None:
+                    if self._max_properties is not None and len(node.properties) >= self._max_properties:
+                        continue
+                    property_node = node.properties[key] = _SchemaNode()
+                self._add_value(property_node, property_value, depth + 1)
+        elif value_type == "array":
+            if self._max_depth is not None and depth >= self._max_depth:
+                return
+            for item in value:
+                if node.items is None:
+                    node.items = _SchemaNode()
+                self._add_value(node.items, item, depth + 1)
+
+    def _merge_node(self, node: "_SchemaNode", other: "_SchemaNode", depth: int) -> None:
+        node.types.update(other.types)
+        if self._max_depth is not None and depth >= self._max_depth:
+            return
+        if other.properties is not None:
+            if node.properties is None:
+                node.properties = {}
+            for key, other_property_node in other.properties.items():
+                property_node = node.properties.get(key)
+                if property_node is None:
+                    if self._max_properties is not None and len(node.properties) >= self._max_properties:
+                        continue
+                    property_node = node.properties[key] = _SchemaNode()
+                self._merge_node(property_node, other_property_node, depth + 1)
+        if other.items is not None:
+            if node.items is None:
+                node.items = _SchemaNode()
+            self._merge_node(node.items, other.items, depth + 1)
+
+
+_JSON_SCHEMA_VERSION = "http://json-schema.org/schema#"
+_SCALAR_TYPES = {type(None): "null", bool: "boolean", int: "number", float: "number", str: "string"}
+
+
+def _get_json_type(value: Any) -> str:
+    json_type = _SCALAR_TYPES.get(type(value))
+    if json_type:
+        return json_type
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, str):
+        return "string"
+    raise ValueError(f"Cannot infer the JSON schema type of {value!r}")
+
+
+class _SchemaNode:
+    """
+    Types seen at a position of the records, in the order they were first seen, with the properties of the objects and the items of
+    the arrays seen at this position
+    """
+
+    __slots__ = ("types", "properties", "items")
+
+    def __init__(self) -> None:
+        self.types: Dict[str, None] = {}
+        self.properties: Optional[Dict[str, "_SchemaNode"]] = None
+        self.items: Optional["_SchemaNode"] = None
+
+    def to_schema(self) -> InferredSchema:
+        # Types are combined as genson does: the types without any other keyword are listed in a single "type" and the others are
+        # alternatives of an anyOf
+        simple_types = set()
+        schemas = []
+        for json_type in self.types:
+            if json_type == "object" and self.properties:
+                schemas.append({"type": "object", "properties": {key: node.to_schema() for key, node in self.properties.items()}})
+            elif json_type == "array" and self.items is not None:
+                schemas.append({"type": "array", "items": self.items.to_schema()})
+            else:
+                simple_types.add(json_type)
+        if simple_types:
+            schemas.insert(0, {"type": simple_types.pop() if len(simple_types) == 1 else sorted(simple_types)})
+        if len(schemas) == 1:
+            return schemas[0]
+        return {"anyOf": schemas} if schemas else {}
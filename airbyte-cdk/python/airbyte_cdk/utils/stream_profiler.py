@@ -0,0 +1,198 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+# Stages of the processing of the records of a stream
+HTTP_WAIT = "http_wait"
+RESPONSE_DECODE = "response_decode"
+RECORD_EXTRACTION = "record_extraction"
+TRANSFORMATION = "transformation"
+SERIALIZATION = "serialization"
+STDOUT_WRITE = "stdout_write"
+STAGES = (HTTP_WAIT, RESPONSE_DECODE, RECORD_EXTRACTION, TRANSFORMATION, SERIALIZATION, STDOUT_WRITE)
+
+# Name under which the time spent outside of any stream is reported, e.g. writing messages of several streams at once
+UNATTRIBUTED = "unattributed"
+
+
+@dataclass
+class _StreamProfile:
+    duration_ns: int = 0
+    stages_ns: Dict[str, int] = field(default_factory=dict)
+    requests: int = 0
+    bytes: int = 0
+    records: int = 0
+
+    def to_report(self) -> Mapping[str, Any]:
+        duration = self.duration_ns / 1e9
+        stages = {stage: self.stages_ns.get(stage, 0) / 1e9 for stage in STAGES}
+        report: Dict[str, Any] = {"duration_seconds": duration, "stages_seconds": stages}
+        if self.duration_ns:
+            # Time of the stream which is not spent in any of the stages, e.g. in the code of the connector
+            stages["other"] = max(duration - sum(stages.values()), 0.0)
+        report.update(requests=self.requests, bytes=self.bytes, records=self.records)
+        if self.duration_ns:
+            report.update(
+                requests_per_second=self.requests / duration,
+                bytes_per_second=self.bytes / duration,
+                records_per_second=self.records / duration,
+            )
+        return report
+
+
+class _Stage:
+    """
+    Measures the time spent in a stage, excluding the time of the stages nested in it, e.g. decoding a response while extracting its
+    records.
+    """
+
+    __slots__ = ("_profiler", "_name", "_stream", "_start", "nested_ns")
+
+    def __init__(self, profiler: "StreamProfiler", name: str, stream: Optional[str]):
+        self._profiler = profiler
+        self._name = name
+        self._stream = stream
+        self._start = 0
+        self.nested_ns = 0
+
+    def __enter__(self) -> None:
+        self._profiler._stages().append(self)
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *args: Any) -> None:
+        elapsed = time.perf_counter_ns() - self._start
+        stages = self._profiler._stages()
+        stages.pop()
+        if stages:
+            stages[-1].nested_ns += elapsed
+        self._profiler._add_stage_duration(self._stream, self._name, elapsed - self.nested_ns)
+
+
+class _NoStage:
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+
+_NO_STAGE = _NoStage()
+
+
+class StreamProfiler:
+    """
+    Splits the time spent reading each stream into the stages of the processing of its records and counts its requests, the bytes of
+    their responses and its records. Profiling is disabled by default and enabled with the --profile option of the read command, which
+    emits the report at the end of the sync.
+
+    Measurements are attributed to the stream being read by the current thread, or to the stream given explicitly. When disabled, the
+    instrumented code only pays for a call returning a shared no-op context manager.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._profiles: Dict[str, _StreamProfile] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self) -> None:
+        """Enables profiling, starting from an empty report"""
+        with self._lock:
+            self._profiles = {}
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    @contextmanager
+    def profile_stream(self, stream: str) -> Iterator[None]:
+        """
+        Measures the duration of the read of a stream, the measurements of the current thread being attributed to the stream meanwhile
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter_ns()
+        with self.track_stream(stream):
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self._get_profile(stream).duration_ns += time.perf_counter_ns() - start
+
+    @contextmanager
+    def track_stream(self, stream: str) -> Iterator[None]:
+        """
+        Attributes the measurements of the current thread to the stream, e.g. in the threads reading the slices of the stream
+        """
+        previous_stream = getattr(self._local, "stream", None)
+        self._local.stream = stream
+        try:
+            yield
+        finally:
+            self._local.stream = previous_stream
+
+    def stage(self, name: str, stream: Optional[str] = None) -> Any:
+        """
+        :param name: one of the STAGES
+        :param stream: the stream the stage is attributed to, defaults to the stream being read by the current thread
+        :return: a context manager measuring the time spent in the stage
+        """
+        if not self.enabled:
+            return _NO_STAGE
+        return _Stage(self, name, stream)
+
+    def add_stage_duration(self, name: str, duration_ns: int, stream: Optional[str] = None) -> None:
+        """
+        Adds time measured outside of a stage context manager, e.g. by code interleaving the work of several streams on a thread
+        """
+        if self.enabled:
+            self._add_stage_duration(stream, name, duration_ns)
+
+    def count_request(self, response_bytes: int, stream: Optional[str] = None) -> None:
+        if self.enabled:
+            with self._lock:
+                profile = self._get_profile(stream or self._current_stream())
+                profile.requests += 1
+                profile.bytes += response_bytes
+
+    def count_records(self, records: int, stream: Optional[str] = None) -> None:
+        if self.enabled:
+            with self._lock:
+                self._get_profile(stream or self._current_stream()).records += records
+
+    def report(self) -> Mapping[str, Any]:
+        """
+        :return: the profile of each stream, in seconds and counts of requests, bytes and records
+        """
+        with self._lock:
+            return {"streams": {stream: profile.to_report() for stream, profile in self._profiles.items()}}
+
+    def _current_stream(self) -> str:
+        return getattr(self._local, "stream", None) or UNATTRIBUTED
+
+    def _stages(self) -> List[_Stage]:
+        stages = getattr(self._local, "stages", None)
+        if stages is None:
+            stages = self._local.stages = []
+        return stages
+
+    def _add_stage_duration(self, stream: Optional[str], stage: str, duration_ns: int) -> None:
+        with self._lock:
+            stages_ns = self._get_profile(stream or self._current_stream()).stages_ns
+            stages_ns[stage] = stages_ns.get(stage, 0) + duration_ns
+
+    def _get_profile(self, stream: str) -> _StreamProfile:
+        profile = self._profiles.get(stream)
+        if profile is None:
+            profile = self._profiles[stream] = _StreamProfile()
+        return profile
+
+
+stream_profiler = StreamProfiler()
@@ -65,7 +65,11 @@ setup(
     ],
     python_requires=">=3.8",
     extras_require={
+        "async": [
+            "aiohttp~=3.8",
+        ],
         "dev": [
+            "aiohttp~=3.8",
             "freezegun",
             "MyPy~=0.812",
             "pytest",
@@ -22,7 +22,13 @@ from airbyte_cdk.connector_builder.connector_builder_handler import (
     list_streams,
     resolve_manifest,
 )
-from airbyte_cdk.connector_builder.main import handle_connector_builder_request, handle_request, read_stream
+from airbyte_cdk.connector_builder.main import (
+    handle_connector_builder_request,
+    handle_request,
+    handle_streamed_request,
+    read_stream,
+    read_stream_message_groups,
+)
 from airbyte_cdk.connector_builder.models import LogMessage, StreamRead, StreamReadPages, StreamReadSlices
 from airbyte_cdk.models import (
     AirbyteLogMessage,
@@ -384,6 +390,45 @@ def test_read():
         assert output_record == expected_airbyte_message
 
 
+def test_read_stream_message_groups_emits_a_record_per_message_group():
+    source = ManifestDeclarativeSource(MANIFEST)
+    page = StreamReadPages(records=[], request=None, response=None)
+    message_groups = [
+        LogMessage(message="here be a log message", level="INFO"),
+        page,
+        StreamReadSlices(pages=[page], slice_descriptor=None, state=None),
+        StreamRead(
+            logs=[], slices=[], test_read_limit_reached=False, inferred_schema=None, inferred_datetime_formats=None, latest_config_update={}
+        ),
+    ]
+
+    with patch("airbyte_cdk.connector_builder.message_grouper.MessageGrouper.stream_message_groups", return_value=iter(message_groups)):
+        catalog = ConfiguredAirbyteCatalog.parse_obj(CONFIGURED_CATALOG)
+        messages = list(read_stream_message_groups(source, TEST_READ_CONFIG, catalog, TestReadLimits()))
+
+    assert [message.record.stream for message in messages] == [_stream_name] * 4
+    assert [message.record.data["message_group_type"] for message in messages] == ["log", "page", "slice", "stream_read"]
+    assert messages[0].record.data["message"] == "here be a log message"
+
+
+def test_handle_streamed_request_streams_message_groups_only_if_the_caller_opts_in(tmp_path, configured_catalog):
+    message_groups = [AirbyteMessage(type=MessageType.RECORD, record=AirbyteRecordMessage(data={}, stream=_stream_name, emitted_at=1))] * 2
+    config_file = tmp_path / "config.json"
+
+    with patch.object(connector_builder.main, "read_stream_message_groups", return_value=iter(message_groups)), patch.object(
+        connector_builder.main, "handle_connector_builder_request", return_value=message_groups[0]
+    ) as handle_connector_builder_request_mock:
+        config_file.write_text(json.dumps(TEST_READ_CONFIG))
+        assert len(list(handle_streamed_request(["read", "--config", str(config_file), "--catalog", str(configured_catalog)]))) == 1
+        assert handle_connector_builder_request_mock.call_count == 1
+
+        streaming_config = copy.deepcopy(TEST_READ_CONFIG)
+        streaming_config["__test_read_config"]["stream_message_groups"] = True
+        config_file.write_text(json.dumps(streaming_config))
+        assert len(list(handle_streamed_request(["read", "--config", str(config_file), "--catalog", str(configured_catalog)]))) == 2
+        assert handle_connector_builder_request_mock.call_count == 1
+
+
 def test_config_update():
     manifest = copy.deepcopy(MANIFEST)
     manifest["definitions"]["retriever"]["requester"]["authenticator"] = {
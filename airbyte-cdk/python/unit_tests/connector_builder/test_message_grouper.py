@@ -8,7 +8,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from airbyte_cdk.connector_builder.message_grouper import MessageGrouper
-from airbyte_cdk.connector_builder.models import HttpRequest, HttpResponse, LogMessage, StreamRead, StreamReadPages
+from airbyte_cdk.connector_builder.models import HttpRequest, HttpResponse, LogMessage, StreamRead, StreamReadPages, StreamReadSlices
 from airbyte_cdk.models import (
     AirbyteControlConnectorConfigMessage,
     AirbyteControlMessage,
@@ -525,6 +525,87 @@ def test_get_grouped_messages_given_maximum_number_of_pages_then_test_read_limit
     assert stream_read.test_read_limit_reached
 
 
+@patch('airbyte_cdk.connector_builder.message_grouper.AirbyteEntrypoint.read')
+def test_given_maximum_number_of_slices_then_source_is_not_read_further(mock_entrypoint_read):
+    request = {}
+    response = {"status_code": 200}
+    messages_read = []
+
+    def _messages():
+        for index in range(MAX_SLICES + 2):
+            for message in [slice_message(f'{{"descriptor": {index}}}'), request_log_message(request), response_log_message(response)]:
+                messages_read.append(message)
+                yield message
+
+    mock_source = make_mock_source(mock_entrypoint_read, _messages())
+    api = MessageGrouper(MAX_PAGES_PER_SLICE, MAX_SLICES)
+
+    stream_read: StreamRead = api.get_message_groups(
+        source=mock_source, config=CONFIG, configured_catalog=create_configured_catalog("hashiras")
+    )
+
+    assert stream_read.test_read_limit_reached
+    assert [stream_slice.slice_descriptor for stream_slice in stream_read.slices] == [{"descriptor": 0}, {"descriptor": 1}, {"descriptor": 2}]
+    assert len(messages_read) == 3 * MAX_SLICES + 1
+
+
+@patch('airbyte_cdk.connector_builder.message_grouper.AirbyteEntrypoint.read')
+def test_given_maximum_number_of_pages_then_next_slices_are_still_read(mock_entrypoint_read):
+    request = {}
+    response = {"status_code": 200}
+    # The last page of the first slice is the next page of a parent stream requested within the slice
+    mock_source = make_mock_source(mock_entrypoint_read, iter(
+        [slice_message('{"descriptor": "first_slice"}')]
+        + [request_log_message(request), response_log_message(response)] * (MAX_PAGES_PER_SLICE + 1)
+        + [slice_message('{"descriptor": "second_slice"}'), request_log_message(request), response_log_message(response)]
+    ))
+    api = MessageGrouper(MAX_PAGES_PER_SLICE, MAX_SLICES)
+
+    stream_read: StreamRead = api.get_message_groups(
+        source=mock_source, config=CONFIG, configured_catalog=create_configured_catalog("hashiras")
+    )
+
+    assert stream_read.test_read_limit_reached
+    assert [stream_slice.slice_descriptor for stream_slice in stream_read.slices] == [
+        {"descriptor": "first_slice"}, {"descriptor": "second_slice"}
+    ]
+    assert [len(stream_slice.pages) for stream_slice in stream_read.slices] == [MAX_PAGES_PER_SLICE + 1, 1]
+
+
+@patch('airbyte_cdk.connector_builder.message_grouper.AirbyteEntrypoint.read')
+def test_stream_message_groups_yields_groups_as_they_complete(mock_entrypoint_read):
+    request = {}
+    response = {"status_code": 200}
+    mock_source = make_mock_source(mock_entrypoint_read, iter(
+        [
+            slice_message('{"descriptor": "first_slice"}'),
+            request_log_message(request),
+            response_log_message(response),
+            record_message("hashiras", {"name": "Muichiro Tokito"}),
+            AirbyteMessage(type=MessageType.LOG, log=AirbyteLogMessage(level=Level.INFO, message="log message")),
+            slice_message('{"descriptor": "second_slice"}'),
+            request_log_message(request),
+            response_log_message(response),
+            record_message("hashiras", {"name": "Shinobu Kocho"}),
+        ]
+    ))
+    api = MessageGrouper(MAX_PAGES_PER_SLICE, MAX_SLICES)
+
+    message_groups = list(api.stream_message_groups(
+        source=mock_source, config=CONFIG, configured_catalog=create_configured_catalog("hashiras")
+    ))
+
+    assert [type(message_group) for message_group in message_groups] == [
+        LogMessage, StreamReadPages, StreamReadSlices, StreamReadPages, StreamReadSlices, StreamRead
+    ]
+    assert message_groups[1].records == [{"name": "Muichiro Tokito"}]
+    assert message_groups[2].pages == [message_groups[1]]
+    assert message_groups[4].slice_descriptor == {"descriptor": "second_slice"}
+    assert message_groups[5].slices == []
+    assert not message_groups[5].test_read_limit_reached
+    assert message_groups[5].inferred_schema["properties"] == {"name": {"type": "string"}}
+
+
 def test_read_stream_returns_error_if_stream_does_not_exist():
     mock_source = MagicMock()
     mock_source.read.side_effect = ValueError("error")
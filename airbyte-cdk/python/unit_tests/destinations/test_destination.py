@@ -136,6 +136,43 @@ class OrderedIterableMatcher(Iterable):
         return list(self) == list(other)
 
 
+class TestParseInputStream:
+    @pytest.mark.parametrize(
+        "line",
+        [
+            pytest.param(_wrapped(_record("s1", {"k1": "v1"})).json(exclude_unset=True), id="test_record"),
+            pytest.param(
+                AirbyteMessage(
+                    type=Type.RECORD, record=AirbyteRecordMessage(namespace="ns", stream="s1", data={"k1": {"k2": [1]}}, emitted_at=0)
+                ).json(exclude_unset=True),
+                id="test_record_with_namespace",
+            ),
+            pytest.param('{"type": "RECORD", "record": {"stream": "s1", "data": {}, "emitted_at": 1.5}}', id="test_record_with_coerced_field"),
+            pytest.param('{"type": "RECORD", "record": {"stream": "s1", "data": {}, "emitted_at": 0, "extra": 1}}', id="test_record_with_extra"),
+            pytest.param('{"type": "RECORD"}', id="test_record_without_record"),
+            pytest.param(_wrapped(_state({"k1": "v1"})).json(exclude_unset=True), id="test_state"),
+        ],
+    )
+    def test_messages_are_parsed_as_pydantic_does(self, line: str, destination: Destination):
+        expected = AirbyteMessage.parse_raw(line)
+
+        messages = list(destination._parse_input_stream(io.StringIO(line)))
+
+        assert messages == [expected]
+        assert messages[0].json(exclude_unset=True) == expected.json(exclude_unset=True)
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            pytest.param("not a json", id="test_invalid_json"),
+            pytest.param('"a string"', id="test_not_a_message"),
+            pytest.param('{"type": "RECORD", "record": {"stream": "s1", "data": "not an object", "emitted_at": 0}}', id="test_invalid_record"),
+        ],
+    )
+    def test_invalid_lines_are_ignored(self, line: str, destination: Destination):
+        assert list(destination._parse_input_stream(io.StringIO(line))) == []
+
+
 class TestRun:
     def test_run_initializes_exception_handler(self, mocker, destination: Destination):
         mocker.patch.object(destination_module, "init_uncaught_exception_handler")
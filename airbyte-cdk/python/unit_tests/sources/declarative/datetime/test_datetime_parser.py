@@ -50,3 +50,60 @@ def test_format_datetime(test_name, input_dt, datetimeformat, expected_output):
     parser = DatetimeParser()
     output_date = parser.format(input_dt, datetimeformat)
     assert expected_output == output_date
+
+
+@pytest.mark.parametrize(
+    "input_date, date_format",
+    [
+        ("2021-01-01T00:00:00.000000+0000", "%Y-%m-%dT%H:%M:%S.%f%z"),
+        ("2021-01-01T00:00:00.123+04:30", "%Y-%m-%dT%H:%M:%S.%f%z"),
+        ("2021-01-01T00:00:00Z", "%Y-%m-%dT%H:%M:%S%z"),
+        ("2021-01-01T00:00:00+01:00:30", "%Y-%m-%dT%H:%M:%S%z"),
+        ("2021-01-01t00:00:00z", "%Y-%m-%dT%H:%M:%SZ"),
+        ("1/2/2021  3:04", "%d/%m/%Y %H:%M"),
+        ("2021111", "%Y%m%d"),
+        ("2021-01-01 100%", "%Y-%m-%d 100%%"),
+        ("Friday 2021-01-01", "%A %Y-%m-%d"),
+    ],
+)
+def test_parse_date_like_strptime(input_date, date_format):
+    expected_date = datetime.datetime.strptime(input_date, date_format)
+    if expected_date.tzinfo is None:
+        expected_date = expected_date.replace(tzinfo=datetime.timezone.utc)
+
+    output_date = DatetimeParser().parse(input_date, date_format)
+
+    assert output_date == expected_date
+    assert output_date.utcoffset() == expected_date.utcoffset()
+
+
+@pytest.mark.parametrize(
+    "input_date, date_format",
+    [
+        ("2021-02-30", "%Y-%m-%d"),
+        ("2021-01-01T00:00:00", "%Y-%m-%d"),
+        ("2021-01-01", "%Y-%m-%d%"),
+        ("2021-01-01 00:00:00.0000000", "%Y-%m-%d %H:%M:%S.%f"),
+    ],
+)
+def test_parse_invalid_date(input_date, date_format):
+    with pytest.raises(ValueError):
+        DatetimeParser().parse(input_date, date_format)
+
+
+@pytest.mark.parametrize(
+    "test_name, first, second, date_format, expected_comparison",
+    [
+        ("test_compare_iso_dates", "2021-01-02T00:00:00.000000+0000", "2021-01-01T00:00:00.000000+0000", "%Y-%m-%dT%H:%M:%S.%f%z", 1),
+        ("test_compare_same_dates", "2021-01-01", "2021-01-01", "%Y-%m-%d", 0),
+        ("test_compare_dates_in_different_timezones", "2021-01-01T01:00:00+0200", "2021-01-01T00:00:00+0000", "%Y-%m-%dT%H:%M:%S%z", -1),
+        ("test_compare_same_dates_in_different_timezones", "2021-01-01T02:00:00+0200", "2021-01-01T00:00:00Z", "%Y-%m-%dT%H:%M:%S%z", 0),
+        ("test_compare_dates_not_in_order_of_significance", "01/02/2021", "02/01/2021", "%d/%m/%Y", 1),
+        ("test_compare_dates_without_padding", "2021-1-10", "2021-1-9", "%Y-%m-%d", 1),
+        ("test_compare_timestamps_of_different_lengths", "1000000000", "999999999", "%s", 1),
+        ("test_compare_timestamps_as_integers", 999999999, 1000000000, "%s", -1),
+    ],
+)
+def test_compare(test_name, first, second, date_format, expected_comparison):
+    assert DatetimeParser().compare(first, second, date_format) == expected_comparison
+    assert DatetimeParser().compare(second, first, date_format) == -expected_comparison
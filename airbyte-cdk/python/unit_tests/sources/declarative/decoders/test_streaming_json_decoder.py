@@ -0,0 +1,152 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+
+import pytest
+import requests
+from airbyte_cdk.sources.declarative.decoders import StreamingJsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamedRecords
+from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.cursor_pagination_strategy import CursorPaginationStrategy
+
+BODY = {
+    "data": [{"id": 1, "amount": 12.5e3, "tags": ["a", "b"]}, {"id": 2, "name": "été \"quoted\""}, {"id": 3, "nested": {"id": 4}}],
+    "groups": {"first": {"records": [{"id": 5}]}, "second": {"records": []}, "third": {"count": 0}},
+    "meta": {"next_page": "abc", "count": 3},
+    "total": 123456789,
+}
+
+
+EXTRACTED = "extracted records"
+
+
+def create_response(requests_mock, body: str) -> requests.Response:
+    requests_mock.get("https://airbyte.io/", content=body.encode("utf-8"), headers={"Content-Type": "application/json; charset=utf-8"})
+    return requests.get("https://airbyte.io/", stream=True)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+@pytest.mark.parametrize(
+    "field_path",
+    [
+        pytest.param([], id="test_root"),
+        pytest.param(["data"], id="test_array"),
+        pytest.param(["meta"], id="test_object"),
+        pytest.param(["total"], id="test_number"),
+        pytest.param(["data", "1"], id="test_array_index"),
+        pytest.param(["data", "*", "id"], id="test_wildcard_over_array"),
+        pytest.param(["groups", "*", "records"], id="test_wildcard_over_object"),
+        pytest.param(["missing"], id="test_missing_field"),
+        pytest.param(["meta", "next_page", "id"], id="test_field_of_a_value"),
+    ],
+)
+def test_records_are_the_ones_of_the_decoded_document(requests_mock, mocker, chunk_size, field_path):
+    mocker.patch("airbyte_cdk.sources.declarative.decoders.streaming_json_decoder.CHUNK_SIZE", chunk_size)
+    for body in [json.dumps(BODY), json.dumps(BODY, indent=2, ensure_ascii=False), json.dumps(BODY["data"])]:
+        expected_records = list(
+            DpathExtractor(field_path=list(field_path), config={}, parameters={}).extract_records(create_response(requests_mock, body))
+        )
+        extractor = DpathExtractor(field_path=list(field_path), config={}, parameters={}, decoder=StreamingJsonDecoder(parameters={}))
+
+        assert list(extractor.extract_records(create_response(requests_mock, body))) == expected_records
+
+
+@pytest.mark.parametrize(
+    "field_path, expected_document, get_records",
+    [
+        pytest.param(["data"], {**BODY, "data": EXTRACTED}, lambda document: document["data"][-1], id="test_array"),
+        pytest.param(
+            ["groups", "*", "records"],
+            {**BODY, "groups": {"first": {"records": EXTRACTED}, "second": {"records": EXTRACTED}, "third": {"count": 0}}},
+            lambda document: document["groups"]["first"]["records"][0],
+            id="test_wildcard",
+        ),
+        pytest.param(
+            ["data", "1"],
+            {**BODY, "data": [BODY["data"][0], EXTRACTED, BODY["data"][2]]},
+            lambda document: document["data"][1]["id"],
+            id="test_array_index",
+        ),
+        pytest.param([], EXTRACTED, lambda document: document["meta"], id="test_root"),
+    ],
+)
+def test_decode_returns_the_document_with_its_records_replaced(requests_mock, field_path, expected_document, get_records):
+    response = create_response(requests_mock, json.dumps(BODY))
+    extractor = DpathExtractor(field_path=field_path, config={}, parameters={}, decoder=StreamingJsonDecoder(parameters={}))
+    list(extractor.extract_records(response))
+    document = StreamingJsonDecoder(parameters={}).decode(response)
+
+    # The extracted records are replaced by a value which can not be serialized
+    assert json.loads(json.dumps(document, default=lambda value: EXTRACTED)) == expected_document
+    with pytest.raises(ValueError):
+        get_records(document)
+
+
+def test_decode_returns_the_whole_document_if_records_were_not_extracted(requests_mock):
+    response = create_response(requests_mock, json.dumps(BODY))
+
+    assert StreamingJsonDecoder(parameters={}).decode(response) == BODY
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        pytest.param("", id="test_empty_body"),
+        pytest.param("not json", id="test_not_json"),
+        pytest.param('{"data": [{"id": 1', id="test_truncated_before_the_first_record"),
+    ],
+)
+def test_documents_without_valid_records_do_not_have_records(requests_mock, body):
+    response = create_response(requests_mock, body)
+
+    assert list(StreamingJsonDecoder(parameters={}).decode_records(response, ["data"])) == []
+    assert StreamingJsonDecoder(parameters={}).decode(response) == {}
+
+
+def test_invalid_document_after_the_first_record_raises(requests_mock):
+    response = create_response(requests_mock, '{"data": [{"id": 1}, {"id": 2')
+    records = StreamingJsonDecoder(parameters={}).decode_records(response, ["data"])
+
+    assert next(records) == {"id": 1}
+    with pytest.raises(json.JSONDecodeError):
+        next(records)
+
+
+@pytest.mark.parametrize(
+    "cursor_value, expected_token",
+    [
+        pytest.param("{{ response.meta.next_page }}", "abc", id="test_rest_of_the_document"),
+        pytest.param("{{ last_records[-1].id }}", 3, id="test_last_record"),
+    ],
+)
+def test_paginator_reads_the_rest_of_the_document_and_the_last_record(requests_mock, cursor_value, expected_token):
+    decoder = StreamingJsonDecoder(parameters={})
+    response = create_response(requests_mock, json.dumps(BODY))
+    last_records = StreamedRecords()
+    for record in decoder.decode_records(response, ["data"]):
+        last_records.append(record)
+    strategy = CursorPaginationStrategy(cursor_value=cursor_value, config={}, parameters={}, decoder=decoder)
+
+    assert len(last_records) == 3
+    assert strategy.next_page_token(response, last_records) == expected_token
+
+
+@pytest.mark.parametrize(
+    "cursor_value",
+    [
+        pytest.param("{{ response.data[-1].id }}", id="test_records_of_the_response"),
+        pytest.param("{{ last_records[0].id }}", id="test_record_before_the_last_one"),
+    ],
+)
+def test_paginator_reading_records_which_were_not_kept_raises(requests_mock, cursor_value):
+    decoder = StreamingJsonDecoder(parameters={})
+    response = create_response(requests_mock, json.dumps(BODY))
+    last_records = StreamedRecords()
+    for record in decoder.decode_records(response, ["data"]):
+        last_records.append(record)
+    strategy = CursorPaginationStrategy(cursor_value=cursor_value, config={}, parameters={}, decoder=decoder)
+
+    with pytest.raises(ValueError):
+        strategy.next_page_token(response, last_records)
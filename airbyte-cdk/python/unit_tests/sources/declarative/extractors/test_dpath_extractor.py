@@ -8,6 +8,7 @@ import pytest
 import requests
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
 from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
+from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 
 config = {"field": "record_array"}
 parameters = {"parameters_field": "record_array"}
@@ -32,6 +33,12 @@ decoder = JsonDecoder(parameters={})
         ),
         ("test_field_does_not_exist", ["record"], {"id": 1}, []),
         ("test_nested_list", ["list", "*", "item"], {"list": [{"item": {"id": "1"}}]}, [{"id": "1"}]),
+        ("test_wildcard_over_object", ["data", "*"], {"data": {"a": {"id": 1}, "b": {"id": 2}}}, [{"id": 1}, {"id": 2}]),
+        ("test_wildcard_on_missing_field", ["data", "*", "records"], {"data": [{"id": 1}, {"records": [{"id": 2}]}]}, [[{"id": 2}]]),
+        ("test_list_index", ["data", "1"], {"data": [{"id": 1}, {"id": 2}]}, [{"id": 2}]),
+        ("test_list_index_out_of_range", ["data", "2"], {"data": [{"id": 1}, {"id": 2}]}, []),
+        ("test_field_of_a_value", ["data", "id"], {"data": "id"}, []),
+        ("test_glob_pattern", ["rec?rds"], {"records": [{"id": 1}, {"id": 2}]}, [{"id": 1}, {"id": 2}]),
         ("test_complex_nested_list", ['data', '*', 'list', 'data2', '*'], {"data": [{"list": {"data2": [{"id": 1}, {"id": 2}]}},{"list": {"data2": [{"id": 3}, {"id": 4}]}}]}, [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}])
     ],
 )
@@ -39,11 +46,29 @@ def test_dpath_extractor(test_name, field_path, body, expected_records):
     extractor = DpathExtractor(field_path=field_path, config=config, decoder=decoder, parameters=parameters)
 
     response = create_response(body)
-    actual_records = extractor.extract_records(response)
+    actual_records = list(extractor.extract_records(response))
 
     assert actual_records == expected_records
 
 
+def test_static_field_path_is_evaluated_once(mocker):
+    extractor = DpathExtractor(field_path=["data", "{{ config['field'] }}"], config=config, decoder=decoder, parameters=parameters)
+    eval_spy = mocker.spy(InterpolatedString, "eval")
+
+    for _ in range(3):
+        assert extractor.extract_records(create_response({"data": {"record_array": [{"id": 1}]}})) == [{"id": 1}]
+    assert [call.args[0].string for call in eval_spy.call_args_list] == ["{{ config['field'] }}"] * 3
+
+
+def test_values_matched_by_a_wildcard_are_not_collected_in_a_list():
+    extractor = DpathExtractor(field_path=["data", "*", "record"], config=config, decoder=decoder, parameters=parameters)
+
+    records = extractor.extract_records(create_response({"data": [{"record": {"id": 1}}, {"record": {"id": 2}}]}))
+
+    assert not isinstance(records, list)
+    assert next(iter(records)) == {"id": 1}
+
+
 def create_response(body):
     response = requests.Response()
     response._content = json.dumps(body).encode("utf-8")
@@ -4,6 +4,7 @@
 
 import pytest
 from airbyte_cdk.sources.declarative.extractors.record_filter import RecordFilter
+from airbyte_cdk.sources.declarative.interpolation.interpolated_boolean import InterpolatedBoolean
 
 
 @pytest.mark.parametrize(
@@ -53,3 +54,12 @@ def test_record_filter(test_name, filter_template, records, expected_records):
         records, stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token
     )
     assert list(actual_records) == expected_records
+
+
+def test_record_filter_prepares_the_condition_once_per_page(mocker):
+    evaluator_spy = mocker.spy(InterpolatedBoolean, "evaluator")
+    record_filter = RecordFilter(config={}, condition="{{ record['id'] % 2 == 0 }}", parameters={})
+    records = [{"id": record_id} for record_id in range(10)]
+
+    assert record_filter.filter_records(records, stream_state={}) == records[::2]
+    assert evaluator_spy.call_count == 1
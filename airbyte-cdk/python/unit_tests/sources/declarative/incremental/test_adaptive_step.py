@@ -0,0 +1,49 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+
+import pytest
+from airbyte_cdk.sources.declarative.incremental import AdaptiveStep
+
+DAY = datetime.timedelta(days=1)
+MINUTE = datetime.timedelta(minutes=1)
+
+
+@pytest.mark.parametrize(
+    "test_name, step, records, slice_duration, expected_step",
+    [
+        ("test_empty_slice_doubles_the_step", 4 * DAY, 0, MINUTE, 8 * DAY),
+        ("test_step_does_not_grow_past_max_step", 12 * DAY, 0, MINUTE, 16 * DAY),
+        ("test_step_is_kept_between_the_limits", 4 * DAY, 50, MINUTE, 4 * DAY),
+        ("test_step_shrinks_by_the_records_in_excess", 16 * DAY, 400, MINUTE, 4 * DAY),
+        ("test_step_is_at_least_halved", 16 * DAY, 101, MINUTE, 8 * DAY),
+        ("test_step_shrinks_by_the_time_in_excess", 16 * DAY, 50, 20 * MINUTE, 4 * DAY),
+        ("test_step_does_not_shrink_past_min_step", 2 * DAY, 1000, 100 * MINUTE, DAY),
+    ],
+)
+def test_next_step(test_name, step, records, slice_duration, expected_step):
+    adaptive_step = AdaptiveStep(
+        min_step="P1D",
+        max_step="{{ config['max_step'] }}",
+        min_records_per_slice=10,
+        max_records_per_slice=100,
+        max_slice_duration="PT5M",
+        config={"max_step": "P16D"},
+        parameters={},
+    )
+
+    assert adaptive_step.next_step(step, records, slice_duration) == expected_step
+
+
+@pytest.mark.parametrize(
+    "test_name, min_step, max_step",
+    [
+        ("test_min_step_greater_than_max_step", "P2D", "P1D"),
+        ("test_step_of_variable_length", "P1D", "P1M"),
+    ],
+)
+def test_invalid_steps(test_name, min_step, max_step):
+    with pytest.raises(ValueError):
+        AdaptiveStep(min_step=min_step, max_step=max_step, config={}, parameters={})
@@ -7,8 +7,9 @@ import unittest
 
 import pytest
 from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.declarative.datetime.datetime_parser import DatetimeParser
 from airbyte_cdk.sources.declarative.datetime.min_max_datetime import MinMaxDatetime
-from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor
+from airbyte_cdk.sources.declarative.incremental import AdaptiveStep, DatetimeBasedCursor
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 
@@ -432,6 +433,13 @@ def test_stream_slices(
             {},
             {cursor_field: "2021-01-03T00:00:00.000000+0000"},
         ),
+        (
+            "test_update_cursor_with_record_in_another_timezone_greater_than_state",
+            None,
+            {cursor_field: "2021-01-02T00:00:00.000000+0000"},
+            {cursor_field: "2021-01-01T23:00:00.000000-0200"},
+            {cursor_field: "2021-01-01T23:00:00.000000-0200"},
+        ),
     ],
 )
 def test_update_cursor(test_name, previous_cursor, stream_slice, last_record, expected_state):
@@ -452,6 +460,30 @@ def test_update_cursor(test_name, previous_cursor, stream_slice, last_record, ex
     assert expected_state == updated_state
 
 
+@pytest.mark.parametrize(
+    "test_name, date_format, records, expected_cursor, expected_parse_calls",
+    [
+        ("test_ordered_format_is_compared_as_strings", "%Y-%m-%d", ["2021-01-02", "2021-01-03", "2021-01-01"], "2021-01-03", 0),
+        ("test_only_the_record_value_is_parsed", "%d/%m/%Y", ["02/01/2021", "03/01/2021", "01/02/2021", "03/01/2021"], "01/02/2021", 4),
+    ],
+)
+def test_update_cursor_parses_the_cursor_once(mocker, test_name, date_format, records, expected_cursor, expected_parse_calls):
+    slicer = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime(datetime="2021-01-01", parameters={}),
+        cursor_field=InterpolatedString(string=cursor_field, parameters={}),
+        datetime_format=date_format,
+        config=config,
+        parameters={},
+    )
+    parse_spy = mocker.spy(DatetimeParser, "parse")
+
+    for record in records:
+        slicer.update_cursor({}, {cursor_field: record})
+
+    assert slicer.get_stream_state() == {cursor_field: expected_cursor}
+    assert parse_spy.call_count == expected_parse_calls
+
+
 @pytest.mark.parametrize(
     "test_name, inject_into, field_name, expected_req_params, expected_headers, expected_body_json, expected_body_data",
     [
@@ -632,5 +664,72 @@ def test_no_end_datetime(mock_datetime_now):
     assert stream_slices == [{"start_time": "2021-01-01", "end_time": FAKE_NOW.strftime("%Y-%m-%d")}]
 
 
+def test_adaptive_step_adapts_the_windows_to_the_records_of_the_previous_slice():
+    cursor = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime("2021-01-01", parameters={}),
+        end_datetime=MinMaxDatetime("2021-12-31", parameters={}),
+        step="P4D",
+        cursor_granularity="P1D",
+        cursor_field=InterpolatedString(cursor_field, parameters={}),
+        datetime_format="%Y-%m-%d",
+        adaptive_step=AdaptiveStep(
+            min_step="P1D", max_step="P16D", min_records_per_slice=2, max_records_per_slice=10, config=config, parameters={}
+        ),
+        config=config,
+        parameters={},
+    )
+    records_per_slice = [0, 0, 40, 5, 0]
+
+    stream_slices = []
+    for stream_slice, records in zip(cursor.stream_slices(SyncMode.incremental, {}), records_per_slice):
+        stream_slices.append(stream_slice)
+        cursor.get_request_params(stream_slice=stream_slice)
+        for _ in range(records):
+            cursor.update_cursor(stream_slice, last_record={cursor_field: stream_slice["end_time"]})
+
+    assert stream_slices == [
+        {"start_time": "2021-01-01", "end_time": "2021-01-04"},
+        {"start_time": "2021-01-05", "end_time": "2021-01-12"},
+        {"start_time": "2021-01-13", "end_time": "2021-01-28"},
+        {"start_time": "2021-01-29", "end_time": "2021-02-01"},
+        {"start_time": "2021-02-02", "end_time": "2021-02-05"},
+    ]
+    assert cursor.get_stream_state() == {cursor_field: "2021-02-01"}
+
+
+def test_adaptive_step_keeps_the_step_of_slices_which_are_not_read():
+    cursor = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime("2021-01-01", parameters={}),
+        end_datetime=MinMaxDatetime("2021-01-10", parameters={}),
+        step="P4D",
+        cursor_granularity="P1D",
+        cursor_field=InterpolatedString(cursor_field, parameters={}),
+        datetime_format="%Y-%m-%d",
+        adaptive_step=AdaptiveStep(min_step="P1D", max_step="P16D", config=config, parameters={}),
+        config=config,
+        parameters={},
+    )
+
+    assert list(cursor.stream_slices(SyncMode.incremental, {})) == [
+        {"start_time": "2021-01-01", "end_time": "2021-01-04"},
+        {"start_time": "2021-01-05", "end_time": "2021-01-08"},
+        {"start_time": "2021-01-09", "end_time": "2021-01-10"},
+    ]
+
+
+def test_adaptive_step_with_a_step_of_variable_length():
+    with pytest.raises(ValueError):
+        DatetimeBasedCursor(
+            start_datetime=MinMaxDatetime("2021-01-01", parameters={}),
+            step="P1M",
+            cursor_granularity="P1D",
+            cursor_field=InterpolatedString(cursor_field, parameters={}),
+            datetime_format="%Y-%m-%d",
+            adaptive_step=AdaptiveStep(min_step="P1D", max_step="P16D", config=config, parameters={}),
+            config=config,
+            parameters={},
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -38,3 +38,4 @@ config = {
 def test_interpolated_boolean(test_name, template, expected_result):
     interpolated_bool = InterpolatedBoolean(condition=template, parameters={"from_parameters": "come_find_me"})
     assert interpolated_bool.eval(config) == expected_result
+    assert interpolated_bool.evaluator(config)() == expected_result
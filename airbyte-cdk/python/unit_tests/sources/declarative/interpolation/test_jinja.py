@@ -7,6 +7,7 @@ import datetime
 import pytest
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from freezegun import freeze_time
+from jinja2 import Environment
 from jinja2.exceptions import TemplateSyntaxError
 
 interpolation = JinjaInterpolation()
@@ -190,3 +191,73 @@ def test_undeclared_variables(template_string, expected_error, expected_value):
     else:
         actual_value = interpolation.eval(template_string, config=config, **{"to_be": "that_is_the_question"})
         assert actual_value == expected_value
+
+
+@pytest.mark.parametrize(
+    "s",
+    [
+        pytest.param("hello world", id="test_raw_string"),
+        pytest.param('{"key": "value"}', id="test_json_string"),
+        pytest.param("[1, 2]", id="test_list_string"),
+        pytest.param("line\nbreak\n", id="test_trailing_newline"),
+        pytest.param("carriage\r\nreturn", id="test_carriage_return"),
+        pytest.param("{# comment #}value", id="test_comment"),
+    ],
+)
+def test_static_strings_are_interpolated_as_jinja_would(s):
+    assert interpolation.eval(s, {}) == interpolation._literal_eval(Environment().from_string(s).render())
+
+
+def test_templates_are_compiled_once(mocker):
+    jinja_interpolation = JinjaInterpolation()
+    parse_spy = mocker.spy(jinja_interpolation._environment, "parse")
+    from_string_spy = mocker.spy(jinja_interpolation._environment, "from_string")
+
+    values = [jinja_interpolation.eval("{{ record['compiled_once'] }}", {}, record={"compiled_once": record_id}) for record_id in range(3)]
+    jinja_interpolation.eval("static value", {})
+
+    assert values == [0, 1, 2]
+    assert parse_spy.call_count == from_string_spy.call_count == 1
+
+
+def test_compiled_templates_are_shared_by_interpolations(mocker):
+    first_interpolation, second_interpolation = JinjaInterpolation(), JinjaInterpolation()
+    parse_spy = mocker.spy(first_interpolation._environment, "parse")
+
+    assert first_interpolation.eval("{{ record['shared'] }}", {}, record={"shared": 1}) == 1
+    assert second_interpolation.eval("{{ record['shared'] }}", {}, record={"shared": 2}) == 2
+    assert parse_spy.call_count == 1
+
+
+def test_cached_literal_containers_are_not_shared():
+    first_value = interpolation.eval("{{ [1, 2] }}", {})
+    first_value.append(3)
+
+    assert interpolation.eval("{{ [1, 2] }}", {}) == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "template, default",
+    [
+        pytest.param("{{ record['id'] * 2 }}", None, id="test_record_value"),
+        pytest.param("{{ max(record['id'], config['min_id']) }}", None, id="test_macro"),
+        pytest.param("{{ stream_interval['start'] }}-{{ record['id'] }}", None, id="test_alias"),
+        pytest.param("{{ record['missing'] }}", "{{ config['min_id'] }}", id="test_default"),
+        pytest.param("{{ record['id'] > 'a' }}", None, id="test_type_error"),
+        pytest.param("static value", None, id="test_static_value"),
+    ],
+)
+def test_evaluator_interpolates_as_eval(template, default):
+    config = {"min_id": 2}
+    stream_slice = {"start": "2023-01-01"}
+    evaluate = interpolation.evaluator(template, config, default, stream_slice=stream_slice)
+
+    for record in [{"id": 1}, {"id": 3}]:
+        assert evaluate(record=record) == interpolation.eval(template, config, default, stream_slice=stream_slice, record=record)
+
+
+def test_evaluator_rejects_reserved_keywords():
+    evaluate = interpolation.evaluator("{{ record }}", {})
+
+    with pytest.raises(ValueError):
+        evaluate(stream_interval={})
@@ -0,0 +1,69 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+from importlib import metadata
+
+from airbyte_cdk.sources.declarative.parsers.manifest_cache import MANIFEST_CACHE_DIR_ENV_VAR, ManifestCache
+
+MANIFEST = {"version": "0.29.3", "streams": [{"$ref": "#/definitions/stream"}], "definitions": {"stream": {"name": "lists"}}}
+COMPILED_MANIFEST = {"version": "0.29.3", "streams": [{"type": "DeclarativeStream", "name": "lists"}], "definitions": {}}
+
+
+def test_compiled_manifest_is_read_from_the_cache(tmp_path):
+    ManifestCache(str(tmp_path)).put(MANIFEST, COMPILED_MANIFEST)
+
+    cache = ManifestCache(str(tmp_path))
+    assert cache.get(MANIFEST) == COMPILED_MANIFEST
+    assert cache.get({**MANIFEST, "version": "0.29.4"}) is None
+    assert [path.suffix for path in tmp_path.iterdir()] == [".json"]
+
+
+def test_compiled_manifest_is_keyed_by_cdk_version(tmp_path, mocker):
+    cache = ManifestCache(str(tmp_path))
+    cache.put(MANIFEST, COMPILED_MANIFEST)
+
+    mocker.patch("airbyte_cdk.sources.declarative.parsers.manifest_cache.metadata.version", return_value="999.0.0")
+    assert cache.get(MANIFEST) is None
+
+
+def test_cache_is_disabled_if_the_cdk_version_is_unknown(tmp_path, mocker):
+    mocker.patch(
+        "airbyte_cdk.sources.declarative.parsers.manifest_cache.metadata.version", side_effect=metadata.PackageNotFoundError("airbyte_cdk")
+    )
+    cache = ManifestCache(str(tmp_path))
+    cache.put(MANIFEST, COMPILED_MANIFEST)
+
+    assert cache.get(MANIFEST) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unreadable_compiled_manifest_is_a_cache_miss(tmp_path):
+    cache = ManifestCache(str(tmp_path))
+    cache.put(MANIFEST, COMPILED_MANIFEST)
+    for path in tmp_path.iterdir():
+        path.write_text('{"version": ')
+
+    assert cache.get(MANIFEST) is None
+
+
+def test_manifest_without_stable_key_is_not_cached(tmp_path):
+    manifest = {**MANIFEST, "start_date": datetime.date(2023, 1, 1)}
+    cache = ManifestCache(str(tmp_path))
+    cache.put(manifest, COMPILED_MANIFEST)
+
+    assert cache.get(manifest) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_is_disabled_without_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv(MANIFEST_CACHE_DIR_ENV_VAR, raising=False)
+    cache = ManifestCache.from_environment()
+    cache.put(MANIFEST, COMPILED_MANIFEST)
+    assert cache.get(MANIFEST) is None
+
+    monkeypatch.setenv(MANIFEST_CACHE_DIR_ENV_VAR, str(tmp_path / "manifests"))
+    cache = ManifestCache.from_environment()
+    cache.put(MANIFEST, COMPILED_MANIFEST)
+    assert cache.get(MANIFEST) == COMPILED_MANIFEST
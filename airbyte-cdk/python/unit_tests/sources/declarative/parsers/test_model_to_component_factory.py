@@ -10,9 +10,9 @@ from airbyte_cdk.sources.declarative.auth.token import BasicHttpAuthenticator, B
 from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
-from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor
+from airbyte_cdk.sources.declarative.incremental import AdaptiveStep, DatetimeBasedCursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.models import CheckStream as CheckStreamModel
 from airbyte_cdk.sources.declarative.models import CompositeErrorHandler as CompositeErrorHandlerModel
@@ -444,6 +444,108 @@ def test_create_substream_partition_router():
     assert partition_router.parent_stream_configs[1].request_option is None
 
 
+def test_create_substream_partition_router_with_parent_record_cache():
+    content = """
+    stream:
+      type: DeclarativeStream
+      primary_key: "id"
+      retriever:
+        requester:
+          type: "HttpRequester"
+          url_base: "https://airbyte.io"
+          path: "{{ parameters['name'] }}"
+        record_selector:
+          extractor:
+            field_path: []
+    partition_router:
+      type: SubstreamPartitionRouter
+      parent_stream_configs:
+        - stream:
+            $ref: "#/stream"
+            name: "A"
+          parent_key: id
+          partition_field: repository_id
+          cache_parent_records: true
+        - stream:
+            $ref: "#/stream"
+            name: "A"
+          parent_key: id
+          partition_field: other_repository_id
+          cache_parent_records: true
+        - stream:
+            $ref: "#/stream"
+            name: "B"
+          parent_key: id
+          partition_field: word_id
+          cache_parent_records: true
+        - stream:
+            $ref: "#/stream"
+            name: "A"
+          parent_key: id
+          partition_field: repository_id
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    partition_router_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["partition_router"], {})
+
+    partition_router = factory.create_component(
+        model_type=SubstreamPartitionRouterModel, component_definition=partition_router_manifest, config=input_config
+    )
+
+    record_cache_keys = [parent_stream_config.record_cache_key for parent_stream_config in partition_router.parent_stream_configs]
+    assert record_cache_keys[0] is not None
+    assert record_cache_keys[1] == record_cache_keys[0]
+    assert record_cache_keys[2] not in (None, record_cache_keys[0])
+    assert record_cache_keys[3] is None
+
+
+def test_create_retriever_prefetching_the_partitions_of_a_substream_partition_router():
+    content = """
+    parent_stream:
+      type: DeclarativeStream
+      primary_key: "id"
+      retriever:
+        requester:
+          type: "HttpRequester"
+          url_base: "https://airbyte.io"
+          path: "repositories"
+        record_selector:
+          extractor:
+            field_path: []
+    stream:
+      type: DeclarativeStream
+      primary_key: "id"
+      schema_loader:
+        type: InlineSchemaLoader
+        schema: {}
+      retriever:
+        type: SimpleRetriever
+        requester:
+          type: "HttpRequester"
+          url_base: "https://airbyte.io"
+          path: "repositories/{{ stream_slice.repository_id }}/commits"
+        record_selector:
+          extractor:
+            field_path: []
+        partition_router:
+          type: SubstreamPartitionRouter
+          max_prefetched_partitions: 4
+          parent_stream_configs:
+            - stream: "#/parent_stream"
+              parent_key: id
+              partition_field: repository_id
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    stream_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["stream"], {"name": "commits"})
+
+    stream = factory.create_component(model_type=DeclarativeStreamModel, component_definition=stream_manifest, config=input_config)
+
+    assert isinstance(stream.retriever.stream_slicer, SubstreamPartitionRouter)
+    assert stream.retriever.max_prefetched_slices == 4
+    assert stream.retriever.stream_slicer.parent_stream_configs[0].stream.retriever.max_prefetched_slices == 0
+
+
 def test_datetime_based_cursor():
     content = """
     incremental:
@@ -497,6 +599,35 @@ def test_datetime_based_cursor():
     assert stream_slicer.end_datetime.datetime.string == "{{ config['end_time'] }}"
 
 
+def test_datetime_based_cursor_with_adaptive_step():
+    content = """
+    incremental:
+        type: DatetimeBasedCursor
+        datetime_format: "%Y-%m-%d"
+        start_datetime: "{{ config['start_time'] }}"
+        step: "P10D"
+        cursor_field: "created"
+        cursor_granularity: "P1D"
+        adaptive_step:
+          min_step: "P1D"
+          max_step: "P30D"
+          max_records_per_slice: 10000
+          max_slice_duration: "PT5M"
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    slicer_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["incremental"], {})
+
+    stream_slicer = factory.create_component(model_type=DatetimeBasedCursorModel, component_definition=slicer_manifest, config=input_config)
+
+    assert isinstance(stream_slicer.adaptive_step, AdaptiveStep)
+    assert stream_slicer.adaptive_step._min_step == datetime.timedelta(days=1)
+    assert stream_slicer.adaptive_step._max_step == datetime.timedelta(days=30)
+    assert stream_slicer.adaptive_step.min_records_per_slice == 1
+    assert stream_slicer.adaptive_step.max_records_per_slice == 10000
+    assert stream_slicer.adaptive_step._max_slice_duration == datetime.timedelta(minutes=5)
+
+
 def test_stream_with_incremental_and_retriever_with_partition_router():
     content = """
 decoder:
@@ -635,6 +766,88 @@ def test_create_record_selector(test_name, record_selector, expected_runtime_sel
     assert selector.record_filter.condition == "{{ record['id'] > stream_state['id'] }}"
 
 
+@pytest.mark.parametrize(
+    "authenticator, expected_shared",
+    [
+        pytest.param('{type: BearerAuthenticator, api_token: "{{ config.apikey }}"}', True, id="test_same_definition_is_shared"),
+        pytest.param(
+            '{type: ApiKeyAuthenticator, header: "{{ parameters.name }}", api_token: "{{ config.apikey }}"}',
+            False,
+            id="test_definition_interpolating_parameters_is_not_shared",
+        ),
+        pytest.param(
+            '{type: ApiKeyAuthenticator, header: "X-Request-parameters", api_token: "{{ config.apikey }}"}',
+            True,
+            id="test_definition_with_parameters_in_a_literal_is_shared",
+        ),
+        pytest.param(
+            "{type: CustomAuthenticator, class_name: unit_tests.sources.declarative.parsers.testing_components.TestingSomeComponent}",
+            False,
+            id="test_custom_authenticator_is_not_shared",
+        ),
+    ],
+)
+def test_streams_share_authenticators_with_the_same_definition(authenticator, expected_shared):
+    content = f"""
+    definitions:
+      requester:
+        url_base: "https://api.sendgrid.com"
+        path: "/v3/{{{{ parameters.name }}}}"
+        authenticator: {authenticator}
+    requesters:
+      - $ref: "#/definitions/requester"
+        $parameters:
+          name: lists
+      - $ref: "#/definitions/requester"
+        $parameters:
+          name: contacts
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    component_factory = ModelToComponentFactory()
+
+    first_requester, second_requester = [
+        component_factory.create_component(
+            model_type=HttpRequesterModel,
+            component_definition=transformer.propagate_types_and_parameters("", {"type": "HttpRequester", **requester}, {}),
+            config=input_config,
+            name=requester["$parameters"]["name"],
+        )
+        for requester in resolved_manifest["requesters"]
+    ]
+    other_config_requester = component_factory.create_component(
+        model_type=HttpRequesterModel,
+        component_definition=transformer.propagate_types_and_parameters(
+            "", {"type": "HttpRequester", **resolved_manifest["requesters"][0]}, {}
+        ),
+        config=dict(input_config),
+        name="lists",
+    )
+
+    assert (first_requester.authenticator is second_requester.authenticator) == expected_shared
+    assert other_config_requester.authenticator is not first_requester.authenticator
+
+
+def test_create_record_selector_with_streaming_json_decoder():
+    content = """
+    selector:
+      type: RecordSelector
+      extractor:
+        type: DpathExtractor
+        field_path: ["data"]
+        decoder:
+          type: StreamingJsonDecoder
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    selector_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["selector"], {})
+
+    selector = factory.create_component(model_type=RecordSelectorModel, component_definition=selector_manifest, config=input_config)
+
+    assert isinstance(selector.extractor, DpathExtractor)
+    assert isinstance(selector.extractor.decoder, StreamingJsonDecoder)
+
+
 @pytest.mark.parametrize(
     "test_name, error_handler, expected_backoff_strategy_type",
     [
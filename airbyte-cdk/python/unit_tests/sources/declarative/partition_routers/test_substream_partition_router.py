@@ -9,6 +9,7 @@ from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig, SubstreamPartitionRouter
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.sources.utils.parent_record_cache import ParentRecordCache
 
 parent_records = [{"id": 1, "data": "data1"}, {"id": 2, "data": "data2"}]
 more_records = [{"id": 10, "data": "data10", "slice": "second_parent"}, {"id": 20, "data": "data20", "slice": "second_parent"}]
@@ -297,3 +298,33 @@ def test_request_option(
     assert expected_headers == partition_router.get_request_headers(stream_slice=stream_slice)
     assert expected_body_json == partition_router.get_request_body_json(stream_slice=stream_slice)
     assert expected_body_data == partition_router.get_request_body_data(stream_slice=stream_slice)
+
+
+def test_parent_stream_is_read_once_by_substreams_sharing_it(mocker):
+    parent_record_cache = ParentRecordCache()
+    mocker.patch("airbyte_cdk.sources.declarative.partition_routers.substream_partition_router.parent_record_cache", parent_record_cache)
+    parent_stream = MockStream(parent_slices, all_parent_data, "first_stream")
+    read_records = mocker.spy(parent_stream, "read_records")
+
+    def create_partition_router(record_cache_key: Optional[str]) -> SubstreamPartitionRouter:
+        parent_stream_config = ParentStreamConfig(
+            stream=parent_stream,
+            parent_key="id",
+            partition_field="first_stream_id",
+            parameters={},
+            config={},
+            record_cache_key=record_cache_key,
+        )
+        return SubstreamPartitionRouter(parent_stream_configs=[parent_stream_config], parameters={}, config={})
+
+    expected_slices = [
+        {"first_stream_id": 0, "parent_slice": {"slice": "first"}},
+        {"first_stream_id": 1, "parent_slice": {"slice": "first"}},
+        {"first_stream_id": 2, "parent_slice": {"slice": "second"}},
+    ]
+    for partition_router in [create_partition_router("first_stream"), create_partition_router("first_stream")]:
+        assert list(partition_router.stream_slices(SyncMode.full_refresh, stream_state=None)) == expected_slices
+    assert read_records.call_count == len(parent_slices)
+
+    assert list(create_partition_router(None).stream_slices(SyncMode.full_refresh, stream_state=None)) == expected_slices
+    assert read_records.call_count == 2 * len(parent_slices)
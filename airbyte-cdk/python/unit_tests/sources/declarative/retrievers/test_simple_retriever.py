@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
 from typing import Mapping
 from unittest.mock import MagicMock, patch
 
@@ -10,11 +11,14 @@ import pytest
 import requests
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, SyncMode, Type
 from airbyte_cdk.sources.declarative.auth.declarative_authenticator import NoAuth
+from airbyte_cdk.sources.declarative.decoders import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.exceptions import ReadException
+from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordSelector
 from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor
 from airbyte_cdk.sources.declarative.partition_routers import SinglePartitionRouter
 from airbyte_cdk.sources.declarative.requesters.error_handlers.response_action import ResponseAction
 from airbyte_cdk.sources.declarative.requesters.error_handlers.response_status import ResponseStatus
+from airbyte_cdk.sources.declarative.requesters.paginators import NoPagination
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOptionType
 from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod
 from airbyte_cdk.sources.declarative.retrievers.simple_retriever import (
@@ -119,6 +123,26 @@ def test_simple_retriever_full(mock_http_stream):
     paginator.reset.assert_called()
 
 
+def test_records_extracted_lazily_are_kept_for_the_paginator_as_they_are_read():
+    record_selector = MagicMock()
+    record_selector.select_records.return_value = iter(records)
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=MagicMock(),
+        paginator=MagicMock(),
+        record_selector=record_selector,
+        parameters={},
+        config={},
+    )
+
+    parsed_records = retriever.parse_response(requests.Response(), stream_state={})
+    assert retriever._last_records == []
+
+    assert list(parsed_records) == records
+    assert retriever._last_records == records
+
+
 @patch.object(HttpStream, "_read_pages", return_value=iter([*request_response_logs, *records]))
 def test_simple_retriever_with_request_response_logs(mock_http_stream):
     requester = MagicMock()
@@ -752,6 +776,96 @@ def test_read_records_updates_stream_slicer_once_if_no_records(test_name, last_r
         assert stream_slicer.update_cursor.call_count == expected_stream_slicer_update_count
 
 
+def test_read_records_of_prefetched_slices_updates_the_stream_slicer_in_order():
+    stream_slices = [{"parent_id": parent_id} for parent_id in range(5)]
+    stream_slicer = MagicMock()
+    stream_slicer.stream_slices.return_value = stream_slices
+    fetching_threads = []
+
+    def read_pages(records_generator_fn, stream_slice, stream_state):
+        fetching_threads.append(threading.current_thread().name)
+        return iter([{"id": f"{stream_slice['parent_id']}-{i}"} for i in range(2)])
+
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=MagicMock(),
+        paginator=NoPagination(parameters={}),
+        record_selector=MagicMock(),
+        stream_slicer=stream_slicer,
+        max_prefetched_slices=2,
+        parameters={},
+        config={},
+    )
+
+    with patch.object(HttpStream, "_read_pages", side_effect=read_pages):
+        read_records = [
+            record
+            for stream_slice in retriever.stream_slices(sync_mode=SyncMode.incremental)
+            for record in retriever.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice)
+        ]
+
+    expected_records = [{"id": f"{parent_id}-{i}"} for parent_id in range(5) for i in range(2)]
+    assert read_records == expected_records
+    assert [(update_call.args[0], update_call.kwargs["last_record"]) for update_call in stream_slicer.update_cursor.call_args_list] == [
+        (stream_slices[int(record["id"][0])], record) for record in expected_records
+    ]
+    assert len(fetching_threads) == 5
+    assert all(thread_name.startswith("stream_name_prefetch") for thread_name in fetching_threads)
+
+
+def test_prefetch_copies_send_their_requests_with_their_own_session():
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=MagicMock(),
+        paginator=NoPagination(parameters={}),
+        record_selector=MagicMock(),
+        parameters={},
+        config={},
+    )
+    auth = requests.auth.HTTPBasicAuth("user", "password")
+    retriever._session.auth = auth
+    connector_adapter = requests.adapters.HTTPAdapter()
+    retriever._session.mount("https://connector.io", connector_adapter)
+
+    retriever_copy = retriever._copy_for_prefetch()
+
+    assert retriever_copy._session is not retriever._session
+    assert retriever_copy._session.auth is auth
+    assert retriever_copy._session.get_adapter("https://connector.io/") is connector_adapter
+    assert retriever_copy._session.get_adapter("https://airbyte.io/") is not retriever._session.get_adapter("https://airbyte.io/")
+
+
+def test_responses_decoded_by_a_streaming_decoder_are_streamed(requests_mock):
+    requests_mock.get("https://airbyte.io/", content=b'{"data": [{"id": 1}, {"id": 2}, {"id": 3}]}')
+    requester = MagicMock()
+    requester.request_kwargs.return_value = {"timeout": 10}
+    paginator = MagicMock()
+    paginator.next_page_token.return_value = None
+    extractor = DpathExtractor(field_path=["data"], config={}, parameters={}, decoder=StreamingJsonDecoder(parameters={}))
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        paginator=paginator,
+        record_selector=RecordSelector(extractor=extractor, parameters={}),
+        stream_slicer=SinglePartitionRouter(parameters={}),
+        parameters={},
+        config={},
+    )
+    response = requests.get("https://airbyte.io/", stream=True)
+
+    with patch.object(HttpStream, "_fetch_next_page", return_value=(response.request, response)):
+        read_records = list(retriever.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert retriever.request_kwargs(stream_state={}) == {"timeout": 10, "stream": True}
+    assert read_records == [{"id": 1}, {"id": 2}, {"id": 3}]
+    last_records = paginator.next_page_token.call_args.args[1]
+    assert len(last_records) == 3
+    assert last_records[-1] == {"id": 3}
+
+
 def _generate_slices(number_of_slices):
     return [{"date": f"2022-01-0{day + 1}"} for day in range(number_of_slices)]
 
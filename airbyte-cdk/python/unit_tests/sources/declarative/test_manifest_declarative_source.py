@@ -25,6 +25,7 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.parsers.manifest_cache import ManifestCache
 from airbyte_cdk.sources.streams.http import HttpStream
 from jsonschema.exceptions import ValidationError
 
@@ -652,6 +653,36 @@ class TestManifestDeclarativeSource:
         with pytest.raises(ValidationError):
             ManifestDeclarativeSource(source_config=manifest)
 
+    def test_compiled_manifest_is_cached(self, tmp_path):
+        manifest = {
+            "version": "0.29.3",
+            "definitions": {
+                "requester": {
+                    "url_base": "https://api.sendgrid.com",
+                    "path": "/v3/{{ parameters.name }}",
+                    "authenticator": {"type": "BearerAuthenticator", "api_token": "{{ config.apikey }}"},
+                },
+                "stream": {
+                    "type": "DeclarativeStream",
+                    "retriever": {"requester": {"$ref": "#/definitions/requester"}, "record_selector": {"extractor": {"field_path": []}}},
+                },
+            },
+            "streams": [
+                {"$ref": "#/definitions/stream", "$parameters": {"name": "lists", "primary_key": "id"}},
+                {"$ref": "#/definitions/stream", "$parameters": {"name": "contacts", "primary_key": "id"}},
+            ],
+            "check": {"type": "CheckStream", "stream_names": ["lists"]},
+        }
+        manifest_cache = ManifestCache(str(tmp_path))
+        compiled_manifest = ManifestDeclarativeSource(source_config=manifest, manifest_cache=manifest_cache).resolved_manifest
+
+        with patch.object(ManifestDeclarativeSource, "_validate_source") as validate_source:
+            source = ManifestDeclarativeSource(source_config=manifest, manifest_cache=manifest_cache)
+
+        validate_source.assert_not_called()
+        assert source.resolved_manifest == compiled_manifest
+        assert [stream.name for stream in source.streams({"apikey": "key"})] == ["lists", "contacts"]
+
     @patch("airbyte_cdk.sources.declarative.declarative_source.DeclarativeSource.read")
     def test_given_debug_when_read_then_set_log_level(self, declarative_source_read):
         any_valid_manifest = {
@@ -1253,3 +1284,32 @@ def _run_read(manifest: Mapping[str, Any], stream_name: str) -> List[AirbyteMess
         ConfiguredAirbyteStream(stream=AirbyteStream(name=stream_name, json_schema={}, supported_sync_modes=[SyncMode.full_refresh]), sync_mode=SyncMode.full_refresh, destination_sync_mode=DestinationSyncMode.append)
     ])
     return list(source.read(logger, {}, catalog, {}))
+
+
+def test_read_creates_only_the_streams_of_the_catalog():
+    stream_definition = {
+        "type": "DeclarativeStream",
+        "schema_loader": {"type": "InlineSchemaLoader", "schema": {}},
+        "retriever": {
+            "type": "SimpleRetriever",
+            "requester": {
+                "url_base": "https://api.apilayer.com",
+                "path": "/exchangerates_data/{{ parameters.name }}",
+                "authenticator": {"type": "ApiKeyAuthenticator", "header": "apikey", "api_token": "{{ config['api_key'] }}"},
+            },
+            "record_selector": {"extractor": {"field_path": ["rates"]}},
+        },
+    }
+    manifest = {
+        "version": "0.29.3",
+        "definitions": {"stream": stream_definition},
+        "streams": [{"$ref": "#/definitions/stream", "$parameters": {"name": name}} for name in ["Rates", "Currencies", "Symbols"]],
+        "check": {"type": "CheckStream", "stream_names": ["Rates"]},
+    }
+
+    with patch.object(HttpStream, "_fetch_next_page", side_effect=[_create_page({"rates": [{"ABC": 0}]})]):
+        with patch.object(ManifestDeclarativeSource, "_create_stream", side_effect=ManifestDeclarativeSource._create_stream, autospec=True) as create_stream:
+            output_data = [message.record.data for message in _run_read(manifest, "Rates") if message.record]
+
+    assert output_data == [{"ABC": 0}]
+    assert [create_stream_call.args[1]["name"] for create_stream_call in create_stream.call_args_list] == ["Rates"]
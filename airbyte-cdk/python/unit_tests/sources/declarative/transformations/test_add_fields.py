@@ -4,7 +4,9 @@
 
 from typing import Any, List, Mapping, Tuple
 
+import dpath.exceptions
 import pytest
+from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.transformations import AddFields
 from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
 from airbyte_cdk.sources.declarative.types import FieldPointer
@@ -28,7 +30,15 @@ from airbyte_cdk.sources.declarative.types import FieldPointer
             {"k": "v", "nested": {"path": "static_value"}},
             id="set static value at nested path",
         ),
+        pytest.param(
+            {"k": {"nested": "v"}},
+            [(["k", "path"], "static_value")],
+            {},
+            {"k": {"nested": "v", "path": "static_value"}},
+            id="set static value in an existing object",
+        ),
         pytest.param({"k": "v"}, [(["k"], "new_value")], {}, {"k": "new_value"}, id="update value which already exists"),
+        pytest.param({"k": [{"a": 0}]}, [(["k", 0, "b"], "v")], {}, {"k": [{"a": 0, "b": "v"}]}, id="Set field of object inside array"),
         pytest.param({"k": [0, 1]}, [(["k", 3], "v")], {}, {"k": [0, 1, None, "v"]}, id="Set element inside array"),
         pytest.param(
             {"k": "v"},
@@ -108,3 +118,23 @@ def test_add_fields(
 ):
     inputs = [AddedFieldDefinition(path=v[0], value=v[1], parameters={}) for v in field]
     assert AddFields(fields=inputs, parameters={"alas": "i live"}).transform(input_record, **kwargs) == expected
+
+
+def test_add_fields_under_a_value_which_is_not_an_object():
+    add_fields = AddFields(fields=[AddedFieldDefinition(path=["k", "nested"], value="v", parameters={})], parameters={})
+
+    with pytest.raises(dpath.exceptions.PathNotFound):
+        add_fields.transform({"k": "v"})
+
+
+def test_add_fields_prepares_values_once_per_slice(mocker):
+    evaluator_spy = mocker.spy(InterpolatedString, "evaluator")
+    add_fields = AddFields(
+        fields=[AddedFieldDefinition(path=["slice_id"], value="{{ stream_slice['id'] }}-{{ record['id'] }}", parameters={})], parameters={}
+    )
+    config = {}
+
+    for stream_slice in [{"id": "a"}, {"id": "b"}]:
+        records = [add_fields.transform({"id": record_id}, config=config, stream_slice=stream_slice) for record_id in range(2)]
+        assert records == [{"id": 0, "slice_id": f"{stream_slice['id']}-0"}, {"id": 1, "slice_id": f"{stream_slice['id']}-1"}]
+    assert evaluator_spy.call_count == 2
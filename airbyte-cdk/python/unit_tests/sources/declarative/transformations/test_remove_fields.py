@@ -41,6 +41,9 @@ from airbyte_cdk.sources.declarative.types import FieldPointer
             {".": {"k1": [{"k3": "v"}, {}]}},
             id="remove fields that exist in arrays (deeply nested)",
         ),
+        pytest.param({"k1": "v", "k2": "v", "other": "v"}, [["k*"]], {"other": "v"}, id="remove fields matching a glob"),
+        pytest.param({".": [{"k1": "v"}, {"k1": "v"}]}, [[".", "*", "k1"]], {".": [{}, {}]}, id="remove fields of all the array items"),
+        pytest.param({"k1": {"k2": "v"}}, [["k1", "k2", "k3"]], {"k1": {"k2": "v"}}, id="remove field under a value which isn't an object"),
     ],
 )
 def test_remove_fields(input_record: Mapping[str, Any], field_pointers: List[FieldPointer], expected: Mapping[str, Any]):
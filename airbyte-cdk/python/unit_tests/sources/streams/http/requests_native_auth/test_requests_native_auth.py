@@ -4,6 +4,8 @@
 
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock
 
 import freezegun
@@ -120,6 +122,23 @@ class TestOauth2Authenticator:
         header = oauth.get_auth_header()
         assert {"Authorization": "Bearer access_token_2"} == header
 
+    def test_token_is_refreshed_once_by_concurrent_threads(self, mocker):
+        oauth = Oauth2Authenticator(
+            token_refresh_endpoint=TestOauth2Authenticator.refresh_endpoint,
+            client_id=TestOauth2Authenticator.client_id,
+            client_secret=TestOauth2Authenticator.client_secret,
+            refresh_token=TestOauth2Authenticator.refresh_token,
+        )
+
+        def refresh_access_token():
+            time.sleep(0.1)
+            return "access_token", 1000
+
+        refresh_mock = mocker.patch.object(Oauth2Authenticator, "refresh_access_token", side_effect=refresh_access_token)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(lambda _: oauth.get_access_token(), range(4))) == ["access_token"] * 4
+        assert refresh_mock.call_count == 1
+
     def test_refresh_request_body(self):
         """
         Request body should match given configuration.
@@ -0,0 +1,206 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Iterable, Mapping, Optional
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import AsyncHttpStream
+from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, UserDefinedBackoffException
+from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
+from airbyte_cdk.utils.stream_profiler import HTTP_WAIT, StreamProfiler
+
+
+class StubAsyncHttpStream(AsyncHttpStream):
+    primary_key = ""
+    retry_factor = 0
+
+    def __init__(self, url_base: str, **kwargs):
+        super().__init__(**kwargs)
+        self._url_base = url_base
+
+    @property
+    def url_base(self) -> str:
+        return self._url_base
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        next_page = response.json().get("next_page")
+        return {"page": next_page} if next_page else None
+
+    def path(self, *, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
+        return (stream_slice or {}).get("path", "")
+
+    def request_params(self, stream_state: Mapping[str, Any], stream_slice=None, next_page_token=None) -> Mapping[str, Any]:
+        return next_page_token or {}
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()["data"]
+
+
+def _expect_pages(httpserver, path: str, number_of_pages: int):
+    for page in range(1, number_of_pages + 1):
+        next_page = page + 1 if page < number_of_pages else None
+        httpserver.expect_request(path, query_string=f"page={page}" if page > 1 else "").respond_with_json(
+            {"data": [{"page": page}], "next_page": next_page}
+        )
+
+
+def _create_response(status_code: int, content: bytes = b'{"data": [{"id": 1}]}') -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+def test_read_records_follows_pagination(httpserver):
+    stream = StubAsyncHttpStream(httpserver.url_for("/"))
+    _expect_pages(httpserver, "/", 3)
+
+    assert list(stream.read_records(SyncMode.full_refresh)) == [{"page": 1}, {"page": 2}, {"page": 3}]
+
+
+def test_requests_are_prepared_with_the_authenticator_of_the_stream(httpserver):
+    stream = StubAsyncHttpStream(httpserver.url_for("/"), authenticator=TokenAuthenticator("secret"))
+    httpserver.expect_request("/", headers={"Authorization": "Bearer secret"}).respond_with_json({"data": [{"id": 1}]})
+
+    assert list(stream.read_records(SyncMode.full_refresh)) == [{"id": 1}]
+
+
+def test_read_records_async_reads_slices_concurrently(httpserver):
+    stream = StubAsyncHttpStream(httpserver.url_for("/"))
+    for path in ["/a", "/b"]:
+        _expect_pages(httpserver, path, 2)
+
+    async def read_slice(stream_slice):
+        return [record async for record in stream.read_records_async(SyncMode.full_refresh, stream_slice=stream_slice)]
+
+    async def read_slices():
+        return await asyncio.gather(read_slice({"path": "a"}), read_slice({"path": "b"}))
+
+    assert asyncio.run(read_slices()) == [[{"page": 1}, {"page": 2}], [{"page": 1}, {"page": 2}]]
+
+
+def test_requests_are_profiled_for_the_stream(httpserver, mocker):
+    profiler = StreamProfiler()
+    profiler.enable()
+    mocker.patch("airbyte_cdk.sources.streams.http.async_http.stream_profiler", profiler)
+    stream = StubAsyncHttpStream(httpserver.url_for("/"))
+    _expect_pages(httpserver, "/", 2)
+
+    list(stream.read_records(SyncMode.full_refresh))
+
+    report = profiler.report()["streams"][stream.name]
+    assert report["requests"] == 2
+    assert report["bytes"] > 0
+    assert report["stages_seconds"][HTTP_WAIT] > 0
+
+
+def test_requests_in_flight_are_bounded_per_host(mocker):
+    class BoundedStream(StubAsyncHttpStream):
+        def __init__(self, path: str, max_requests_per_host: int):
+            super().__init__("https://bounded_host.com/")
+            self._path = path
+            self._max_requests_per_host = max_requests_per_host
+
+        @property
+        def max_requests_per_host(self) -> int:
+            return self._max_requests_per_host
+
+        def path(self, **kwargs) -> str:
+            return self._path
+
+    in_flight = 0
+    max_in_flight = {"low": 0, "high": 0}
+
+    async def send(client_session, request, request_kwargs):
+        nonlocal in_flight
+        in_flight += 1
+        # Requests in flight to the host when the request is sent, whatever stream sent them
+        path = request.url.rsplit("/", 1)[-1]
+        max_in_flight[path] = max(max_in_flight[path], in_flight)
+        await asyncio.sleep(0.1)
+        in_flight -= 1
+        return _create_response(HTTPStatus.OK)
+
+    mocker.patch.object(AsyncHttpStream, "_send_with_client_session", side_effect=send)
+    streams = [BoundedStream("low", 2), BoundedStream("high", 4)]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        reads = [executor.submit(lambda s: list(s.read_records(SyncMode.full_refresh)), streams[i % 2]) for i in range(16)]
+        assert [read.result() for read in reads] == [[{"id": 1}]] * 16
+
+    assert max_in_flight["low"] <= 2
+    assert max_in_flight["high"] == 4
+
+
+def test_user_defined_backoff_sleeps_without_blocking_the_event_loop(mocker):
+    class CustomBackoffStream(StubAsyncHttpStream):
+        def backoff_time(self, response: requests.Response) -> Optional[float]:
+            return 0.5
+
+    sleep_mock = mocker.patch("asyncio.sleep", mocker.AsyncMock())
+    time_sleep_mock = mocker.patch("time.sleep")
+    send_mock = mocker.patch.object(
+        AsyncHttpStream, "_send_with_client_session", mocker.AsyncMock(return_value=_create_response(HTTPStatus.TOO_MANY_REQUESTS))
+    )
+    stream = CustomBackoffStream("https://backoff_host.com/")
+
+    with pytest.raises(UserDefinedBackoffException):
+        list(stream.read_records(SyncMode.full_refresh))
+
+    assert send_mock.call_count == stream.max_retries + 1
+    sleep_mock.assert_any_call(1.5)
+    time_sleep_mock.assert_not_called()
+
+
+@pytest.mark.parametrize("retries", [-1, 0, 2])
+def test_default_backoff_retries(httpserver, retries):
+    class RetriesStream(StubAsyncHttpStream):
+        max_retries = retries
+
+    httpserver.expect_request("/").respond_with_data(status=HTTPStatus.BAD_GATEWAY)
+
+    with pytest.raises(DefaultBackoffException):
+        list(RetriesStream(httpserver.url_for("/")).read_records(SyncMode.full_refresh))
+    assert len(httpserver.log) == max(0, retries) + 1
+
+
+def test_connection_errors_are_raised_as_the_ones_of_requests():
+    class NoRetryStream(StubAsyncHttpStream):
+        max_retries = 0
+
+    # Nothing listens on the port
+    with pytest.raises(requests.exceptions.ConnectionError):
+        list(NoRetryStream("http://localhost:1/").read_records(SyncMode.full_refresh))
+
+
+def test_unexpected_error_code_is_raised(httpserver):
+    stream = StubAsyncHttpStream(httpserver.url_for("/"))
+    httpserver.expect_request("/").respond_with_json({"message": "forbidden"}, status=HTTPStatus.FORBIDDEN)
+
+    with pytest.raises(requests.HTTPError) as error:
+        list(stream.read_records(SyncMode.full_refresh))
+    assert stream.parse_response_error_message(error.value.response) == "forbidden"
+
+
+def test_requests_are_sent_from_a_single_event_loop_thread(httpserver, mocker):
+    stream = StubAsyncHttpStream(httpserver.url_for("/"))
+    sending_threads = set()
+    httpserver.expect_request("/").respond_with_json({"data": [{"id": 1}]})
+    send_with_client_session = AsyncHttpStream._send_with_client_session
+
+    async def send(client_session, request, request_kwargs):
+        sending_threads.add(threading.current_thread().name)
+        return await send_with_client_session(client_session, request, request_kwargs)
+
+    mocker.patch.object(AsyncHttpStream, "_send_with_client_session", side_effect=send)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(lambda _: list(stream.read_records(SyncMode.full_refresh)), range(4))) == [[{"id": 1}]] * 4
+    assert sending_threads == {"airbyte_http_event_loop"}
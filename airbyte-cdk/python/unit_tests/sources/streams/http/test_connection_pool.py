@@ -0,0 +1,113 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterable, Mapping, Optional
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http.connection_pool import ConnectionPoolRegistry, ConnectionPoolStats
+from requests.adapters import HTTPAdapter
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_addresses = []
+
+    def do_GET(self):
+        self.client_addresses.append(self.client_address)
+        body = b'{"id": 1}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def build_stream(url: str, registry: Optional[ConnectionPoolRegistry]) -> HttpStream:
+    class LocalStream(HttpStream):
+        url_base = url
+        primary_key = None
+        connection_pool_registry = registry
+
+        def path(self, **kwargs) -> str:
+            return "records"
+
+        def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+            return None
+
+        def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+            yield response.json()
+
+    return LocalStream()
+
+
+def test_streams_requesting_the_same_host_share_connections(server_url):
+    registry = ConnectionPoolRegistry()
+    streams = [build_stream(server_url, registry) for _ in range(3)]
+    for stream in streams * 2:
+        assert list(stream.read_records(SyncMode.full_refresh)) == [{"id": 1}]
+
+    assert registry.stats()[server_url] == ConnectionPoolStats(requests=6, connections=1)
+    assert registry.stats()[server_url].reused_connections == 5
+
+
+def test_streams_keep_their_own_connections_by_default(server_url):
+    stream = build_stream(server_url, None)
+    list(stream.read_records(SyncMode.full_refresh))
+
+    assert stream._session.get_adapter(server_url) is stream._default_adapters[-1]
+
+
+def test_adapter_mounted_by_the_connector_is_kept(server_url):
+    registry = ConnectionPoolRegistry()
+    stream = build_stream(server_url, registry)
+    adapter = HTTPAdapter(max_retries=3)
+    stream._session.mount("http://", adapter)
+
+    list(stream.read_records(SyncMode.full_refresh))
+
+    assert stream._session.get_adapter(server_url) is adapter
+    assert server_url not in registry.stats()
+
+
+def test_connections_are_closed_after_each_request_without_keep_alive(server_url):
+    KeepAliveHandler.client_addresses.clear()
+    stream = build_stream(server_url, ConnectionPoolRegistry(keep_alive=False))
+    for _ in range(2):
+        list(stream.read_records(SyncMode.full_refresh))
+
+    # Each request comes from a new connection
+    assert len(set(KeepAliveHandler.client_addresses)) == 2
+
+
+def test_registry_gives_one_adapter_per_host():
+    registry = ConnectionPoolRegistry(pool_size=20, max_retries=3)
+
+    prefix, adapter = registry.get_adapter("https://API.example.com/v1/users?page=2")
+    assert prefix == "https://api.example.com/"
+    assert adapter._pool_maxsize == 20
+    assert adapter.max_retries.total == 3
+    assert registry.get_adapter("https://api.example.com/v2") == (prefix, adapter)
+    assert registry.get_adapter("https://api.example.com.other.com/")[1] is not adapter
+    assert registry.stats() == {
+        "https://api.example.com/": ConnectionPoolStats(requests=0, connections=0),
+        "https://api.example.com.other.com/": ConnectionPoolStats(requests=0, connections=0),
+    }
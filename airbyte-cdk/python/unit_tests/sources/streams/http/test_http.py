@@ -4,6 +4,9 @@
 
 
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from typing import Any, Iterable, Mapping, Optional
 from unittest.mock import ANY, MagicMock, patch
@@ -16,6 +19,7 @@ from airbyte_cdk.sources.streams.http.auth import NoAuth
 from airbyte_cdk.sources.streams.http.auth import TokenAuthenticator as HttpTokenAuthenticator
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
+from airbyte_cdk.sources.utils.parent_record_cache import ParentRecordCache
 
 
 class StubBasicReadHttpStream(HttpStream):
@@ -442,6 +446,129 @@ def test_using_cache(mocker, requests_mock):
     assert parent_stream._session.cache.has_url("https://google.com/search")
 
 
+class ParentRecordsStream(HttpStream):
+    url_base = "https://example.com/"
+    primary_key = "id"
+
+    def path(self, **kwargs) -> str:
+        return "parents"
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()
+
+
+class CachedParentRecordsSubStream(CacheHttpSubStream):
+    parent_record_fields = ["id"]
+
+
+def test_substreams_share_the_cached_parent_records(mocker, requests_mock):
+    mocker.patch("airbyte_cdk.sources.streams.http.http.parent_record_cache", ParentRecordCache())
+    requests_mock.get("https://example.com/parents", json=[{"id": 1, "name": "first"}, {"id": 2, "name": "second"}])
+
+    # Substreams of the same parent share its records whatever their state
+    for stream_state in [{}, {"updated_at": "2023-01-01"}]:
+        child_stream = CachedParentRecordsSubStream(parent=ParentRecordsStream())
+        stream_slices = child_stream.stream_slices(sync_mode=SyncMode.incremental, stream_state=stream_state)
+        assert list(stream_slices) == [{"parent": {"id": 1}}, {"parent": {"id": 2}}]
+    assert requests_mock.call_count == 1
+
+    child_stream = CacheHttpSubStream(parent=ParentRecordsStream())
+    assert list(child_stream.stream_slices(sync_mode=SyncMode.full_refresh)) == [
+        {"parent": {"id": 1, "name": "first"}},
+        {"parent": {"id": 2, "name": "second"}},
+    ]
+    assert requests_mock.call_count == 2
+
+
+class PrefetchingSubStream(HttpSubStream):
+    url_base = "https://example.com/"
+    primary_key = "id"
+    max_prefetched_slices = 2
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.fetching_threads = []
+
+    def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
+        return f"parents/{stream_slice['parent']['id']}/children"
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        self.fetching_threads.append(threading.current_thread().name)
+        yield from response.json()
+
+
+def test_substream_prefetches_the_records_of_the_next_slices(requests_mock):
+    requests_mock.get("https://example.com/parents", json=[{"id": parent_id} for parent_id in range(5)])
+    for parent_id in range(5):
+        requests_mock.get(f"https://example.com/parents/{parent_id}/children", json=[{"id": f"{parent_id}-{i}"} for i in range(2)])
+    stream = PrefetchingSubStream(parent=ParentRecordsStream())
+
+    records = [
+        record
+        for stream_slice in stream.stream_slices(sync_mode=SyncMode.full_refresh)
+        for record in stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice)
+    ]
+
+    assert records == [{"id": f"{parent_id}-{i}"} for parent_id in range(5) for i in range(2)]
+    assert requests_mock.call_count == 6
+    assert len(stream.fetching_threads) == 5
+    assert all(thread_name.startswith(f"{stream.name}_prefetch") for thread_name in stream.fetching_threads)
+
+
+class HostBoundedStream(StubBasicReadHttpStream):
+    url_base = "https://bounded_host.com/"
+
+    def __init__(self, path: str, max_requests_per_host: int):
+        super().__init__()
+        self._path = path
+        self._max_requests_per_host = max_requests_per_host
+
+    @property
+    def max_requests_per_host(self) -> int:
+        return self._max_requests_per_host
+
+    def path(self, **kwargs) -> str:
+        return self._path
+
+
+def test_requests_in_flight_are_bounded_per_host(mocker):
+    in_flight = 0
+    max_in_flight = {"low": 0, "high": 0}
+    lock = threading.Lock()
+
+    def send(request, **kwargs):
+        nonlocal in_flight
+        path = request.url.rsplit("/", 1)[-1]
+        with lock:
+            in_flight += 1
+            # Requests in flight to the host when the request is sent, whatever stream sent them
+            max_in_flight[path] = max(max_in_flight[path], in_flight)
+        time.sleep(0.1)
+        with lock:
+            in_flight -= 1
+        response = requests.Response()
+        response.status_code = HTTPStatus.OK
+        return response
+
+    mocker.patch.object(requests.Session, "send", side_effect=send)
+    # The streams request the same host with different limits
+    streams = [HostBoundedStream("low", 2), HostBoundedStream("high", 4)]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        reads = [executor.submit(lambda s: list(s.read_records(SyncMode.full_refresh)), streams[i % 2]) for i in range(16)]
+        for read in reads:
+            read.result()
+
+    assert max_in_flight["low"] <= 2
+    assert max_in_flight["high"] == 4
+
+
 class AutoFailTrueHttpStream(StubBasicReadHttpStream):
     raise_on_http_errors = True
 
@@ -0,0 +1,125 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from typing import Any, Iterable, Mapping, Optional
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import AsyncHttpStream, HttpStream, RateLimit, RateLimiter
+from airbyte_cdk.sources.streams.http.rate_limiting import TokenBucket
+
+NOW = 1000.0
+
+
+@pytest.fixture
+def clock(mocker):
+    class Clock:
+        monotonic = NOW
+
+        def sleep(self, seconds):
+            self.monotonic += seconds
+
+        async def async_sleep(self, seconds):
+            self.monotonic += seconds
+
+    clock = Clock()
+    mocker.patch("airbyte_cdk.sources.streams.http.rate_limiting.time.monotonic", side_effect=lambda: clock.monotonic)
+    mocker.patch("airbyte_cdk.sources.streams.http.rate_limiting.time.time", side_effect=lambda: clock.monotonic + 1_600_000_000)
+    mocker.patch("airbyte_cdk.sources.streams.http.rate_limiting.time.sleep", side_effect=clock.sleep)
+    mocker.patch("airbyte_cdk.sources.streams.http.rate_limiting.asyncio.sleep", side_effect=clock.async_sleep)
+    return clock
+
+
+def test_token_bucket_allows_burst_then_spreads_requests(clock):
+    bucket = TokenBucket(RateLimit(requests=2, period_seconds=1, burst=3))
+
+    assert [bucket.reserve() for _ in range(5)] == [0, 0, 0, 0.5, 1.0]
+    clock.monotonic += 1.5
+    assert [bucket.reserve(), bucket.reserve()] == [0, 0.5]
+
+
+def test_token_bucket_follows_the_quota_of_the_server(clock):
+    bucket = TokenBucket(RateLimit(requests=100, period_seconds=60))
+
+    bucket.limit(remaining=1, reset_at=None)
+    assert bucket.reserve() == 0
+    bucket.limit(remaining=0, reset_at=NOW + 30)
+    assert bucket.reserve() == 30
+
+
+def test_rate_limiter_applies_endpoint_limits_on_top_of_the_default_one(clock):
+    limiter = RateLimiter(
+        RateLimit(requests=4, period_seconds=1),
+        endpoint_limits={"/v1": RateLimit(requests=2, period_seconds=1), "/v1/search": RateLimit(requests=1, period_seconds=1)},
+    )
+
+    # Only the most specific endpoint limit applies
+    for _ in range(2):
+        limiter.acquire("https://api.com/v1/search?q=airbyte")
+    assert clock.monotonic == NOW + 1
+    for _ in range(2):
+        limiter.acquire("https://api.com/v1/users")
+    assert clock.monotonic == NOW + 1
+    # The default limit applies to all the requests
+    for _ in range(3):
+        limiter.acquire("https://api.com/v2/users")
+    assert clock.monotonic == NOW + 1.25
+
+
+@pytest.mark.parametrize(
+    "reset_header, expected_wait",
+    [
+        pytest.param("20", 20, id="seconds"),
+        pytest.param(str(NOW + 1_600_000_000 + 40), 40, id="timestamp"),
+    ],
+)
+def test_rate_limiter_waits_for_the_reset_of_an_exhausted_quota(clock, reset_header, expected_wait):
+    limiter = RateLimiter(RateLimit(requests=100, period_seconds=1))
+    response = requests.Response()
+    response.headers.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset_header})
+
+    limiter.update_from_response(response)
+    limiter.acquire("https://api.com/users")
+    assert clock.monotonic == NOW + expected_wait
+
+
+class RateLimitedStream(HttpStream):
+    url_base = "https://api.com/"
+    primary_key = None
+    rate_limiter = RateLimiter(RateLimit(requests=1, period_seconds=2), remaining_header="X-Remaining")
+
+    def path(self, **kwargs) -> str:
+        return "users"
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()
+
+
+def test_streams_share_the_rate_limiter(clock, requests_mock):
+    RateLimitedStream.rate_limiter = RateLimiter(RateLimit(requests=1, period_seconds=2), remaining_header="X-Remaining")
+    requests_mock.get("https://api.com/users", json=[{"id": 1}], headers={"X-Remaining": "0"})
+
+    for stream in [RateLimitedStream(), RateLimitedStream()]:
+        assert list(stream.read_records(SyncMode.full_refresh)) == [{"id": 1}]
+    # The second request waits for a new token as the quota of the API is exhausted
+    assert clock.monotonic == NOW + 2
+    assert requests_mock.call_count == 2
+
+
+def test_async_streams_share_the_rate_limiter(clock, httpserver):
+    class AsyncRateLimitedStream(AsyncHttpStream, RateLimitedStream):
+        url_base = httpserver.url_for("/")
+        rate_limiter = RateLimiter(RateLimit(requests=1, period_seconds=2), remaining_header="X-Remaining")
+
+    httpserver.expect_request("/users").respond_with_json([{"id": 1}], headers={"X-Remaining": "0"})
+
+    for stream in [AsyncRateLimitedStream(), AsyncRateLimitedStream()]:
+        assert list(stream.read_records(SyncMode.full_refresh)) == [{"id": 1}]
+    # The second request waits for a new token without blocking the event loop
+    assert clock.monotonic == NOW + 2
+    assert len(httpserver.log) == 2
@@ -5,6 +5,8 @@
 import copy
 import datetime
 import logging
+import threading
+import time
 from collections import defaultdict
 from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 from unittest.mock import Mock, call
@@ -36,6 +38,7 @@ from airbyte_cdk.models import (
 from airbyte_cdk.models import Type
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources import AbstractSource
+from airbyte_cdk.sources.checkpoint_policy import CheckpointPolicy
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams import IncrementalMixin, Stream
@@ -52,12 +55,16 @@ class MockSource(AbstractSource):
         check_lambda: Callable[[], Tuple[bool, Optional[Any]]] = None,
         streams: List[Stream] = None,
         per_stream: bool = True,
-        message_repository: MessageRepository = None
+        message_repository: MessageRepository = None,
+        max_concurrent_streams: int = 1,
+        checkpoint_policy: CheckpointPolicy = None,
     ):
         self._streams = streams
         self.check_lambda = check_lambda
         self.per_stream = per_stream
         self._message_repository = message_repository
+        self._max_concurrent_streams = max_concurrent_streams
+        self._checkpoint_policy = checkpoint_policy or CheckpointPolicy()
 
     def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
         if self.check_lambda:
@@ -77,6 +84,14 @@ class MockSource(AbstractSource):
     def message_repository(self):
         return self._message_repository
 
+    @property
+    def max_concurrent_streams(self) -> int:
+        return self._max_concurrent_streams
+
+    @property
+    def checkpoint_policy(self) -> CheckpointPolicy:
+        return self._checkpoint_policy
+
 
 class StreamNoStateMethod(Stream):
     name = "managers"
@@ -473,6 +488,166 @@ def test_read_incremental_with_slices_sends_slice_messages(mocker):
     assert 2 == len(list(filter(lambda message: message.log and message.log.message.startswith("slice:"), messages)))
 
 
+def _messages_of_stream(messages: List[AirbyteMessage], stream_name: str) -> List[AirbyteMessage]:
+    return [
+        message
+        for message in messages
+        if (message.type == Type.RECORD and message.record.stream == stream_name)
+        or (message.type == Type.TRACE and message.trace.stream_status.stream_descriptor.name == stream_name)
+        or (message.type == Type.STATE and message.state.stream.stream_descriptor.name == stream_name)
+    ]
+
+
+def test_concurrent_full_refresh_read_keeps_per_stream_order(mocker):
+    """Tests that reading streams concurrently emits the same messages as the sequential read and keeps the order within each stream"""
+    slices = [{"1": "1"}, {"2": "2"}, {"3": "3"}]
+    streams = [
+        MockStream([({"sync_mode": SyncMode.full_refresh, "stream_slice": s}, [s, s]) for s in slices], name=f"s{i}") for i in range(4)
+    ]
+
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh) for stream in streams])
+    sequential_messages = _fix_emitted_at(list(MockSource(streams=streams).read(logger, {}, catalog)))
+    concurrent_messages = _fix_emitted_at(list(MockSource(streams=streams, max_concurrent_streams=3).read(logger, {}, catalog)))
+
+    assert len(concurrent_messages) == len(sequential_messages)
+    for stream in streams:
+        expected = _fix_emitted_at(
+            [
+                _as_stream_status(stream.name, AirbyteStreamStatus.STARTED),
+                _as_stream_status(stream.name, AirbyteStreamStatus.RUNNING),
+                *_as_records(stream.name, [s for s in slices for _ in range(2)]),
+                _as_stream_status(stream.name, AirbyteStreamStatus.COMPLETE),
+            ]
+        )
+        assert _messages_of_stream(concurrent_messages, stream.name) == expected
+
+
+def test_concurrent_incremental_read_checkpoints_each_stream_after_its_records(mocker):
+    slices = [{"1": "1"}, {"2": "2"}]
+    streams = [
+        MockStreamWithState(
+            [({"sync_mode": SyncMode.incremental, "stream_slice": s, "stream_state": {}}, [s]) for s in slices],
+            name=f"s{i}",
+            state={"cursor": "value"},
+        )
+        for i in range(3)
+    ]
+
+    mocker.patch.object(MockStreamWithState, "get_json_schema", return_value={})
+    mocker.patch.object(MockStreamWithState, "stream_slices", return_value=slices)
+
+    src = MockSource(streams=streams, max_concurrent_streams=3)
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental) for stream in streams])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    for stream in streams:
+        stream_messages = _messages_of_stream(messages, stream.name)
+        assert [message.type for message in stream_messages] == [
+            Type.TRACE,
+            Type.TRACE,
+            Type.RECORD,
+            Type.STATE,
+            Type.RECORD,
+            Type.STATE,
+            Type.TRACE,
+        ]
+        assert stream_messages[-1] == _fix_emitted_at([_as_stream_status(stream.name, AirbyteStreamStatus.COMPLETE)])[0]
+
+
+def test_concurrent_read_raises_first_failure_and_stops_other_streams(mocker):
+    failing_stream = MockStream(name="failing")
+    slow_stream = MockStream(name="slow")
+    not_started_stream = MockStream(name="not_started")
+    slow_stream_started = threading.Event()
+
+    def _read_records(self, **kwargs):
+        if self.name == "failing":
+            # Otherwise the failure can stop the read before the slow stream starts
+            assert slow_stream_started.wait(timeout=10)
+            raise RuntimeError("oh no!")
+        while True:
+            yield {"id": 1}
+            slow_stream_started.set()
+
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "read_records", _read_records)
+
+    src = MockSource(streams=[failing_stream, slow_stream, not_started_stream], max_concurrent_streams=2)
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(stream, SyncMode.full_refresh) for stream in [failing_stream, slow_stream, not_started_stream]]
+    )
+
+    messages = []
+    with pytest.raises(RuntimeError, match="oh no!"):
+        for message in src.read(logger, {}, catalog):
+            messages.append(message)
+
+    failing_messages = _messages_of_stream(messages, "failing")
+    assert failing_messages[-1].trace.stream_status.status == AirbyteStreamStatus.INCOMPLETE
+    slow_messages = _messages_of_stream(messages, "slow")
+    assert slow_messages[-1].trace.stream_status.status == AirbyteStreamStatus.INCOMPLETE
+    assert not _messages_of_stream(messages, "not_started")
+
+
+def test_full_refresh_read_with_concurrent_slices_emits_records_in_slice_order(mocker):
+    slices = [{"slice": i} for i in range(5)]
+    stream = MockStream([({"sync_mode": SyncMode.full_refresh, "stream_slice": s}, [s, s]) for s in slices], name="s1")
+
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+    mocker.patch.object(MockStream, "max_concurrent_slices", new_callable=mocker.PropertyMock, return_value=2)
+
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh)])
+
+    expected = _fix_emitted_at(
+        [
+            _as_stream_status("s1", AirbyteStreamStatus.STARTED),
+            _as_stream_status("s1", AirbyteStreamStatus.RUNNING),
+            *_as_records("s1", [s for s in slices for _ in range(2)]),
+            _as_stream_status("s1", AirbyteStreamStatus.COMPLETE),
+        ]
+    )
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    assert expected == messages
+
+
+def test_full_refresh_read_with_concurrent_slices_does_not_wait_for_slices_read_ahead_once_the_limit_is_reached(mocker):
+    slices = [{"slice": i} for i in range(3)]
+    stream = MockStream(name="s1")
+    read_finished = threading.Event()
+    last_slice_read = threading.Event()
+
+    def _read_records(self, stream_slice=None, **kwargs):
+        if stream_slice["slice"] == 2:
+            # Would block the read if it waited for the slices read ahead
+            read_finished.wait(timeout=10)
+            last_slice_read.set()
+        yield stream_slice
+        yield stream_slice
+
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+    mocker.patch.object(MockStream, "read_records", _read_records)
+    mocker.patch.object(MockStream, "max_concurrent_slices", new_callable=mocker.PropertyMock, return_value=2)
+
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh)])
+
+    try:
+        messages = list(src.read(logger, {"_limit": 3}, catalog))
+        assert not last_slice_read.is_set()
+    finally:
+        read_finished.set()
+
+    assert [message.record.data for message in messages if message.type == Type.RECORD] == [{"slice": 0}, {"slice": 0}, {"slice": 1}]
+
+
 class TestIncrementalRead:
     @pytest.mark.parametrize(
         "use_legacy",
@@ -787,6 +962,147 @@ class TestIncrementalRead:
 
         assert expected == messages
 
+    def test_with_concurrent_slices_checkpoints_after_each_slice(self, mocker):
+        """Tests that the state computed from the emitted records is checkpointed after each slice of concurrently read slices"""
+        slices = [{"1": "1"}, {"2": "2"}, {"3": "3"}]
+        stream_output = [{"k1": "v1"}, {"k2": "v2"}]
+        stream = MockStream(
+            [({"sync_mode": SyncMode.incremental, "stream_slice": s, "stream_state": mocker.ANY}, stream_output) for s in slices],
+            name="s1",
+        )
+        state = {"cursor": "value"}
+        mocker.patch.object(MockStream, "get_updated_state", return_value=state)
+        mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+        mocker.patch.object(MockStream, "state_checkpoint_interval", new_callable=mocker.PropertyMock, return_value=1)
+        mocker.patch.object(MockStream, "max_concurrent_slices", new_callable=mocker.PropertyMock, return_value=2)
+
+        src = MockSource(streams=[stream])
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+        expected = _fix_emitted_at(
+            [
+                _as_stream_status("s1", AirbyteStreamStatus.STARTED),
+                _as_stream_status("s1", AirbyteStreamStatus.RUNNING),
+                # the state is computed from the records emitted so far, so it is checkpointed after every slice
+                *_as_records("s1", stream_output),
+                _as_state({"s1": state}, "s1", state),
+                *_as_records("s1", stream_output),
+                _as_state({"s1": state}, "s1", state),
+                *_as_records("s1", stream_output),
+                _as_state({"s1": state}, "s1", state),
+                _as_stream_status("s1", AirbyteStreamStatus.COMPLETE),
+            ]
+        )
+
+        messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=[])))
+
+        assert expected == messages
+
+    def test_with_concurrent_slices_and_state_property_checkpoints_the_state_of_the_processed_slices(self, mocker):
+        """Tests that the state of a stream, which is updated by the slices read ahead, is checkpointed as the slices are processed but
+        never covers a slice whose records were not emitted"""
+
+        class StreamWithCursor(MockStreamWithState):
+            def __init__(self):
+                super().__init__([], name="s1", state={"cursor": 0})
+                self._lock = threading.Lock()
+
+            def read_records(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
+                # The later slices are read faster so that they update the state before the earlier ones are emitted
+                time.sleep((6 - stream_slice["id"]) * 0.02)
+                yield {"id": stream_slice["id"]}
+                with self._lock:
+                    self._state = {"cursor": max(self._state["cursor"], stream_slice["id"])}
+
+        stream = StreamWithCursor()
+        mocker.patch.object(StreamWithCursor, "supports_incremental", return_value=True)
+        mocker.patch.object(StreamWithCursor, "get_json_schema", return_value={})
+        mocker.patch.object(StreamWithCursor, "stream_slices", return_value=[{"id": i} for i in range(1, 7)])
+        mocker.patch.object(StreamWithCursor, "max_concurrent_slices", new_callable=mocker.PropertyMock, return_value=2)
+
+        src = MockSource(streams=[stream])
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+        emitted_slices = 0
+        checkpoints = []
+        for message in src.read(logger, {}, catalog, state=[]):
+            if message.type == Type.RECORD:
+                emitted_slices = message.record.data["id"]
+            elif message.type == Type.STATE:
+                checkpoints.append((emitted_slices, message.state.stream.stream_state.dict()["cursor"]))
+
+        assert emitted_slices == 6
+        assert all(cursor <= slices for slices, cursor in checkpoints)
+        # the state is checkpointed while the next slices are read ahead rather than once no slice is read ahead
+        assert checkpoints[0] == (1, 1)
+        assert any(1 < cursor and slices < 6 for slices, cursor in checkpoints)
+        assert checkpoints[-1] == (6, 6)
+
+    def test_with_coalesced_checkpoints(self, mocker):
+        """Tests that the states of consecutive slices are emitted once the records of the policy are read, and at the end of the stream"""
+        slices = [{"1": "1"}, {"2": "2"}, {"3": "3"}]
+        stream_outputs = [[{"cursor": 1}, {"cursor": 2}], [{"cursor": 3}, {"cursor": 4}], [{"cursor": 5}, {"cursor": 6}]]
+        stream = MockStream(
+            [
+                ({"sync_mode": SyncMode.incremental, "stream_slice": s, "stream_state": mocker.ANY}, output)
+                for s, output in zip(slices, stream_outputs)
+            ],
+            name="s1",
+        )
+        mocker.patch.object(MockStream, "get_updated_state", side_effect=lambda state, record: {"cursor": record["cursor"]})
+        mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+
+        src = MockSource(streams=[stream], checkpoint_policy=CheckpointPolicy(max_records=3))
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+        expected = _fix_emitted_at(
+            [
+                _as_stream_status("s1", AirbyteStreamStatus.STARTED),
+                _as_stream_status("s1", AirbyteStreamStatus.RUNNING),
+                *_as_records("s1", stream_outputs[0]),
+                *_as_records("s1", stream_outputs[1]),
+                _as_state({"s1": {"cursor": 4}}, "s1", {"cursor": 4}),
+                *_as_records("s1", stream_outputs[2]),
+                _as_state({"s1": {"cursor": 6}}, "s1", {"cursor": 6}),
+                _as_stream_status("s1", AirbyteStreamStatus.COMPLETE),
+            ]
+        )
+
+        messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=[])))
+
+        assert expected == messages
+
+    def test_with_coalesced_checkpoints_emits_the_state_of_the_last_slice_read_before_an_error(self, mocker):
+        """Tests that the state of the slices read before an error is emitted, but not the state of the slice which failed"""
+        stream = MockStream(name="s1")
+
+        def _read_records(self, stream_slice, **kwargs):
+            yield {"cursor": stream_slice["id"]}
+            if stream_slice["id"] == 3:
+                raise RuntimeError("oh no!")
+
+        mocker.patch.object(MockStream, "read_records", _read_records)
+        mocker.patch.object(MockStream, "get_updated_state", side_effect=lambda state, record: {"cursor": record["cursor"]})
+        mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        mocker.patch.object(MockStream, "stream_slices", return_value=[{"id": 1}, {"id": 2}, {"id": 3}])
+
+        src = MockSource(streams=[stream], checkpoint_policy=CheckpointPolicy(interval_seconds=3600))
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+        messages = []
+        with pytest.raises(RuntimeError, match="oh no!"):
+            for message in src.read(logger, {}, catalog, state=[]):
+                messages.append(message)
+
+        state_messages = [message for message in messages if message.type == Type.STATE]
+        assert state_messages == [_as_state({"s1": {"cursor": 2}}, "s1", {"cursor": 2})]
+        assert [message.type for message in messages][-5:] == [Type.RECORD, Type.RECORD, Type.RECORD, Type.STATE, Type.TRACE]
+
     @pytest.mark.parametrize(
         "use_legacy",
         [
@@ -0,0 +1,63 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from airbyte_cdk.sources.checkpoint_policy import CheckpointPolicy, StreamCheckpointer
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _create_checkpointer(policy: CheckpointPolicy, clock: FakeClock = None) -> StreamCheckpointer:
+    return StreamCheckpointer(ConnectorStateManager({}, []), "stream", None, policy, True, clock=clock or FakeClock())
+
+
+def _emitted_state(state_message):
+    return state_message.state.stream.stream_state.dict() if state_message else None
+
+
+def test_default_policy_checkpoints_every_slice():
+    checkpointer = _create_checkpointer(CheckpointPolicy())
+
+    assert _emitted_state(checkpointer.slice_read({"cursor": 1})) == {"cursor": 1}
+    assert _emitted_state(checkpointer.slice_read({"cursor": 2})) == {"cursor": 2}
+    assert checkpointer.flush() is None
+
+
+def test_slices_are_checkpointed_once_the_interval_elapsed():
+    clock = FakeClock()
+    checkpointer = _create_checkpointer(CheckpointPolicy(interval_seconds=10), clock)
+
+    clock.now = 5
+    assert checkpointer.slice_read({"cursor": 1}) is None
+    clock.now = 10
+    assert _emitted_state(checkpointer.slice_read({"cursor": 2})) == {"cursor": 2}
+    clock.now = 15
+    assert checkpointer.slice_read({"cursor": 3}) is None
+    assert _emitted_state(checkpointer.flush()) == {"cursor": 3}
+    assert checkpointer.flush() is None
+
+
+def test_checkpoint_is_due_once_the_size_of_the_records_is_reached():
+    checkpointer = _create_checkpointer(CheckpointPolicy(max_bytes=30))
+
+    assert not checkpointer.record_read({"id": "a record"})
+    assert checkpointer.record_read({"id": "another record"})
+    checkpointer.checkpoint({"cursor": 1})
+    assert not checkpointer.is_due()
+
+
+def test_unchanged_state_is_not_emitted_again():
+    checkpointer = _create_checkpointer(CheckpointPolicy(skip_unchanged_state=True))
+    state = {"cursor": {"partition": 1}}
+
+    assert _emitted_state(checkpointer.checkpoint(state)) == {"cursor": {"partition": 1}}
+    assert checkpointer.slice_read(state) is None
+    state["cursor"]["partition"] = 2
+    assert _emitted_state(checkpointer.slice_read(state)) == {"cursor": {"partition": 2}}
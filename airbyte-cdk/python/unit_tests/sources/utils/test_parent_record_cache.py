@@ -0,0 +1,61 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import pytest
+from airbyte_cdk.sources.utils.parent_record_cache import ParentRecordCache
+
+
+class RecordReader:
+    def __init__(self, records):
+        self.records = records
+        self.reads = 0
+
+    def __call__(self):
+        self.reads += 1
+        yield from self.records
+
+
+@pytest.mark.parametrize("max_records_in_memory", [pytest.param(10, id="test_in_memory"), pytest.param(1, id="test_spilled_to_disk")])
+def test_records_of_a_slice_are_read_once(max_records_in_memory):
+    cache = ParentRecordCache(max_records_in_memory=max_records_in_memory)
+    first_slice_reader, second_slice_reader = RecordReader([1, 2]), RecordReader([{"id": 3}])
+
+    for _ in range(3):
+        assert list(cache.read_records("first_slice", first_slice_reader)) == [1, 2]
+        assert list(cache.read_records("second_slice", second_slice_reader)) == [{"id": 3}]
+
+    assert (first_slice_reader.reads, second_slice_reader.reads) == (1, 1)
+
+
+def test_interrupted_read_is_not_cached():
+    cache = ParentRecordCache()
+    reader = RecordReader([1, 2, 3])
+
+    records = cache.read_records("slice", reader)
+    assert next(records) == 1
+    records.close()
+
+    assert list(cache.read_records("slice", reader)) == [1, 2, 3]
+    assert list(cache.read_records("slice", reader)) == [1, 2, 3]
+    assert reader.reads == 2
+
+
+def test_records_which_cannot_be_spilled_are_read_again():
+    cache = ParentRecordCache(max_records_in_memory=0)
+    reader = RecordReader([{"id": object}])
+
+    for _ in range(2):
+        assert list(cache.read_records("slice", reader)) == [{"id": object}]
+    assert reader.reads == 2
+
+
+@pytest.mark.parametrize("max_records_in_memory", [pytest.param(10, id="test_in_memory"), pytest.param(0, id="test_spilled_to_disk")])
+def test_clear(max_records_in_memory):
+    cache = ParentRecordCache(max_records_in_memory=max_records_in_memory)
+    reader = RecordReader([1])
+
+    assert list(cache.read_records("slice", reader)) == [1]
+    cache.clear()
+    assert list(cache.read_records("slice", reader)) == [1]
+    assert reader.reads == 2
@@ -0,0 +1,80 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from typing import Any, Iterable, Mapping
+
+from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.utils.schema_cache import SchemaCache
+from airbyte_cdk.utils.event_timing import create_timer
+
+
+class SchemaCountingStream(Stream):
+    primary_key = None
+
+    def __init__(self, name: str = "stream", dynamic: bool = False):
+        self._name = name
+        self._dynamic = dynamic
+        self.schema_calls = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def json_schema_is_dynamic(self) -> bool:
+        return self._dynamic
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        self.schema_calls += 1
+        return {"type": "object", "properties": {"version": {"const": self.schema_calls}}}
+
+    def read_records(self, **kwargs) -> Iterable[Mapping[str, Any]]:
+        yield from []
+
+
+def test_schema_is_resolved_once_per_stream_class_and_name():
+    cache = SchemaCache()
+    stream, other_stream = SchemaCountingStream(), SchemaCountingStream("other_stream")
+
+    for _ in range(3):
+        assert cache.get_json_schema(stream)["properties"]["version"]["const"] == 1
+        assert cache.get_json_schema(other_stream)["properties"]["version"]["const"] == 1
+    assert cache.get_json_schema(SchemaCountingStream()) is cache.get_json_schema(stream)
+    assert stream.schema_calls == other_stream.schema_calls == 1
+
+
+def test_dynamic_schema_is_not_cached():
+    cache = SchemaCache()
+    stream = SchemaCountingStream(dynamic=True)
+
+    assert [cache.get_json_schema(stream)["properties"]["version"]["const"] for _ in range(3)] == [1, 2, 3]
+
+
+def test_invalidate():
+    cache = SchemaCache()
+    stream, other_stream = SchemaCountingStream(), SchemaCountingStream("other_stream")
+    cache.get_json_schema(stream)
+    cache.get_json_schema(other_stream)
+
+    cache.invalidate(stream)
+    cache.get_json_schema(stream)
+    cache.get_json_schema(other_stream)
+    assert (stream.schema_calls, other_stream.schema_calls) == (2, 1)
+
+    cache.invalidate()
+    cache.get_json_schema(stream)
+    cache.get_json_schema(other_stream)
+    assert (stream.schema_calls, other_stream.schema_calls) == (3, 2)
+
+
+def test_schema_resolution_time_is_reported():
+    with create_timer("source") as timer:
+        cache = SchemaCache(timer)
+        stream = SchemaCountingStream(dynamic=True)
+        cache.get_json_schema(stream)
+        first_resolution_time = timer.events["Resolving schema of stream stream"].duration
+        cache.get_json_schema(stream)
+
+        assert timer.events["Resolving schema of stream stream"].duration > first_resolution_time
+        assert "Resolving schema of stream stream" in timer.report()
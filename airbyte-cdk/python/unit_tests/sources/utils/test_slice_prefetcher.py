@@ -0,0 +1,117 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+
+import pytest
+from airbyte_cdk.sources.utils.slice_prefetcher import SlicePrefetcher, read_until_stopped
+from airbyte_cdk.utils.stream_profiler import StreamProfiler
+
+
+def test_slices_are_fetched_concurrently_and_read_in_order():
+    # The slices after the first one can only be fetched if they are fetched at the same time
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fetch_slice(stream_slice, stop):
+        if 1 <= stream_slice["id"] <= 3:
+            barrier.wait()
+        return [f"record of {stream_slice['id']}"]
+
+    prefetcher = SlicePrefetcher(fetch_slice, max_prefetched_slices=3)
+
+    records = [record for stream_slice in prefetcher.prefetch([{"id": i} for i in range(6)]) for record in prefetcher.pop(stream_slice)]
+
+    assert records == [f"record of {i}" for i in range(6)]
+
+
+def test_slices_which_are_not_prefetched_are_fetched_by_the_reader():
+    fetched_slices = []
+    prefetcher = SlicePrefetcher(lambda stream_slice, stop: fetched_slices.append(stream_slice) or [], max_prefetched_slices=0)
+
+    stream_slices = list(prefetcher.prefetch([{"id": 1}, {"id": 2}]))
+
+    assert stream_slices == [{"id": 1}, {"id": 2}]
+    assert prefetcher.pop(stream_slices[0]) is None
+    assert fetched_slices == []
+
+
+def test_only_the_slices_yielded_by_the_prefetcher_are_popped():
+    prefetcher = SlicePrefetcher(lambda stream_slice, stop: [stream_slice], max_prefetched_slices=1)
+
+    for stream_slice in prefetcher.prefetch([{"id": 1}]):
+        assert prefetcher.pop(dict(stream_slice)) is None
+        assert prefetcher.pop(stream_slice) == [stream_slice]
+        assert prefetcher.pop(stream_slice) is None
+
+
+def test_errors_are_raised_when_the_slice_is_read():
+    def fetch_slice(stream_slice, stop):
+        if stream_slice["id"] == 2:
+            raise ValueError("cannot fetch the slice")
+        return [stream_slice]
+
+    prefetcher = SlicePrefetcher(fetch_slice, max_prefetched_slices=2)
+    stream_slices = prefetcher.prefetch([{"id": 1}, {"id": 2}, {"id": 3}])
+
+    assert prefetcher.pop(next(stream_slices)) == [{"id": 1}]
+    with pytest.raises(ValueError):
+        prefetcher.pop(next(stream_slices))
+
+
+def test_only_the_first_slice_is_fetched_until_it_is_read():
+    fetched_slices = []
+    prefetcher = SlicePrefetcher(lambda stream_slice, stop: fetched_slices.append(stream_slice) or [stream_slice], max_prefetched_slices=2)
+    stream_slices = prefetcher.prefetch([{"id": 1}, {"id": 2}, {"id": 3}])
+
+    assert prefetcher.pop(next(stream_slices)) == [{"id": 1}]
+    stream_slices.close()
+
+    assert fetched_slices == [{"id": 1}]
+
+
+def test_fetches_in_progress_stop_when_the_reader_stops():
+    fetch_started = threading.Event()
+    reader_stopped = threading.Event()
+    fetch_done = threading.Event()
+    requested_pages = []
+
+    def pages():
+        for page in range(1, 4):
+            requested_pages.append(page)
+            yield page
+            fetch_started.set()
+            reader_stopped.wait(timeout=5)
+
+    def fetch_slice(stream_slice, stop):
+        if stream_slice["id"] == 1:
+            return []
+        try:
+            return read_until_stopped(pages(), stop)
+        finally:
+            fetch_done.set()
+
+    prefetcher = SlicePrefetcher(fetch_slice, max_prefetched_slices=1)
+    stream_slices = prefetcher.prefetch([{"id": 1}, {"id": 2}])
+    assert prefetcher.pop(next(stream_slices)) == []
+    next(stream_slices)
+    assert fetch_started.wait(timeout=5)
+
+    stream_slices.close()
+    reader_stopped.set()
+
+    assert fetch_done.wait(timeout=5)
+    assert requested_pages == [1, 2]
+
+
+def test_measurements_of_the_fetches_are_attributed_to_the_stream(mocker):
+    profiler = StreamProfiler()
+    profiler.enable()
+    mocker.patch("airbyte_cdk.sources.utils.slice_prefetcher.stream_profiler", profiler)
+    prefetcher = SlicePrefetcher(lambda stream_slice, stop: profiler.count_request(10) or [], max_prefetched_slices=2, name="users")
+
+    for stream_slice in prefetcher.prefetch([{"id": i} for i in range(3)]):
+        prefetcher.pop(stream_slice)
+
+    assert set(profiler.report()["streams"]) == {"users"}
+    assert profiler.report()["streams"]["users"]["requests"] == 3
@@ -2,10 +2,13 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import json
+from unittest.mock import patch
 
 import pytest
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from jsonschema import RefResolutionError
 
 SIMPLE_SCHEMA = {"type": "object", "properties": {"value": {"type": "string"}}}
 COMPLEX_SCHEMA = {
@@ -264,3 +267,92 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+RECURSIVE_SCHEMA = {
+    "$ref": "#/definitions/node",
+    "definitions": {
+        "node": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "flag": {"$ref": "#/definitions/flag"},
+                "children": {"type": ["null", "array"], "items": {"$ref": "#/definitions/node"}},
+            },
+        },
+        "flag": {"$ref": "#/definitions/boolean"},
+        "boolean": {"type": "boolean"},
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "schema, record",
+    [
+        (SIMPLE_SCHEMA, {"value": 12}),
+        (COMPLEX_SCHEMA, {"value": 1, "array": ["111", 111, {1: 111}]}),
+        (COMPLEX_SCHEMA, {"value": "false", "prop": None, "prop_with_null": None, "number_prop": "abc", "int_prop": "1.5"}),
+        (COMPLEX_SCHEMA, {"too_many_types": 1, "nested": {"a": [1]}, "list_of_lists": [[1, None], "x", [{"b": 2}]], "array": 12}),
+        (COMPLEX_SCHEMA, {"value": {"a": 1}, "array": [[1]], "nested": "not an object"}),
+        (VERY_NESTED_SCHEMA, {"very_nested_value": {"very_nested_value": {"very_nested_value": {"very_nested_value": {"very_nested_value": "2"}}}}}),
+        (VERY_NESTED_SCHEMA, {"very_nested_value": {"very_nested_value": 1}}),
+        (RECURSIVE_SCHEMA, {"id": "1", "flag": "yes", "children": [{"id": "a", "flag": 0, "children": None}, {"id": 3, "children": [{"flag": []}]}]}),
+        ({"type": "array", "items": {"type": "array", "items": {"type": "number"}}}, {"not": "an array"}),
+        ({"type": "object", "properties": {"a": {"type": "array", "items": {"type": "integer"}}}}, {"a": "1"}),
+        ({"properties": {"a": {"type": "array", "items": [{"type": "integer"}]}, "b": {"type": "integer"}}}, {"b": "1"}),
+        ({"$id": "http://example.com/schema", "properties": {"a": {"type": "integer"}}}, {"a": "1"}),
+    ],
+)
+@pytest.mark.parametrize(
+    "config",
+    [TransformConfig.DefaultSchemaNormalization, TransformConfig.CustomSchemaNormalization | TransformConfig.DefaultSchemaNormalization],
+)
+def test_compiled_transform_matches_jsonschema_traversal(schema, record, config, caplog):
+    def transform_with(transform_method):
+        transformer = TypeTransformer(config)
+        if TransformConfig.CustomSchemaNormalization in config:
+            transformer.registerCustomTransform(lambda value, subschema: [value, subschema.get("type")] if value == 1 else value)
+        transformed = copy.deepcopy(record)
+        caplog.clear()
+        transform_method(transformer)(transformed, schema)
+        return transformed, [log_record.message for log_record in caplog.records]
+
+    assert transform_with(lambda transformer: transformer.transform) == transform_with(
+        lambda transformer: transformer._transform_with_validator
+    )
+
+
+def test_compiled_transform_raises_on_unresolvable_reference_only_when_reached():
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    record = {"prop": 1}
+    t.transform(record, COMPLEX_SCHEMA)
+    assert record == {"prop": "1"}
+
+    with pytest.raises(RefResolutionError):
+        t.transform({"def": {"dd": 1}}, COMPLEX_SCHEMA)
+
+
+def test_schema_is_compiled_once():
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    with patch.object(TypeTransformer, "_compile", wraps=t._compile) as compile_mock:
+        for value in range(3):
+            t.transform({"value": value}, SIMPLE_SCHEMA)
+        # Subschemas are compiled along with the schema
+        assert compile_mock.call_count == 2
+
+        schema_copy = copy.deepcopy(SIMPLE_SCHEMA)
+        record = {"value": 1}
+        t.transform(record, schema_copy)
+        assert compile_mock.call_count == 4
+    assert record == {"value": "1"}
+
+
+def test_subclass_default_convert_is_used():
+    class CustomTransformer(TypeTransformer):
+        @staticmethod
+        def default_convert(original_item, subschema):
+            return f"{original_item}!"
+
+    record = {"value": 12}
+    CustomTransformer(TransformConfig.DefaultSchemaNormalization).transform(record, SIMPLE_SCHEMA)
+    assert record == {"value": "12!"}
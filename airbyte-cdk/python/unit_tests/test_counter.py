@@ -53,3 +53,11 @@ def test_double_finish_is_safely_ignored():
         timer.finish_event()
         timer.finish_event()
         assert timer.count == 1
+
+
+def test_add_event_duration_sums_up_durations():
+    with create_timer("Source Counter") as timer:
+        timer.add_event_duration("test_event", 1_000_000_000)
+        timer.add_event_duration("test_event", 500_000_000)
+        assert timer.events["test_event"].duration == 1.5
+        assert timer.report() == "Source Counter runtimes:\ntest_event 0:00:01.500000"
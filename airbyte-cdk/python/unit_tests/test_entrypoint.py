@@ -3,8 +3,14 @@
 #
 
 
+import datetime
+import json
+import logging
+import os
+import time
 from argparse import Namespace
 from copy import deepcopy
+from decimal import Decimal
 from typing import Any, List, Mapping, MutableMapping, Union
 from unittest.mock import MagicMock
 
@@ -26,6 +32,8 @@ from airbyte_cdk.models import (
     Type,
 )
 from airbyte_cdk.sources import Source
+from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.utils.stream_profiler import stream_profiler
 
 
 class MockSource(Source):
@@ -93,12 +101,17 @@ def test_airbyte_entrypoint_init(mocker):
         (
             "read",
             {"config": "config_path", "catalog": "catalog_path", "state": "None"},
-            {"command": "read", "config": "config_path", "catalog": "catalog_path", "state": "None", "debug": False},
+            {"command": "read", "config": "config_path", "catalog": "catalog_path", "state": "None", "debug": False, "profile": False},
         ),
         (
             "read",
             {"config": "config_path", "catalog": "catalog_path", "state": "state_path", "debug": ""},
-            {"command": "read", "config": "config_path", "catalog": "catalog_path", "state": "state_path", "debug": True},
+            {"command": "read", "config": "config_path", "catalog": "catalog_path", "state": "state_path", "debug": True, "profile": False},
+        ),
+        (
+            "read",
+            {"config": "config_path", "catalog": "catalog_path", "profile": ""},
+            {"command": "read", "config": "config_path", "catalog": "catalog_path", "state": None, "debug": False, "profile": True},
         ),
     ],
 )
@@ -244,6 +257,23 @@ def test_run_read(entrypoint: AirbyteEntrypoint, mocker, spec_mock, config_mock)
     assert spec_mock.called
 
 
+def test_run_read_with_profile(entrypoint: AirbyteEntrypoint, mocker, spec_mock, config_mock):
+    parsed_args = Namespace(command="read", config="config_path", state="statepath", catalog="catalogpath", profile=True)
+    record = AirbyteRecordMessage(stream="stream", data={"data": "stuff"}, emitted_at=1)
+    mocker.patch.object(MockSource, "read_state", return_value={})
+    mocker.patch.object(MockSource, "read_catalog", return_value={})
+    mocker.patch.object(MockSource, "read", return_value=[AirbyteMessage(record=record, type=Type.RECORD)])
+
+    messages = list(entrypoint.run(parsed_args))
+
+    assert messages[0] == _wrap_message(record)
+    report_message = AirbyteMessage.parse_raw(messages[-1])
+    assert report_message.type == Type.LOG
+    report = json.loads(report_message.log.message[len("Profiling report: ") :])
+    assert report["streams"]["stream"]["stages_seconds"]["serialization"] > 0
+    assert not stream_profiler.enabled
+
+
 def test_run_read_with_exception(entrypoint: AirbyteEntrypoint, mocker, spec_mock, config_mock):
     parsed_args = Namespace(command="read", config="config_path", state="statepath", catalog="catalogpath")
     mocker.patch.object(MockSource, "read_state", return_value={})
@@ -258,3 +288,66 @@ def test_run_read_with_exception(entrypoint: AirbyteEntrypoint, mocker, spec_moc
 def test_invalid_command(entrypoint: AirbyteEntrypoint, config_mock):
     with pytest.raises(Exception):
         list(entrypoint.run(Namespace(command="invalid", config="conf")))
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(stream_data_to_airbyte_message("stream", {"id": 1, "name": "airbyte"}), id="test_record_from_stream_data"),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD,
+                record=AirbyteRecordMessage(namespace="public", stream="stream", data={"id": 1}, emitted_at=1),
+            ),
+            id="test_record_with_namespace",
+        ),
+        pytest.param(
+            stream_data_to_airbyte_message(
+                "stream",
+                {"unicode": "café", "date": datetime.date(2023, 1, 1), "decimal": Decimal("1.5"), "nested": {"list": [1, None, True]}},
+            ),
+            id="test_record_with_values_encoded_by_pydantic",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={}, emitted_at=1), log=None),
+            id="test_record_message_with_other_fields_set",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={}, emitted_at=1, extra_field="extra")),
+            id="test_record_with_extra_field",
+        ),
+        pytest.param(MESSAGE_FROM_REPOSITORY, id="test_non_record_message"),
+    ],
+)
+def test_airbyte_message_to_string_is_the_same_as_pydantic_serialization(message):
+    assert AirbyteEntrypoint.airbyte_message_to_string(message) == message.json(exclude_unset=True)
+
+
+BENCHMARK_RECORD_DATA = {"id": 1, "name": "airbyte", "updated_at": "2023-01-01T00:00:00Z", "nested": {"values": list(range(10)), "text": "a" * 100}}
+
+
+def test_record_serialization_benchmark_serializes_the_same_records():
+    message = stream_data_to_airbyte_message("stream", BENCHMARK_RECORD_DATA)
+
+    assert AirbyteEntrypoint.airbyte_message_to_string(message) == message.json(exclude_unset=True)
+
+
+@pytest.mark.skipif(not os.environ.get("AIRBYTE_RUN_BENCHMARKS"), reason="benchmarks only run when AIRBYTE_RUN_BENCHMARKS is set")
+def test_record_serialization_benchmark():
+    """Logs the records per second serialized by going through pydantic and by the entrypoint"""
+    number_of_records = 5000
+
+    def _pydantic_path():
+        message = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data=BENCHMARK_RECORD_DATA, emitted_at=1))
+        return message.json(exclude_unset=True)
+
+    def _entrypoint_path():
+        return AirbyteEntrypoint.airbyte_message_to_string(stream_data_to_airbyte_message("stream", BENCHMARK_RECORD_DATA))
+
+    records_per_second = {}
+    for name, serialize in [("pydantic", _pydantic_path), ("entrypoint", _entrypoint_path)]:
+        start = time.perf_counter()
+        for _ in range(number_of_records):
+            serialize()
+        records_per_second[name] = number_of_records / (time.perf_counter() - start)
+    logging.getLogger("airbyte").info(f"Serialized records per second: {records_per_second}")
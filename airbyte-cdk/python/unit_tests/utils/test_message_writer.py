@@ -0,0 +1,109 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import logging
+import sys
+import time
+
+import pytest
+from airbyte_cdk.utils.message_writer import BufferedMessageWriter, redirect_stdout_log_handlers
+from freezegun import freeze_time
+
+RECORD = '{"type": "RECORD", "record": {"stream": "stream", "data": {"id": 1}, "emitted_at": 1}}'
+STATE = '{"type": "STATE", "state": {"data": {"stream": {"cursor": 1}}}}'
+
+
+def test_messages_are_buffered_until_the_buffer_is_full():
+    output = io.StringIO()
+    writer = BufferedMessageWriter(output, max_buffer_size=3 * (len(RECORD) + 1))
+
+    writer.write(RECORD)
+    writer.write(RECORD)
+    assert output.getvalue() == ""
+    assert writer.messages_written == 0
+
+    writer.write(RECORD)
+    assert output.getvalue() == f"{RECORD}\n" * 3
+    assert writer.messages_written == 3
+    assert writer.bytes_written == 3 * (len(RECORD) + 1)
+
+
+def test_state_message_flushes_the_buffer():
+    output = io.StringIO()
+    writer = BufferedMessageWriter(output)
+
+    writer.write(RECORD)
+    writer.write(STATE)
+
+    assert output.getvalue() == f"{RECORD}\n{STATE}\n"
+    assert writer.messages_written == 2
+
+
+def test_buffer_is_flushed_by_the_first_write_after_max_age():
+    output = io.StringIO()
+    writer = BufferedMessageWriter(output, max_buffer_age_seconds=10)
+
+    with freeze_time("2023-01-01 00:00:00") as frozen_time:
+        writer.write(RECORD)
+        frozen_time.tick(5)
+        writer.write(RECORD)
+        assert output.getvalue() == ""
+        frozen_time.tick(5)
+        writer.write(RECORD)
+
+    assert output.getvalue() == f"{RECORD}\n" * 3
+
+
+@pytest.mark.parametrize("max_buffer_size", [pytest.param(0, id="test_buffering_disabled"), pytest.param(1, id="test_small_buffer")])
+def test_small_buffer_writes_every_message(max_buffer_size):
+    output = io.StringIO()
+    writer = BufferedMessageWriter(output, max_buffer_size=max_buffer_size)
+
+    writer.write(RECORD)
+
+    assert output.getvalue() == f"{RECORD}\n"
+
+
+def test_exiting_the_writer_flushes_the_buffer_on_error():
+    output = io.StringIO()
+
+    with pytest.raises(ValueError):
+        with BufferedMessageWriter(output) as writer:
+            writer.write(RECORD)
+            raise ValueError("error while reading")
+
+    assert output.getvalue() == f"{RECORD}\n"
+    assert writer.messages_written == 1
+
+
+def test_buffer_is_flushed_after_max_age_without_a_next_write():
+    output = io.StringIO()
+    writer = BufferedMessageWriter(output, max_buffer_age_seconds=0.05)
+
+    writer.write(RECORD)
+    assert output.getvalue() == ""
+    time.sleep(0.5)
+
+    assert output.getvalue() == f"{RECORD}\n"
+    writer.close()
+
+
+def test_log_lines_are_written_after_the_buffered_messages(mocker):
+    output = io.StringIO()
+    mocker.patch("sys.stdout", output)
+    logger = logging.getLogger("airbyte.test_message_writer")
+    handler = logging.StreamHandler(sys.stdout)
+    logger.addHandler(handler)
+
+    try:
+        with BufferedMessageWriter(output) as writer, redirect_stdout_log_handlers(writer):
+            writer.write(RECORD)
+            logger.warning("log line")
+            writer.write(RECORD)
+    finally:
+        logger.removeHandler(handler)
+
+    assert output.getvalue() == f"{RECORD}\nlog line\n{RECORD}\n"
+    assert handler.stream is output
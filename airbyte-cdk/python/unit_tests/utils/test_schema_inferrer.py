@@ -6,7 +6,7 @@ from typing import List, Mapping
 
 import pytest
 from airbyte_cdk.models.airbyte_protocol import AirbyteRecordMessage
-from airbyte_cdk.utils.schema_inferrer import SchemaInferrer
+from airbyte_cdk.utils.schema_inferrer import NoRequiredSchemaBuilder, SchemaInferrer
 
 NOW = 1234567
 
@@ -200,3 +200,67 @@ def test_get_individual_schema():
         "properties": {"field_A": {"type": "number"}},
     }
     assert inferrer.get_stream_schema("another_stream") is None
+
+
+def test_schema_is_the_one_of_genson():
+    records = [
+        {"id": 1, "tags": ["a", 1, None], "nested": {"list": [{"a": 1}, [1], "b"], "flag": True}, "mixed": {"a": 1}},
+        {"id": None, "tags": [], "nested": None, "mixed": [1, {"a": "b"}], "empty": {}},
+        {"id": 2.5, "mixed": "string", "nullable": None, "empty": {"a": None}},
+    ]
+    inferrer = SchemaInferrer()
+    builder = NoRequiredSchemaBuilder()
+    for record in records:
+        inferrer.accumulate(AirbyteRecordMessage(stream="my_stream", data=record, emitted_at=NOW))
+        builder.add_object(record)
+
+    assert inferrer.get_stream_schema("my_stream") == inferrer._clean(builder.to_schema())
+
+
+def test_only_the_first_records_of_a_stream_are_sampled():
+    inferrer = SchemaInferrer(max_records_per_stream=1)
+    inferrer.accumulate(AirbyteRecordMessage(stream="my_stream", data={"field_A": 1}, emitted_at=NOW))
+    inferrer.accumulate(AirbyteRecordMessage(stream="my_stream", data={"field_A": "abc", "field_B": 1}, emitted_at=NOW))
+    inferrer.accumulate(AirbyteRecordMessage(stream="my_stream2", data={"field_A": "abc"}, emitted_at=NOW))
+
+    assert inferrer.get_stream_schema("my_stream")["properties"] == {"field_A": {"type": "number"}}
+    assert inferrer.get_stream_schema("my_stream2")["properties"] == {"field_A": {"type": "string"}}
+
+
+def test_properties_and_depth_are_bounded():
+    inferrer = SchemaInferrer(max_properties=2, max_depth=2)
+    inferrer.accumulate(
+        AirbyteRecordMessage(stream="my_stream", data={"field_A": 1, "field_B": {"nested": {"deep": 1}, "list": [[1]]}, "field_C": 1}, emitted_at=NOW)
+    )
+    inferrer.accumulate(AirbyteRecordMessage(stream="my_stream", data={"field_A": "abc", "field_C": 1}, emitted_at=NOW))
+
+    assert inferrer.get_stream_schema("my_stream")["properties"] == {
+        "field_A": {"type": ["number", "string"]},
+        "field_B": {"type": "object", "properties": {"nested": {"type": "object"}, "list": {"type": "array"}}},
+    }
+
+
+def test_merge_partial_schemas():
+    inferrer = SchemaInferrer()
+    inferrer.accumulate(AirbyteRecordMessage(stream="my_stream", data={"field_A": 1, "obj": {"a": 1}}, emitted_at=NOW))
+    other_inferrer = SchemaInferrer()
+    other_inferrer.accumulate(AirbyteRecordMessage(stream="my_stream", data={"field_A": None, "obj": {"b": "c"}}, emitted_at=NOW))
+    other_inferrer.accumulate(AirbyteRecordMessage(stream="my_stream2", data={"field_A": "abc"}, emitted_at=NOW))
+
+    inferrer.merge(other_inferrer)
+
+    assert inferrer.get_inferred_schemas() == {
+        "my_stream": {
+            "$schema": "http://json-schema.org/schema#",
+            "type": "object",
+            "properties": {
+                "field_A": {"type": ["null", "number"]},
+                "obj": {"type": "object", "properties": {"a": {"type": "number"}, "b": {"type": "string"}}},
+            },
+        },
+        "my_stream2": {
+            "$schema": "http://json-schema.org/schema#",
+            "type": "object",
+            "properties": {"field_A": {"type": "string"}},
+        },
+    }
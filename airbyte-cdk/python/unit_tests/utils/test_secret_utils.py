@@ -2,8 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import logging
+
 import pytest
-from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets, get_secret_paths, get_secrets, update_secrets
+from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets, get_filtering_overhead, get_secret_paths, get_secrets, update_secrets
 
 SECRET_STRING_KEY = "secret_key1"
 SECRET_STRING_VALUE = "secret_value"
@@ -121,3 +123,43 @@ def test_secret_filtering():
     update_secrets([SECRET_STRING_VALUE, SECRET_STRING_2_VALUE])
     filtered = filter_secrets(sensitive_str)
     assert filtered == f"**** {NOT_SECRET_VALUE} **** ****"
+
+
+@pytest.mark.parametrize("secrets", [["x", "xk"], ["xk", "x"]])
+def test_secret_containing_another_secret_is_filtered_entirely(secrets):
+    update_secrets(secrets)
+    assert filter_secrets("xk x xkk") == "**** **** ****k"
+
+
+@pytest.mark.parametrize(
+    "secrets, string, expected_string",
+    [
+        pytest.param(["abc", "bcd"], "xabcdx", "x****x", id="test_overlapping_secrets"),
+        pytest.param(["bcd", "abc"], "xabcdx abc", "x****x ****", id="test_overlapping_secrets_in_another_order"),
+        pytest.param(["aba"], "ababa", "****", id="test_overlapping_occurrences_of_a_secret"),
+        pytest.param(["abc", "bcd"], "abcbcd", "********", id="test_adjacent_secrets"),
+        pytest.param(["abc", "bcd", "**d"], "abcd bcd", "**** ****", id="test_filtered_string_is_not_filtered_again"),
+    ],
+)
+def test_union_of_the_occurrences_of_the_secrets_is_filtered(secrets, string, expected_string):
+    update_secrets(secrets)
+    assert filter_secrets(string) == expected_string
+
+
+def test_filtering_overhead_is_reset_when_secrets_are_updated(caplog):
+    caplog.set_level(logging.DEBUG, logger="airbyte")
+    update_secrets([SECRET_STRING_VALUE])
+    filter_secrets(SECRET_STRING_VALUE)
+    filter_secrets(NOT_SECRET_VALUE)
+    assert get_filtering_overhead()[0] == 2
+
+    update_secrets([SECRET_STRING_VALUE])
+    assert get_filtering_overhead() == (0, 0.0)
+
+
+def test_filtering_overhead_is_only_measured_in_debug_mode(caplog):
+    caplog.set_level(logging.INFO, logger="airbyte")
+    update_secrets([SECRET_STRING_VALUE])
+
+    assert filter_secrets(SECRET_STRING_VALUE) == "****"
+    assert get_filtering_overhead() == (0, 0.0)
@@ -0,0 +1,69 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+
+import pytest
+from airbyte_cdk.utils.stream_profiler import HTTP_WAIT, RECORD_EXTRACTION, RESPONSE_DECODE, UNATTRIBUTED, StreamProfiler
+
+
+@pytest.fixture
+def profiler():
+    profiler = StreamProfiler()
+    profiler.enable()
+    return profiler
+
+
+def test_nested_stages_are_not_counted_twice(profiler):
+    with profiler.profile_stream("users"):
+        with profiler.stage(RECORD_EXTRACTION):
+            with profiler.stage(RESPONSE_DECODE):
+                time.sleep(0.02)
+
+    report = profiler.report()["streams"]["users"]
+    assert report["stages_seconds"][RESPONSE_DECODE] >= 0.02
+    assert report["stages_seconds"][RECORD_EXTRACTION] < 0.02
+    assert report["duration_seconds"] >= 0.02
+
+
+def test_requests_and_records_are_counted_per_stream(profiler):
+    with profiler.profile_stream("users"):
+        profiler.count_request(100)
+        profiler.count_request(50)
+        profiler.count_records(3)
+    profiler.count_records(2, stream="orders")
+
+    report = profiler.report()["streams"]
+    assert (report["users"]["requests"], report["users"]["bytes"], report["users"]["records"]) == (2, 150, 3)
+    assert report["users"]["records_per_second"] > 0
+    assert report["orders"]["records"] == 2
+
+
+def test_stages_of_other_threads_are_attributed_to_their_stream(profiler):
+    def read_in_thread():
+        with profiler.track_stream("orders"):
+            with profiler.stage(HTTP_WAIT):
+                pass
+        with profiler.stage(HTTP_WAIT):
+            pass
+
+    with profiler.profile_stream("users"):
+        thread = threading.Thread(target=read_in_thread)
+        thread.start()
+        thread.join()
+
+    report = profiler.report()["streams"]
+    assert set(report) == {"users", "orders", UNATTRIBUTED}
+    assert report["users"]["stages_seconds"][HTTP_WAIT] == 0
+
+
+def test_nothing_is_measured_when_disabled():
+    profiler = StreamProfiler()
+
+    with profiler.profile_stream("users"):
+        with profiler.stage(HTTP_WAIT):
+            profiler.count_request(100)
+
+    assert profiler.report() == {"streams": {}}